@@ -0,0 +1,224 @@
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+
+from assistente import normalizar_mensagem
+from cache import CacheLRU
+
+# ==============================
+# Busca de produtos afiliados
+# ==============================
+# Cada plataforma é um provedor com o seu próprio pool de conexões e limite
+# de requisições por segundo. O BuscadorProdutos consulta todos os países e
+# plataformas selecionados em paralelo e guarda os resultados em cache por
+# (palavra-chave, país, plataforma).
+
+FIXTURES_AFILIADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "afiliados.json")
+
+PAISES = ["Portugal", "Espanha", "França", "Alemanha", "Itália"]
+PLATAFORMAS = ["Amazon EU", "AliExpress EU", "Awin", "CJ Affiliate"]
+
+VALIDADE_CACHE_BUSCA = 15 * 60  # segundos
+
+
+@dataclass(slots=True)
+class Produto:
+    id: str
+    nome: str
+    preco: float
+    comissao: float
+    pais: str
+    plataforma: str
+    link: str = ""
+
+    def para_dict(self):
+        return asdict(self)
+
+
+def formatar_euros(valor):
+    return f"€{valor:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+
+
+# ==============================
+# Limite de requisições (token bucket)
+# ==============================
+class LimiteTaxa:
+    """Permite até `por_segundo` requisições por segundo, com rajadas de até `rajada`."""
+
+    def __init__(self, por_segundo, rajada=None):
+        self.por_segundo = por_segundo
+        self.rajada = rajada or max(1, int(por_segundo))
+        self._fichas = float(self.rajada)
+        self._ultimo = time.monotonic()
+        self._trava = threading.Lock()
+
+    def aguardar(self):
+        while True:
+            with self._trava:
+                agora = time.monotonic()
+                self._fichas = min(self.rajada, self._fichas + (agora - self._ultimo) * self.por_segundo)
+                self._ultimo = agora
+                if self._fichas >= 1:
+                    self._fichas -= 1
+                    return
+                espera = (1 - self._fichas) / self.por_segundo
+            time.sleep(espera)
+
+
+# ==============================
+# Provedores
+# ==============================
+class ProvedorAfiliados:
+    """
+    Base dos provedores. Subclasses implementam _abrir_conexao() e _consultar().
+    As conexões são reaproveitadas entre buscas (pool de até `max_conexoes`).
+    """
+
+    nome = ""
+    max_conexoes = 4
+    requisicoes_por_segundo = 5
+    rajada_requisicoes = 5
+
+    def __init__(self):
+        self._limite = LimiteTaxa(self.requisicoes_por_segundo, self.rajada_requisicoes)
+        self._livres = queue.LifoQueue()
+        self._vagas = threading.BoundedSemaphore(self.max_conexoes)
+
+    def _abrir_conexao(self):
+        raise NotImplementedError
+
+    def _consultar(self, conexao, palavra_chave, pais):
+        raise NotImplementedError
+
+    def buscar(self, palavra_chave, pais):
+        self._limite.aguardar()
+        with self._vagas:
+            try:
+                conexao = self._livres.get_nowait()
+            except queue.Empty:
+                conexao = self._abrir_conexao()
+            try:
+                return self._consultar(conexao, palavra_chave, pais)
+            finally:
+                self._livres.put(conexao)
+
+
+class _ConexaoFixture:
+    """Conexão simulada: só conta quantas requisições passaram por ela."""
+
+    def __init__(self):
+        self.requisicoes = 0
+
+
+class ProvedorFixture(ProvedorAfiliados):
+    """
+    Provedor local, sem rede, baseado em fixtures/afiliados.json.
+    `latencia` simula o tempo de resposta da API real.
+    """
+
+    def __init__(self, latencia=0.0, caminho_fixtures=FIXTURES_AFILIADOS):
+        super().__init__()
+        self.latencia = latencia
+        with open(caminho_fixtures, "r", encoding="utf-8") as f:
+            fixtures = json.load(f)
+        self._modelos = fixtures[self.nome]
+        self._fator_pais = fixtures["fator_preco_por_pais"]
+        self.conexoes_abertas = 0
+
+    def _abrir_conexao(self):
+        self.conexoes_abertas += 1
+        return _ConexaoFixture()
+
+    def _consultar(self, conexao, palavra_chave, pais):
+        conexao.requisicoes += 1
+        if self.latencia:
+            time.sleep(self.latencia)
+        fator = self._fator_pais.get(pais, 1.0)
+        produtos = []
+        for modelo in self._modelos:
+            nome = f"{palavra_chave.strip().title()} {modelo['sufixo']}"
+            preco = round(modelo["preco"] * fator, 2)
+            id_produto = hashlib.sha1(f"{self.nome}|{pais}|{nome}".encode("utf-8")).hexdigest()[:12]
+            produtos.append(Produto(
+                id=id_produto,
+                nome=nome,
+                preco=preco,
+                comissao=round(preco * modelo["comissao_pct"] / 100, 2),
+                pais=pais,
+                plataforma=self.nome,
+                link=f"https://afiliado.exemplo/{id_produto}",
+            ))
+        return produtos
+
+
+class ProvedorAmazonEU(ProvedorFixture):
+    nome = "Amazon EU"
+    requisicoes_por_segundo = 1
+    max_conexoes = 2
+
+
+class ProvedorAliExpressEU(ProvedorFixture):
+    nome = "AliExpress EU"
+    requisicoes_por_segundo = 5
+
+
+class ProvedorAwin(ProvedorFixture):
+    nome = "Awin"
+    requisicoes_por_segundo = 10
+
+
+class ProvedorCJ(ProvedorFixture):
+    nome = "CJ Affiliate"
+    requisicoes_por_segundo = 10
+
+
+def criar_provedores(latencia=0.0):
+    """Provedores padrão (locais) indexados pelo nome da plataforma."""
+    classes = (ProvedorAmazonEU, ProvedorAliExpressEU, ProvedorAwin, ProvedorCJ)
+    return {classe.nome: classe(latencia=latencia) for classe in classes}
+
+
+# ==============================
+# Buscador
+# ==============================
+class BuscadorProdutos:
+    """Consulta vários países e plataformas em paralelo, com cache por consulta."""
+
+    def __init__(self, provedores, cache=None, max_trabalhadores=8):
+        self.provedores = provedores
+        self.cache = cache if cache is not None else CacheLRU(capacidade=1000, ttl=VALIDADE_CACHE_BUSCA)
+        self._executor = ThreadPoolExecutor(max_workers=max_trabalhadores, thread_name_prefix="afiliados")
+
+    def _buscar_um(self, palavra_chave, pais, plataforma):
+        chave = (normalizar_mensagem(palavra_chave), pais, plataforma)
+        produtos = self.cache.obter(chave)
+        if produtos is None:
+            produtos = self.provedores[plataforma].buscar(palavra_chave, pais)
+            self.cache.guardar(chave, produtos)
+        return produtos
+
+    def buscar(self, palavra_chave, paises, plataformas):
+        """
+        Retorna (produtos, erros). Uma plataforma com falha não impede as demais;
+        o erro vem em `erros` como (país, plataforma, mensagem).
+        """
+        tarefas = {
+            (pais, plataforma): self._executor.submit(self._buscar_um, palavra_chave, pais, plataforma)
+            for pais in paises
+            for plataforma in plataformas
+        }
+        produtos, erros = [], []
+        for (pais, plataforma), tarefa in tarefas.items():
+            try:
+                produtos.extend(tarefa.result())
+            except Exception as erro:
+                erros.append((pais, plataforma, str(erro)))
+        return produtos, erros
+
+    def encerrar(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
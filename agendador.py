@@ -0,0 +1,351 @@
+"""
+Executor das postagens agendadas (processo separado do Streamlit).
+
+Uso:
+    python agendador.py --banco agendamentos_postagens.db
+"""
+import argparse
+import hashlib
+import heapq
+import itertools
+import random
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+from armazenamento import ArmazemExecucoes, ArmazemPostagens
+from segredos import ResolvedorCredenciais, provedores_padrao
+
+# ==============================
+# Agendador de postagens
+# ==============================
+# Cada horário de cada agendamento é um disparo diário. Os próximos disparos
+# ficam num heap ordenado pelo instante de execução: o processo dorme até o
+# primeiro deles (ou até a próxima sincronização com o banco), em vez de
+# percorrer todos os agendamentos a cada minuto. Cada disparo tem uma chave
+# de idempotência registrada em `execucoes_postagem`, com novas tentativas
+# em backoff exponencial que sobrevivem a um reinício.
+
+PLATAFORMAS_POSTAGEM = ["Instagram", "TikTok", "Facebook", "Shopify Blog"]
+
+MAXIMO_TENTATIVAS = 5
+ESPERA_INICIAL = 30         # segundos até a 2ª tentativa; dobra a cada falha
+ESPERA_MAXIMA = 60 * 60
+TOLERANCIA_ATRASO = 15 * 60  # disparos perdidos há menos que isso ainda são executados
+INTERVALO_SINCRONIZACAO = 30
+MAXIMO_PUBLICACOES_SIMULTANEAS = 8
+
+
+def proximo_disparo(horario, depois_de):
+    """Primeiro instante (timestamp) >= `depois_de` em que acontece `horario` ("HH:MM", hora local)."""
+    hora, minuto = map(int, horario.split(":"))
+    alvo = datetime.fromtimestamp(depois_de).replace(hour=hora, minute=minuto, second=0, microsecond=0)
+    if alvo.timestamp() < depois_de:
+        alvo += timedelta(days=1)
+    return alvo.timestamp()
+
+
+@lru_cache(maxsize=4096)
+def _rotulo_disparo(momento):
+    return datetime.fromtimestamp(momento).strftime("%Y-%m-%dT%H:%M")
+
+
+def chave_disparo(agendamento_id, momento):
+    """Chave de idempotência: o mesmo agendamento no mesmo dia e horário."""
+    return f"{agendamento_id}@{_rotulo_disparo(momento)}"
+
+
+# ==============================
+# Publicadores
+# ==============================
+class PublicadorPostagens:
+    """
+    Interface dos publicadores: publicar() devolve o id da postagem na
+    plataforma. A chave de idempotência deve ser repassada à API, para que um
+    disparo repetido (ex.: queda no meio da publicação) não gere postagem dupla.
+    """
+
+    plataforma = ""
+
+    def publicar(self, agendamento, momento, chave_idempotencia):
+        raise NotImplementedError
+
+
+class PublicadorLocal(PublicadorPostagens):
+    """
+    Publicador simulado, sem rede, para testes e benchmarks. `latencia` simula
+    o tempo da API e `taxa_falha` a fração de chamadas que falham. Com
+    `credenciais` (um ResolvedorCredenciais), cada publicação exige a senha
+    da plataforma, como faria uma API real.
+    """
+
+    def __init__(self, plataforma, latencia=0.0, taxa_falha=0.0, semente=None, credenciais=None):
+        self.plataforma = plataforma
+        self.latencia = latencia
+        self.taxa_falha = taxa_falha
+        self.credenciais = credenciais
+        self.publicados = {}  # chave de idempotência -> id da postagem
+        self._sorteio = random.Random(semente)
+        self._trava = threading.Lock()
+
+    def publicar(self, agendamento, momento, chave_idempotencia):
+        with self._trava:
+            existente = self.publicados.get(chave_idempotencia)
+            if existente is not None:
+                return existente
+            falhar = self._sorteio.random() < self.taxa_falha
+        # Vem do cache do resolvedor: sem ambiente nem disco a cada publicação
+        if self.credenciais is not None and self.credenciais.obter(self.plataforma) is None:
+            raise PermissionError(f"Senha de {self.plataforma} não configurada")
+        if self.latencia:
+            time.sleep(self.latencia)
+        if falhar:
+            raise ConnectionError(f"{self.plataforma} indisponível (simulado)")
+        id_postagem = hashlib.sha1(chave_idempotencia.encode("utf-8")).hexdigest()[:12]
+        with self._trava:
+            self.publicados[chave_idempotencia] = id_postagem
+        return id_postagem
+
+
+def criar_publicadores(latencia=0.0, taxa_falha=0.0, credenciais=None):
+    """Publicadores padrão (locais) indexados pelo nome da plataforma."""
+    return {
+        plataforma: PublicadorLocal(plataforma, latencia, taxa_falha, credenciais=credenciais)
+        for plataforma in PLATAFORMAS_POSTAGEM
+    }
+
+
+# ==============================
+# Agendador
+# ==============================
+class AgendadorPostagens:
+    """
+    Mantém os próximos disparos num heap e publica os vencidos num pool de
+    threads. Novos agendamentos são lidos do banco a cada
+    `intervalo_sincronizacao` segundos, só os gravados desde a última leitura
+    (pelo rowid, que também avança quando um agendamento é regravado). Se a
+    tabela foi regravada por salvar() ou perdeu linhas, tudo é relido.
+    """
+
+    def __init__(self, armazem, execucoes, publicadores, max_trabalhadores=MAXIMO_PUBLICACOES_SIMULTANEAS,
+                 intervalo_sincronizacao=INTERVALO_SINCRONIZACAO, relogio=time.time):
+        self.armazem = armazem
+        self.execucoes = execucoes
+        self.publicadores = publicadores
+        self.intervalo_sincronizacao = intervalo_sincronizacao
+        self._relogio = relogio
+        self._fila = []  # heap de (momento, sequência, chave, id do agendamento, horário ou None se for nova tentativa)
+        self._sequencia = itertools.count()
+        self._condicao = threading.Condition()
+        self._agendamentos = {}
+        self._em_andamento = set()
+        self._marca = 0  # maior rowid já lido do banco...
+        self._id_marca = None  # ...e o agendamento que estava nele
+        self._regravacoes = None  # ArmazemPostagens.regravacoes() na última leitura
+        self._parar = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=max_trabalhadores, thread_name_prefix="publicador")
+        self.publicados = 0
+        self.falhas = 0
+
+    def __len__(self):
+        return len(self._fila)
+
+    def _empilhar(self, momento, chave, agendamento_id, horario=None):
+        with self._condicao:
+            heapq.heappush(self._fila, (momento, next(self._sequencia), chave, agendamento_id, horario))
+            self._condicao.notify()
+
+    def sincronizar(self):
+        """
+        Empilha o próximo disparo de cada horário dos agendamentos novos e dos
+        horários acrescentados aos regravados. Retorna quantos eram novos.
+        """
+        agora = self._relogio()
+        novos = 0
+        disparos = []
+        proximos = {}  # (horário, início) -> momento; quase todos os agendamentos repetem os mesmos pares
+        regravacoes = self.armazem.regravacoes()
+        completa = regravacoes != self._regravacoes
+        lidos = None
+        if not completa:
+            # A linha da marca vem junto, para conferir que continua lá
+            lidos = self.armazem.gravados_desde(self._marca - 1)
+            completa = self._perdeu_linhas(lidos)
+        if completa:
+            lidos = self.armazem.gravados_desde(0)
+            # O que não mudou é ignorado abaixo; os apagados saem, e seus disparos
+            # são descartados ao vencer
+            presentes = {agendamento.id for _, agendamento in lidos}
+            for agendamento_id in self._agendamentos.keys() - presentes:
+                del self._agendamentos[agendamento_id]
+            self._marca, self._id_marca = 0, None
+        self._regravacoes = regravacoes
+        if lidos:
+            self._marca, self._id_marca = lidos[-1][0], lidos[-1][1].id
+        pendentes = None
+        for rowid, agendamento in lidos:
+            anterior = self._agendamentos.get(agendamento.id)
+            if anterior == agendamento:
+                continue
+            self._agendamentos[agendamento.id] = agendamento
+            if anterior is None:
+                novos += 1
+                horarios = agendamento.horarios
+            else:
+                # Horários removidos saem do heap em _retirar_vencidos
+                horarios = [h for h in agendamento.horarios if h not in anterior.horarios]
+            criado_em = datetime.fromisoformat(agendamento.data_criacao).timestamp()
+            inicio = max(agora - TOLERANCIA_ATRASO, criado_em)
+            if horarios and pendentes is None:
+                # Disparos com nova tentativa pendente já estão no heap (retomar), no horário do backoff
+                pendentes = {chave for chave, _, _ in self.execucoes.pendentes()}
+            for horario in horarios:
+                momento = proximos.get((horario, inicio))
+                if momento is None:
+                    momento = proximos[(horario, inicio)] = proximo_disparo(horario, inicio)
+                chave = chave_disparo(agendamento.id, momento)
+                if chave in pendentes:
+                    # A recorrência continua a partir do disparo seguinte
+                    momento = proximo_disparo(horario, momento + 60)
+                    chave = chave_disparo(agendamento.id, momento)
+                disparos.append((momento, next(self._sequencia), chave, agendamento.id, horario))
+        with self._condicao:
+            if len(disparos) > len(self._fila):
+                # Carga inicial (ou grande): heapify em O(n) em vez de n inserções
+                self._fila.extend(disparos)
+                heapq.heapify(self._fila)
+            else:
+                for disparo in disparos:
+                    heapq.heappush(self._fila, disparo)
+            self._condicao.notify()
+        return novos
+
+    def _perdeu_linhas(self, lidos):
+        """
+        Se linhas foram apagadas fora de salvar() desde a última leitura: a
+        leitura pelo rowid deixaria de ver os apagados e, se a linha da marca
+        saiu, os gravados depois com rowids reaproveitados abaixo dela.
+        """
+        ids = {agendamento.id for _, agendamento in lidos}
+        if self._marca and self._id_marca not in ids:
+            # Nem na marca nem regravado acima dela
+            return True
+        return self.armazem.contar() != len(self._agendamentos) + len(ids - self._agendamentos.keys())
+
+    def retomar(self):
+        """Reempilha as novas tentativas que estavam pendentes quando o processo parou."""
+        pendentes = self.execucoes.pendentes()
+        for chave, agendamento_id, proxima_tentativa in pendentes:
+            self._empilhar(proxima_tentativa or self._relogio(), chave, agendamento_id)
+        return len(pendentes)
+
+    def _retirar_vencidos(self, agora):
+        vencidos = []
+        with self._condicao:
+            while self._fila and self._fila[0][0] <= agora:
+                momento, _, chave, agendamento_id, horario = heapq.heappop(self._fila)
+                if horario is not None:
+                    agendamento = self._agendamentos.get(agendamento_id)
+                    if agendamento is None or horario not in agendamento.horarios:
+                        continue  # horário removido quando o agendamento foi regravado
+                    # Recorrência diária: o próximo disparo entra no heap já agora
+                    proximo = proximo_disparo(horario, momento + 60)
+                    self._empilhar(proximo, chave_disparo(agendamento_id, proximo), agendamento_id, horario)
+                if chave in self._em_andamento:
+                    continue
+                self._em_andamento.add(chave)
+                vencidos.append((momento, chave, agendamento_id))
+        return vencidos
+
+    def _disparar(self, momento, chave, agendamento_id):
+        try:
+            self._publicar(momento, chave, agendamento_id)
+        finally:
+            with self._condicao:
+                self._em_andamento.discard(chave)
+
+    def _publicar(self, momento, chave, agendamento_id):
+        agendamento = self._agendamentos.get(agendamento_id)
+        status, tentativas = self.execucoes.estado(chave)
+        if agendamento is None or status in ("publicado", "falhou"):
+            return
+        # O horário agendado, que está na chave; `momento` é o da nova tentativa, se for uma
+        disparo = chave.rpartition("@")[2]
+        try:
+            publicador = self.publicadores.get(agendamento.plataforma)
+            if publicador is None:
+                raise LookupError(f"Nenhum publicador para {agendamento.plataforma}")
+            id_postagem = publicador.publicar(agendamento, momento, chave)
+        except Exception as erro:
+            tentativas += 1
+            if tentativas >= MAXIMO_TENTATIVAS:
+                self.execucoes.registrar(chave, agendamento_id, disparo, "falhou", tentativas, None, str(erro))
+                self.falhas += 1
+                return
+            espera = min(ESPERA_MAXIMA, ESPERA_INICIAL * 2 ** (tentativas - 1))
+            # Variação aleatória para as novas tentativas não chegarem todas juntas
+            proxima = self._relogio() + espera * random.uniform(0.8, 1.2)
+            self.execucoes.registrar(chave, agendamento_id, disparo, "pendente", tentativas, proxima, str(erro))
+            self._empilhar(proxima, chave, agendamento_id)
+        else:
+            self.execucoes.registrar(chave, agendamento_id, disparo, "publicado", tentativas + 1, None, id_postagem)
+            self.publicados += 1
+
+    def executar(self):
+        """Laço principal; roda até parar() ser chamado."""
+        self.retomar()
+        self.sincronizar()
+        proxima_sincronizacao = self._relogio() + self.intervalo_sincronizacao
+        while not self._parar.is_set():
+            agora = self._relogio()
+            if agora >= proxima_sincronizacao:
+                self.sincronizar()
+                proxima_sincronizacao = agora + self.intervalo_sincronizacao
+            for momento, chave, agendamento_id in self._retirar_vencidos(agora):
+                self._executor.submit(self._disparar, momento, chave, agendamento_id)
+            with self._condicao:
+                espera = proxima_sincronizacao - agora
+                if self._fila:
+                    espera = min(espera, self._fila[0][0] - agora)
+                if espera > 0 and not self._parar.is_set():
+                    self._condicao.wait(espera)
+
+    def parar(self, aguardar=True):
+        self._parar.set()
+        with self._condicao:
+            self._condicao.notify()
+        self._executor.shutdown(wait=aguardar)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--banco", default="agendamentos_postagens.db")
+    parser.add_argument("--intervalo", type=float, default=INTERVALO_SINCRONIZACAO,
+                        help="segundos entre leituras de agendamentos novos")
+    parser.add_argument("--exigir-credenciais", action="store_true",
+                        help="só publica se a senha da plataforma estiver configurada (ver segredos.py)")
+    args = parser.parse_args()
+
+    credenciais = ResolvedorCredenciais(provedores_padrao()) if args.exigir_credenciais else None
+    agendador = AgendadorPostagens(
+        ArmazemPostagens(args.banco),
+        ArmazemExecucoes(args.banco),
+        criar_publicadores(credenciais=credenciais),
+        intervalo_sincronizacao=args.intervalo,
+    )
+    signal.signal(signal.SIGTERM, lambda *_: agendador.parar(aguardar=False))
+    print(f"Agendador iniciado ({args.banco}). Ctrl+C para encerrar.")
+    try:
+        agendador.executar()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        agendador.parar()
+        print(f"Encerrado: {agendador.publicados} publicadas, {agendador.falhas} com falha.")
+
+
+if __name__ == "__main__":
+    main()
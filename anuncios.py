@@ -0,0 +1,192 @@
+import csv
+import io
+import json
+import string
+from dataclasses import asdict, dataclass, fields
+
+from afiliados import formatar_euros
+
+# ==============================
+# Geração de anúncios em lote
+# ==============================
+# Um modelo por idioma, validado e preparado uma única vez. Gerar anúncios
+# para milhares de produtos é só preencher os modelos, sem reruns do
+# Streamlit. Cada anúncio é identificado pelo id do produto e pelo idioma,
+# então continua válido quando uma nova busca muda a ordem da lista.
+
+IDIOMA_POR_PAIS = {
+    "Portugal": "pt",
+    "Espanha": "es",
+    "França": "fr",
+    "Alemanha": "de",
+    "Itália": "it",
+}
+IDIOMAS = {"pt": "Português", "es": "Español", "fr": "Français", "de": "Deutsch", "it": "Italiano"}
+
+# Nome de cada país no idioma do anúncio
+NOMES_PAIS = {
+    "pt": {"Portugal": "Portugal", "Espanha": "Espanha", "França": "França", "Alemanha": "Alemanha", "Itália": "Itália"},
+    "es": {"Portugal": "Portugal", "Espanha": "España", "França": "Francia", "Alemanha": "Alemania", "Itália": "Italia"},
+    "fr": {"Portugal": "Portugal", "Espanha": "Espagne", "França": "France", "Alemanha": "Allemagne", "Itália": "Italie"},
+    "de": {"Portugal": "Portugal", "Espanha": "Spanien", "França": "Frankreich", "Alemanha": "Deutschland", "Itália": "Italien"},
+    "it": {"Portugal": "Portogallo", "Espanha": "Spagna", "França": "Francia", "Alemanha": "Germania", "Itália": "Italia"},
+}
+
+# Hashtag do país, também no idioma do anúncio (ex.: #deutschland)
+HASHTAGS_PAIS = {
+    idioma: {pais: nome.replace(" ", "").lower() for pais, nome in nomes.items()}
+    for idioma, nomes in NOMES_PAIS.items()
+}
+
+LINK_PADRAO = "[LINK DE AFILIADO AQUI]"
+
+MODELOS = {
+    "pt": (
+        "🔥 **Oferta imperdível!**\n\n"
+        "Acabei de encontrar este **{nome}** por apenas **{preco}**!\n\n"
+        "✅ Frete rápido para {pais}\n"
+        "✅ Garantia de satisfação\n"
+        "✅ Comissão justa para quem indica 😊\n\n"
+        "👉 **Clique no link abaixo para garantir o seu!**\n"
+        "{link}\n\n"
+        "#afiliado #{hashtag_pais}"
+    ),
+    "es": (
+        "🔥 **¡Oferta imperdible!**\n\n"
+        "Acabo de encontrar este **{nome}** por solo **{preco}**.\n\n"
+        "✅ Envío rápido a {pais}\n"
+        "✅ Satisfacción garantizada\n"
+        "✅ Comisión justa para quien recomienda 😊\n\n"
+        "👉 **¡Haz clic en el enlace para conseguir el tuyo!**\n"
+        "{link}\n\n"
+        "#afiliado #{hashtag_pais}"
+    ),
+    "fr": (
+        "🔥 **Offre à ne pas manquer !**\n\n"
+        "Je viens de trouver ce **{nome}** pour seulement **{preco}** !\n\n"
+        "✅ Livraison rapide en {pais}\n"
+        "✅ Satisfaction garantie\n"
+        "✅ Commission honnête pour ceux qui recommandent 😊\n\n"
+        "👉 **Cliquez sur le lien ci-dessous pour obtenir le vôtre !**\n"
+        "{link}\n\n"
+        "#affiliation #{hashtag_pais}"
+    ),
+    "de": (
+        "🔥 **Unschlagbares Angebot!**\n\n"
+        "Ich habe gerade **{nome}** für nur **{preco}** gefunden!\n\n"
+        "✅ Schneller Versand nach {pais}\n"
+        "✅ Zufriedenheitsgarantie\n"
+        "✅ Faire Provision für Empfehlungen 😊\n\n"
+        "👉 **Klicke auf den Link unten und sichere dir deins!**\n"
+        "{link}\n\n"
+        "#werbung #{hashtag_pais}"
+    ),
+    "it": (
+        "🔥 **Offerta imperdibile!**\n\n"
+        "Ho appena trovato questo **{nome}** a soli **{preco}**!\n\n"
+        "✅ Spedizione veloce in {pais}\n"
+        "✅ Soddisfazione garantita\n"
+        "✅ Commissione giusta per chi consiglia 😊\n\n"
+        "👉 **Clicca sul link qui sotto per avere il tuo!**\n"
+        "{link}\n\n"
+        "#affiliato #{hashtag_pais}"
+    ),
+}
+
+CAMPOS_MODELO = {"nome", "preco", "pais", "link", "hashtag_pais"}
+
+
+@dataclass(slots=True)
+class Anuncio:
+    produto_id: str
+    idioma: str
+    pais: str
+    plataforma: str
+    texto: str
+
+    def para_dict(self):
+        return asdict(self)
+
+
+CAMPOS_ANUNCIO = tuple(campo.name for campo in fields(Anuncio))
+
+
+def _valores(anuncio):
+    return (anuncio.produto_id, anuncio.idioma, anuncio.pais, anuncio.plataforma, anuncio.texto)
+
+
+def compilar_modelo(texto):
+    """
+    Valida o modelo (só campos conhecidos) e devolve a função que o preenche.
+    Erros de digitação no modelo aparecem aqui, e não no meio de um lote.
+    """
+    campos = {campo for _, campo, _, _ in string.Formatter().parse(texto) if campo is not None}
+    desconhecidos = campos - CAMPOS_MODELO
+    if desconhecidos:
+        raise ValueError(f"Campos desconhecidos no modelo: {', '.join(sorted(desconhecidos))}")
+    return texto.format
+
+
+class GeradorAnuncios:
+    """Gera anúncios para listas de produtos em um ou mais idiomas."""
+
+    def __init__(self, modelos=MODELOS):
+        self._modelos = {idioma: compilar_modelo(texto) for idioma, texto in modelos.items()}
+
+    def idioma_do_produto(self, produto):
+        return IDIOMA_POR_PAIS.get(produto.pais, "pt")
+
+    def gerar(self, produto, idioma=None):
+        return next(self.gerar_lote([produto], [idioma or self.idioma_do_produto(produto)]))
+
+    def gerar_lote(self, produtos, idiomas=None):
+        """
+        Gera um Anuncio por produto e idioma (por padrão, todos os idiomas).
+        É um gerador: os anúncios podem ir direto para a exportação sem ficar
+        todos na memória.
+        """
+        idiomas = list(idiomas or self._modelos)
+        modelos = [
+            (idioma, self._modelos[idioma], NOMES_PAIS[idioma], HASHTAGS_PAIS[idioma]) for idioma in idiomas
+        ]
+        for produto in produtos:
+            # Campos que não dependem do idioma são calculados uma vez por produto
+            nome = produto.nome.lower()
+            preco = formatar_euros(produto.preco)
+            link = produto.link or LINK_PADRAO
+            for idioma, preencher, nomes_pais, hashtags in modelos:
+                yield Anuncio(
+                    produto_id=produto.id,
+                    idioma=idioma,
+                    pais=produto.pais,
+                    plataforma=produto.plataforma,
+                    texto=preencher(
+                        nome=nome,
+                        preco=preco,
+                        pais=nomes_pais.get(produto.pais, produto.pais),
+                        link=link,
+                        hashtag_pais=hashtags.get(produto.pais) or produto.pais.replace(" ", "").lower(),
+                    ),
+                )
+
+
+# ==============================
+# Exportação
+# ==============================
+def exportar_csv(anuncios, destino=None):
+    """Escreve os anúncios em CSV. Sem `destino`, devolve o CSV como texto."""
+    saida = destino if destino is not None else io.StringIO()
+    escritor = csv.writer(saida)
+    escritor.writerow(CAMPOS_ANUNCIO)
+    escritor.writerows(_valores(anuncio) for anuncio in anuncios)
+    if destino is None:
+        return saida.getvalue()
+
+
+def exportar_jsonl(anuncios, destino=None):
+    """Escreve os anúncios em JSON Lines. Sem `destino`, devolve o texto."""
+    saida = destino if destino is not None else io.StringIO()
+    for anuncio in anuncios:
+        saida.write(json.dumps(dict(zip(CAMPOS_ANUNCIO, _valores(anuncio))), ensure_ascii=False) + "\n")
+    if destino is None:
+        return saida.getvalue()
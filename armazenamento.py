@@ -0,0 +1,734 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from modelos import AgendamentoPostagem, AgendamentoSalao, Profissional, Salao, classificar_registro, minutos
+
+# ==============================
+# Armazenamento (SQLite em modo WAL)
+# ==============================
+# Agendamentos do salão e agendamentos de postagens ficam em bancos
+# separados, cada um com colunas próprias e índices próprios. Inserções são
+# O(1) e consultas usam o índice, sem ler o arquivo todo.
+
+TAMANHO_LOTE = 5000
+CHAVES_CONFERIDAS = 1000  # (data, profissional) mantidos em memória por inserir_sem_sobreposicao
+
+
+# ==============================
+# Gravação atômica de arquivos
+# ==============================
+def gravar_texto_atomico(caminho, texto, sufixo=".tmp"):
+    """Grava num arquivo temporário na mesma pasta e substitui o destino com os.replace."""
+    pasta = os.path.dirname(os.path.abspath(caminho))
+    fd, temporario = tempfile.mkstemp(prefix=".tmp_", suffix=sufixo, dir=pasta)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(texto)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, caminho)
+    except Exception:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+
+
+def gravar_json_atomico(caminho, dados):
+    gravar_texto_atomico(caminho, json.dumps(dados, ensure_ascii=False, indent=2), sufixo=".json")
+
+
+class BancoSQLite:
+    """
+    Base comum: uma conexão por thread, pois o Streamlit executa cada sessão
+    em sua própria thread.
+    """
+
+    ESQUEMA = ""
+
+    def __init__(self, caminho):
+        self.caminho = str(caminho)
+        self._local = threading.local()
+        self._criar_tabelas()
+
+    def _conexao(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.caminho, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _criar_tabelas(self):
+        self._conexao().executescript(
+            self.ESQUEMA
+            + """
+            CREATE TABLE IF NOT EXISTS metadados (
+                chave TEXT PRIMARY KEY,
+                valor TEXT
+            );
+            """
+        )
+
+    @contextmanager
+    def _transacao(self, conexao=None):
+        conn = conexao or self._conexao()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _inserir_em_lotes(self, conn, sql, linhas):
+        lote = []
+        total = 0
+        for linha in linhas:
+            lote.append(linha)
+            if len(lote) >= TAMANHO_LOTE:
+                conn.executemany(sql, lote)
+                total += len(lote)
+                lote = []
+        if lote:
+            conn.executemany(sql, lote)
+            total += len(lote)
+        return total
+
+    def _lotes(self, tabela, colunas, tamanho):
+        """
+        Todas as linhas de `tabela`, em listas de até `tamanho` tuplas. Pagina
+        pelo rowid em vez de OFFSET, então cada lote custa o mesmo que o primeiro.
+        """
+        conn = self._conexao()
+        ultimo = 0
+        while True:
+            linhas = conn.execute(
+                f"SELECT rowid, {colunas} FROM {tabela} WHERE rowid > ? ORDER BY rowid LIMIT ?", (ultimo, tamanho)
+            ).fetchall()
+            if not linhas:
+                return
+            ultimo = linhas[-1][0]
+            yield [linha[1:] for linha in linhas]
+
+    def obter_metadado(self, chave):
+        linha = self._conexao().execute("SELECT valor FROM metadados WHERE chave = ?", (chave,)).fetchone()
+        return linha[0] if linha else None
+
+    def fechar(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+# ==============================
+# Agendamentos do salão
+# ==============================
+class ArmazemAgendamentos(BancoSQLite):
+    """
+    Agendamentos do salão, indexados por (data, profissional, horario). Cada
+    um ocupa `duracao` minutos a partir de `horario`.
+    """
+
+    ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS agendamentos_salao (
+            id TEXT UNIQUE NOT NULL,
+            data TEXT NOT NULL,
+            profissional TEXT NOT NULL,
+            horario TEXT NOT NULL,
+            status TEXT NOT NULL,
+            duracao INTEGER NOT NULL DEFAULT 60,
+            servico TEXT NOT NULL DEFAULT ''
+        );
+        CREATE INDEX IF NOT EXISTS idx_salao_slot
+            ON agendamentos_salao (data, profissional, horario);
+        CREATE INDEX IF NOT EXISTS idx_salao_ordem
+            ON agendamentos_salao (data, horario);
+    """
+    _INSERIR = (
+        "INSERT INTO agendamentos_salao (id, data, profissional, horario, status, duracao, servico) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)"
+    )
+    _INSERIR_OU_SUBSTITUIR = _INSERIR.replace("INSERT", "INSERT OR REPLACE", 1)
+    _COLUNAS = "id, data, profissional, horario, status, duracao, servico"
+
+    def _criar_tabelas(self):
+        super()._criar_tabelas()
+        conn = self._conexao()
+        # Bancos criados antes dos serviços com duração: horários de 1 hora
+        colunas = {linha[1] for linha in conn.execute("PRAGMA table_info(agendamentos_salao)")}
+        if "duracao" not in colunas:
+            conn.execute("ALTER TABLE agendamentos_salao ADD COLUMN duracao INTEGER NOT NULL DEFAULT 60")
+        if "servico" not in colunas:
+            conn.execute("ALTER TABLE agendamentos_salao ADD COLUMN servico TEXT NOT NULL DEFAULT ''")
+        self._criar_indice_reserva(conn)
+
+    def _criar_indice_reserva(self, conn):
+        # Um horário só pode ter um agendamento confirmado por profissional.
+        # Se o índice já existe não há duplicados: a varredura só roda na
+        # criação (banco antigo ou depois de inserir_em_massa, que o remove)
+        if conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_salao_reserva'"
+        ).fetchone():
+            return
+        self._marcar_duplicados(conn)
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_salao_reserva "
+            "ON agendamentos_salao (data, profissional, horario) "
+            "WHERE status = 'confirmado'"
+        )
+
+    @staticmethod
+    def _marcar_duplicados(conn):
+        """
+        Reservas duplicadas gravadas antes da restrição de unicidade: mantém a mais
+        antiga e marca as demais como 'conflito' para revisão manual.
+        """
+        conn.execute(
+            """
+            UPDATE agendamentos_salao SET status = 'conflito'
+            WHERE status = 'confirmado' AND rowid NOT IN (
+                SELECT MIN(rowid) FROM agendamentos_salao
+                WHERE status = 'confirmado'
+                GROUP BY data, profissional, horario
+            )
+            """
+        )
+
+    @staticmethod
+    def _linha(ag):
+        return (ag.id, ag.data, ag.profissional, ag.horario, ag.status, ag.duracao, ag.servico)
+
+    # ------------------------------
+    # Leitura
+    # ------------------------------
+    def carregar(self):
+        """Todos os agendamentos, ordenados por (data, horario)."""
+        cur = self._conexao().execute(
+            f"SELECT {self._COLUNAS} FROM agendamentos_salao ORDER BY data, horario"
+        )
+        return [AgendamentoSalao(*linha) for linha in cur]
+
+    def buscar(self, data, profissional=None):
+        """Consulta pontual pelo índice: agendamentos de uma data (e de um profissional)."""
+        if profissional is None:
+            cur = self._conexao().execute(
+                f"SELECT {self._COLUNAS} FROM agendamentos_salao WHERE data = ? ORDER BY horario",
+                (data,),
+            )
+        else:
+            cur = self._conexao().execute(
+                f"SELECT {self._COLUNAS} FROM agendamentos_salao "
+                "WHERE data = ? AND profissional = ? ORDER BY horario",
+                (data, profissional),
+            )
+        return [AgendamentoSalao(*linha) for linha in cur]
+
+    @staticmethod
+    def _filtros(data_inicio, data_fim, profissional):
+        condicoes, parametros = [], []
+        if data_inicio is not None:
+            condicoes.append("data >= ?")
+            parametros.append(str(data_inicio))
+        if data_fim is not None:
+            condicoes.append("data <= ?")
+            parametros.append(str(data_fim))
+        if profissional is not None:
+            condicoes.append("profissional = ?")
+            parametros.append(profissional)
+        where = " WHERE " + " AND ".join(condicoes) if condicoes else ""
+        return where, parametros
+
+    def listar(self, limite, deslocamento=0, data_inicio=None, data_fim=None, profissional=None):
+        """Uma página de agendamentos, ordenada por (data, horario) no próprio banco."""
+        where, parametros = self._filtros(data_inicio, data_fim, profissional)
+        cur = self._conexao().execute(
+            f"SELECT {self._COLUNAS} FROM agendamentos_salao{where} "
+            "ORDER BY data, horario LIMIT ? OFFSET ?",
+            (*parametros, limite, deslocamento),
+        )
+        return [AgendamentoSalao(*linha) for linha in cur]
+
+    def ocupacoes(self, desde=None):
+        """Tuplas (data, profissional, horario, duracao) de agendamentos ativos, a partir da data `desde`."""
+        if desde is None:
+            cur = self._conexao().execute(
+                "SELECT data, profissional, horario, duracao FROM agendamentos_salao WHERE status = 'confirmado'"
+            )
+        else:
+            cur = self._conexao().execute(
+                "SELECT data, profissional, horario, duracao FROM agendamentos_salao "
+                "WHERE status = 'confirmado' AND data >= ?",
+                (str(desde),),
+            )
+        return cur.fetchall()
+
+    def contar(self, data_inicio=None, data_fim=None, profissional=None):
+        where, parametros = self._filtros(data_inicio, data_fim, profissional)
+        return self._conexao().execute(f"SELECT COUNT(*) FROM agendamentos_salao{where}", parametros).fetchone()[0]
+
+    def lotes(self, tamanho=TAMANHO_LOTE):
+        """Todas as linhas, em lotes de tuplas na ordem de _COLUNAS (para exportação)."""
+        return self._lotes("agendamentos_salao", self._COLUNAS, tamanho)
+
+    # ------------------------------
+    # Relatórios (agregados no próprio banco)
+    # ------------------------------
+    def _filtros_confirmados(self, data_inicio, data_fim):
+        where, parametros = self._filtros(data_inicio, data_fim, None)
+        return where + (" AND " if where else " WHERE ") + "status = 'confirmado'", parametros
+
+    def periodo(self):
+        """(primeira data, última data) dos agendamentos confirmados, ou (None, None)."""
+        return self._conexao().execute(
+            "SELECT MIN(data), MAX(data) FROM agendamentos_salao WHERE status = 'confirmado'"
+        ).fetchone()
+
+    def por_profissional_dia(self, data_inicio=None, data_fim=None):
+        """(data, profissional, agendamentos, minutos reservados), ordenado por data e profissional."""
+        where, parametros = self._filtros_confirmados(data_inicio, data_fim)
+        return self._conexao().execute(
+            f"SELECT data, profissional, COUNT(*), SUM(duracao) FROM agendamentos_salao{where} "
+            "GROUP BY data, profissional ORDER BY data, profissional",
+            parametros,
+        ).fetchall()
+
+    def minutos_por_profissional(self, data_inicio=None, data_fim=None):
+        """{profissional: minutos reservados} no período."""
+        where, parametros = self._filtros_confirmados(data_inicio, data_fim)
+        return dict(self._conexao().execute(
+            f"SELECT profissional, SUM(duracao) FROM agendamentos_salao{where} GROUP BY profissional", parametros
+        ).fetchall())
+
+    def horarios_populares(self, limite=10, data_inicio=None, data_fim=None):
+        """(dia da semana, 0 = domingo; horario; agendamentos), do mais procurado para o menos."""
+        where, parametros = self._filtros_confirmados(data_inicio, data_fim)
+        return self._conexao().execute(
+            f"SELECT CAST(strftime('%w', data) AS INTEGER) AS dia, horario, COUNT(*) AS total "
+            f"FROM agendamentos_salao{where} GROUP BY dia, horario ORDER BY total DESC, dia, horario LIMIT ?",
+            (*parametros, limite),
+        ).fetchall()
+
+    # ------------------------------
+    # Escrita
+    # ------------------------------
+    def adicionar(self, agendamento):
+        """
+        Insere um único agendamento (O(1), sem reescrever o restante).
+        Levanta sqlite3.IntegrityError se o horário já estiver reservado.
+        """
+        self._conexao().execute(self._INSERIR, self._linha(agendamento))
+
+    def reservar(self, agendamento, conexao=None):
+        """
+        Reserva atômica: a checagem de sobreposição e a inserção acontecem na
+        mesma transação de escrita, então duas reservas simultâneas (de
+        qualquer processo) não ocupam o mesmo intervalo. Retorna False se o
+        intervalo [horario, horario + duracao) conflitar com outra reserva.
+        `conexao` troca a conexão da thread por outra (ver AgendaSaloes).
+        """
+        inicio = minutos(agendamento.horario)
+        with self._transacao(conexao) as conn:
+            # Só os agendamentos do dia que começam antes do fim deste podem se sobrepor (busca pelo índice)
+            for horario, duracao in conn.execute(
+                "SELECT horario, duracao FROM agendamentos_salao "
+                "WHERE data = ? AND profissional = ? AND horario < ? AND status = 'confirmado'",
+                (agendamento.data, agendamento.profissional, agendamento.fim),
+            ):
+                if minutos(horario) + duracao > inicio:
+                    return False
+            conn.execute(self._INSERIR, self._linha(agendamento))
+        return True
+
+    def cancelar(self, id_agendamento, conexao=None):
+        """Marca um agendamento como cancelado e devolve o registro como estava antes (ou None)."""
+        with self._transacao(conexao) as conn:
+            linha = conn.execute(
+                f"SELECT {self._COLUNAS} FROM agendamentos_salao WHERE id = ?", (id_agendamento,)
+            ).fetchone()
+            conn.execute("UPDATE agendamentos_salao SET status = 'cancelado' WHERE id = ?", (id_agendamento,))
+        return AgendamentoSalao(*linha) if linha else None
+
+    def salvar(self, agendamentos):
+        """Substitui todo o conteúdo (compatível com o antigo salvar_agendamentos)."""
+        with self._transacao() as conn:
+            conn.execute("DELETE FROM agendamentos_salao")
+            self.inserir_em_massa(agendamentos, conn)
+
+    def inserir_em_massa(self, agendamentos, conn=None):
+        """
+        Carga em massa: a restrição única é removida durante a carga e recriada
+        ao final, marcando eventuais duplicados como 'conflito'.
+        """
+        if conn is None:
+            with self._transacao() as conn:
+                return self.inserir_em_massa(agendamentos, conn)
+        conn.execute("DROP INDEX IF EXISTS idx_salao_reserva")
+        total = self._inserir_em_lotes(
+            conn, self._INSERIR_OU_SUBSTITUIR, (self._linha(ag) for ag in agendamentos)
+        )
+        self._criar_indice_reserva(conn)
+        return total
+
+    def inserir_sem_sobreposicao(self, agendamentos, rejeitar=None, conn=None):
+        """
+        Carga em massa para importações: cada agendamento confirmado é conferido,
+        na mesma transação, contra os confirmados do banco e os já aceitos nesta
+        carga. Os que se sobrepõem não são gravados e vão para `rejeitar(ag)`
+        assim que recebidos. Um id existente é substituído e libera o intervalo
+        antigo. Retorna quantos foram gravados.
+        """
+        if conn is None:
+            with self._transacao() as conn:
+                return self.inserir_sem_sobreposicao(agendamentos, rejeitar, conn)
+        ocupados = {}   # (data, profissional) -> {id: (início, fim)} dos confirmados
+        onde = {}       # id -> (data, profissional) em `ocupados`
+        pendentes = {}  # id -> linha aceita e ainda não gravada
+        total = 0
+        for ag in agendamentos:
+            chave = (ag.data, ag.profissional)
+            intervalos = ocupados.get(chave)
+            if intervalos is None:
+                intervalos = ocupados[chave] = {
+                    id_: (minutos(horario), minutos(horario) + duracao)
+                    for id_, horario, duracao in conn.execute(
+                        "SELECT id, horario, duracao FROM agendamentos_salao "
+                        "WHERE data = ? AND profissional = ? AND status = 'confirmado'",
+                        chave,
+                    )
+                    # Os aceitos e ainda não gravados valem pelo lugar novo, já em `ocupados`
+                    if id_ not in pendentes
+                }
+                onde.update(dict.fromkeys(intervalos, chave))
+            if ag.status == "confirmado":
+                inicio = minutos(ag.horario)
+                fim = inicio + ag.duracao
+                if any(i < fim and inicio < f for id_, (i, f) in intervalos.items() if id_ != ag.id):
+                    if rejeitar is not None:
+                        rejeitar(ag)
+                    continue
+            anterior = onde.pop(ag.id, None)
+            if anterior is not None:
+                ocupados[anterior].pop(ag.id, None)
+            if ag.status == "confirmado":
+                intervalos[ag.id] = (inicio, fim)
+                onde[ag.id] = chave
+            pendentes[ag.id] = self._linha(ag)
+            if len(pendentes) >= TAMANHO_LOTE:
+                conn.executemany(self._INSERIR_OU_SUBSTITUIR, pendentes.values())
+                total += len(pendentes)
+                pendentes.clear()
+                if len(ocupados) > CHAVES_CONFERIDAS:
+                    # Com tudo gravado o banco volta a ser a referência: a memória fica limitada
+                    ocupados.clear()
+                    onde.clear()
+        if pendentes:
+            conn.executemany(self._INSERIR_OU_SUBSTITUIR, pendentes.values())
+            total += len(pendentes)
+        return total
+
+
+# ==============================
+# Agendamentos de postagens
+# ==============================
+class ArmazemPostagens(BancoSQLite):
+    """Agendamentos de postagens em redes sociais, indexados por data de criação."""
+
+    ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS agendamentos_postagem (
+            id TEXT PRIMARY KEY,
+            data_criacao TEXT NOT NULL,
+            plataforma TEXT NOT NULL,
+            tipo_conteudo TEXT NOT NULL,
+            horarios TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_postagem_criacao
+            ON agendamentos_postagem (data_criacao);
+    """
+    _INSERIR = (
+        "INSERT OR REPLACE INTO agendamentos_postagem (id, data_criacao, plataforma, tipo_conteudo, horarios) "
+        "VALUES (?, ?, ?, ?, ?)"
+    )
+    _COLUNAS = "id, data_criacao, plataforma, tipo_conteudo, horarios"
+
+    @staticmethod
+    def _linha(ag):
+        return (ag.id, ag.data_criacao, ag.plataforma, ag.tipo_conteudo, ",".join(ag.horarios))
+
+    @staticmethod
+    def _registro(linha):
+        id_, data_criacao, plataforma, tipo_conteudo, horarios = linha
+        return AgendamentoPostagem(
+            id_, data_criacao, plataforma, tipo_conteudo, tuple(horarios.split(",")) if horarios else ()
+        )
+
+    def carregar(self):
+        """Todos os agendamentos de postagem, do mais recente para o mais antigo."""
+        cur = self._conexao().execute(
+            f"SELECT {self._COLUNAS} FROM agendamentos_postagem ORDER BY data_criacao DESC"
+        )
+        return [self._registro(linha) for linha in cur]
+
+    @staticmethod
+    def _filtros(data_inicio, data_fim, plataforma):
+        condicoes, parametros = [], []
+        if data_inicio is not None:
+            condicoes.append("data_criacao >= ?")
+            parametros.append(str(data_inicio))
+        if data_fim is not None:
+            # data_criacao é ISO com hora: o limite superior inclui o dia inteiro
+            condicoes.append("data_criacao < ?")
+            parametros.append(str(data_fim) + "T99")
+        if plataforma is not None:
+            condicoes.append("plataforma = ?")
+            parametros.append(plataforma)
+        where = " WHERE " + " AND ".join(condicoes) if condicoes else ""
+        return where, parametros
+
+    def listar(self, limite, deslocamento=0, data_inicio=None, data_fim=None, plataforma=None):
+        """Uma página de agendamentos de postagem, do mais recente para o mais antigo."""
+        where, parametros = self._filtros(data_inicio, data_fim, plataforma)
+        cur = self._conexao().execute(
+            f"SELECT {self._COLUNAS} FROM agendamentos_postagem{where} "
+            "ORDER BY data_criacao DESC LIMIT ? OFFSET ?",
+            (*parametros, limite, deslocamento),
+        )
+        return [self._registro(linha) for linha in cur]
+
+    def contar(self, data_inicio=None, data_fim=None, plataforma=None):
+        where, parametros = self._filtros(data_inicio, data_fim, plataforma)
+        return self._conexao().execute(f"SELECT COUNT(*) FROM agendamentos_postagem{where}", parametros).fetchone()[0]
+
+    def lotes(self, tamanho=TAMANHO_LOTE):
+        """Todas as linhas, em lotes de tuplas na ordem de _COLUNAS (horários separados por vírgula)."""
+        return self._lotes("agendamentos_postagem", self._COLUNAS, tamanho)
+
+    def gravados_desde(self, rowid=0):
+        """
+        (rowid, agendamento) dos agendamentos gravados depois de `rowid`, em
+        ordem de gravação. INSERT OR REPLACE dá um rowid novo à linha, então
+        um agendamento regravado (ou importado com data antiga) também aparece.
+        """
+        cur = self._conexao().execute(
+            f"SELECT rowid, {self._COLUNAS} FROM agendamentos_postagem WHERE rowid > ? ORDER BY rowid",
+            (rowid,),
+        )
+        return [(linha[0], self._registro(linha[1:])) for linha in cur]
+
+    def regravacoes(self):
+        """Quantas vezes salvar() regravou a tabela; a cada vez os rowids recomeçam do 1."""
+        return int(self.obter_metadado("regravacoes_postagem") or 0)
+
+    def adicionar(self, agendamento):
+        self._conexao().execute(self._INSERIR, self._linha(agendamento))
+
+    def salvar(self, agendamentos):
+        with self._transacao() as conn:
+            conn.execute("DELETE FROM agendamentos_postagem")
+            conn.execute(
+                "INSERT INTO metadados (chave, valor) VALUES ('regravacoes_postagem', 1) "
+                "ON CONFLICT (chave) DO UPDATE SET valor = valor + 1"
+            )
+            self.inserir_em_massa(agendamentos, conn)
+
+    def inserir_em_massa(self, agendamentos, conn=None):
+        if conn is None:
+            with self._transacao() as conn:
+                return self.inserir_em_massa(agendamentos, conn)
+        return self._inserir_em_lotes(conn, self._INSERIR, (self._linha(ag) for ag in agendamentos))
+
+
+# ==============================
+# Execuções das postagens agendadas
+# ==============================
+class ArmazemExecucoes(BancoSQLite):
+    """
+    Uma linha por disparo de postagem, identificada pela chave de
+    idempotência (agendamento + data e horário do disparo). É o que permite
+    ao agendador retomar tentativas e não publicar duas vezes após reiniciar.
+    """
+
+    ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS execucoes_postagem (
+            chave TEXT PRIMARY KEY,
+            agendamento_id TEXT NOT NULL,
+            disparo TEXT NOT NULL,
+            status TEXT NOT NULL,
+            tentativas INTEGER NOT NULL DEFAULT 0,
+            proxima_tentativa REAL,
+            resultado TEXT NOT NULL DEFAULT '',
+            atualizado_em TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_execucao_pendente
+            ON execucoes_postagem (proxima_tentativa) WHERE status = 'pendente';
+        CREATE INDEX IF NOT EXISTS idx_execucao_atualizacao
+            ON execucoes_postagem (atualizado_em);
+    """
+
+    def estado(self, chave):
+        """(status, tentativas) do disparo, ou (None, 0) se ainda não foi tentado."""
+        linha = self._conexao().execute(
+            "SELECT status, tentativas FROM execucoes_postagem WHERE chave = ?", (chave,)
+        ).fetchone()
+        return linha if linha else (None, 0)
+
+    def registrar(self, chave, agendamento_id, disparo, status, tentativas,
+                  proxima_tentativa=None, resultado=""):
+        self._conexao().execute(
+            "INSERT OR REPLACE INTO execucoes_postagem "
+            "(chave, agendamento_id, disparo, status, tentativas, proxima_tentativa, resultado, atualizado_em) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (chave, agendamento_id, disparo, status, tentativas, proxima_tentativa, resultado,
+             datetime.now().isoformat()),
+        )
+
+    def pendentes(self):
+        """Tentativas agendadas e ainda não concluídas: (chave, agendamento_id, próxima tentativa)."""
+        return self._conexao().execute(
+            "SELECT chave, agendamento_id, proxima_tentativa FROM execucoes_postagem "
+            "WHERE status = 'pendente' ORDER BY proxima_tentativa"
+        ).fetchall()
+
+    def contar_por_status(self):
+        return dict(self._conexao().execute(
+            "SELECT status, COUNT(*) FROM execucoes_postagem GROUP BY status"
+        ).fetchall())
+
+    def recentes(self, limite):
+        """As `limite` execuções atualizadas mais recentemente, como dicts."""
+        cur = self._conexao().execute(
+            "SELECT chave, agendamento_id, disparo, status, tentativas, resultado, atualizado_em "
+            "FROM execucoes_postagem ORDER BY atualizado_em DESC LIMIT ?",
+            (limite,),
+        )
+        colunas = [descricao[0] for descricao in cur.description]
+        return [dict(zip(colunas, linha)) for linha in cur]
+
+
+# ==============================
+# Cadastro de salões (um banco de agendamentos por salão)
+# ==============================
+class ArmazemSaloes(BancoSQLite):
+    """
+    Salões, seus profissionais (expediente e duração dos horários) e o
+    caminho do banco de agendamentos de cada salão. Só o cadastro fica
+    aqui: as reservas vão para o banco do próprio salão.
+    """
+
+    ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS saloes (
+            id TEXT PRIMARY KEY,
+            nome TEXT NOT NULL,
+            banco TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS profissionais (
+            salao_id TEXT NOT NULL,
+            posicao INTEGER NOT NULL,
+            nome TEXT NOT NULL,
+            expediente TEXT NOT NULL,
+            duracao INTEGER NOT NULL,
+            PRIMARY KEY (salao_id, nome)
+        );
+    """
+
+    @staticmethod
+    def _linhas_profissionais(salao):
+        return [
+            (salao.id, posicao, p.nome, json.dumps(p.para_dict()["expediente"]), p.duracao)
+            for posicao, p in enumerate(salao.profissionais)
+        ]
+
+    def salvar(self, salao, banco, conn=None):
+        """Cria ou substitui um salão e a lista dos seus profissionais."""
+        if conn is None:
+            with self._transacao() as conn:
+                return self.salvar(salao, banco, conn)
+        conn.execute("INSERT OR REPLACE INTO saloes (id, nome, banco) VALUES (?, ?, ?)", (salao.id, salao.nome, banco))
+        conn.execute("DELETE FROM profissionais WHERE salao_id = ?", (salao.id,))
+        conn.executemany("INSERT INTO profissionais VALUES (?, ?, ?, ?, ?)", self._linhas_profissionais(salao))
+
+    def inserir_em_massa(self, saloes_e_bancos):
+        """Cadastra vários (salão, banco) numa única transação."""
+        with self._transacao() as conn:
+            total = 0
+            for salao, banco in saloes_e_bancos:
+                self.salvar(salao, banco, conn)
+                total += 1
+        return total
+
+    def carregar(self):
+        """{id: (salão, banco)} de todos os salões, com profissionais na ordem cadastrada."""
+        conn = self._conexao()
+        profissionais = {}
+        for salao_id, nome, expediente, duracao in conn.execute(
+            "SELECT salao_id, nome, expediente, duracao FROM profissionais ORDER BY salao_id, posicao"
+        ):
+            periodos = tuple(tuple(periodo) for periodo in json.loads(expediente))
+            profissionais.setdefault(salao_id, []).append(Profissional(nome, periodos, duracao))
+        return {
+            salao_id: (Salao(salao_id, nome, tuple(profissionais.get(salao_id, ()))), banco)
+            for salao_id, nome, banco in conn.execute("SELECT id, nome, banco FROM saloes ORDER BY nome")
+        }
+
+    def contar(self):
+        return self._conexao().execute("SELECT COUNT(*) FROM saloes").fetchone()[0]
+
+
+# ==============================
+# Migração dos dados mistos antigos
+# ==============================
+def _separar(registros):
+    salao, postagens = [], []
+    for d in registros:
+        registro = classificar_registro(d)
+        if isinstance(registro, AgendamentoSalao):
+            salao.append(registro)
+        elif isinstance(registro, AgendamentoPostagem):
+            postagens.append(registro)
+    return salao, postagens
+
+
+def migrar_dados_mistos(caminho_json, armazem_salao, armazem_postagens):
+    """
+    Migração única: separa os registros do antigo arquivo JSON misto (e da
+    tabela mista `agendamentos`, se o banco já tiver sido criado por uma
+    versão anterior) entre os dois armazenamentos.
+    Retorna (agendamentos do salão, agendamentos de postagem) migrados.
+    """
+    chave = "migrado:" + os.path.abspath(caminho_json)
+    if armazem_salao.obter_metadado(chave) is not None:
+        return 0, 0
+
+    registros = []
+    conn = armazem_salao._conexao()
+    tabela_antiga = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'agendamentos'"
+    ).fetchone()
+    if tabela_antiga:
+        registros = [
+            json.loads(linha[0])
+            for linha in conn.execute("SELECT registro FROM agendamentos ORDER BY rowid")
+        ]
+    elif os.path.exists(caminho_json):
+        try:
+            with open(caminho_json, "r", encoding="utf-8") as f:
+                registros = json.load(f)
+        except Exception:
+            registros = []
+
+    salao, postagens = _separar(registros)
+    total_postagens = armazem_postagens.inserir_em_massa(postagens)
+    with armazem_salao._transacao() as conn:
+        total_salao = armazem_salao.inserir_em_massa(salao, conn)
+        conn.execute("DROP TABLE IF EXISTS agendamentos")
+        conn.execute(
+            "INSERT OR REPLACE INTO metadados (chave, valor) VALUES (?, ?)",
+            (chave, f"{total_salao},{total_postagens}"),
+        )
+    return total_salao, total_postagens
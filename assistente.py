@@ -0,0 +1,250 @@
+import hashlib
+import queue
+import re
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+
+# ==============================
+# Assistente da MSSP
+# ==============================
+# Monta a janela de contexto (histórico recente limitado por orçamento de
+# tokens) e gera a resposta em trechos, através de um backend plugável.
+# Enquanto não há integração com IA, o BackendLocal produz a resposta
+# localmente a partir de temas conhecidos.
+
+ORCAMENTO_TOKENS_HISTORICO = 1500
+MAXIMO_MENSAGENS_HISTORICO = 20
+TEMPO_LIMITE_RESPOSTA = 30
+MAXIMO_RESPOSTAS_SIMULTANEAS = 4
+
+TEMAS = {
+    "shopify": (
+        "Na Shopify, comece pelo tema e pelas páginas essenciais (produto, políticas, contato). "
+        "Depois instale só os apps que resolvem um problema real — cada app pesa no carregamento da loja."
+    ),
+    "clickbank": (
+        "Para o ClickBank, use uma página ponte (bridge page) antes do link de afiliado, "
+        "capture o e-mail do visitante e acompanhe as conversões com o parâmetro tid no hoplink."
+    ),
+    "dropshipping": (
+        "No dropshipping, valide o produto com poucos anúncios antes de escalar, "
+        "negocie prazos de entrega para a Europa e deixe a política de devolução bem clara."
+    ),
+    "automa": (
+        "Para automações, comece pelo que se repete todos os dias (respostas, postagens, relatórios) "
+        "e mantenha sempre uma aprovação manual antes de qualquer ação em contas reais."
+    ),
+    "funil": (
+        "Um funil simples funciona bem: anúncio → página de captura → sequência de e-mails → oferta. "
+        "Meça cada etapa separadamente para saber onde estão as perdas."
+    ),
+}
+
+
+def estimar_tokens(texto):
+    """Estimativa barata (≈ 4 caracteres por token), suficiente para limitar a janela."""
+    return len(texto) // 4 + 1
+
+
+def janela_historico(historico, orcamento_tokens=ORCAMENTO_TOKENS_HISTORICO,
+                     maximo_mensagens=MAXIMO_MENSAGENS_HISTORICO):
+    """
+    Seleciona as mensagens mais recentes (em ordem cronológica) que cabem no
+    orçamento de tokens. `historico` deve estar em ordem cronológica.
+    """
+    janela = []
+    usados = 0
+    for item in reversed(historico):
+        custo = estimar_tokens(item["conteudo"])
+        if janela and (usados + custo > orcamento_tokens or len(janela) >= maximo_mensagens):
+            break
+        janela.append(item)
+        usados += custo
+    janela.reverse()
+    return janela
+
+
+# ==============================
+# Chave do cache de respostas
+# ==============================
+PALAVRAS_IGNORADAS = {
+    "a", "o", "as", "os", "um", "uma", "de", "do", "da", "dos", "das", "no", "na", "nos", "nas",
+    "em", "e", "ao", "para", "pra", "por", "com", "me", "meu", "minha", "eu", "voce",
+}
+
+
+def normalizar_mensagem(texto):
+    """
+    Forma canônica da pergunta: minúsculas, sem acentos, sem pontuação e sem
+    palavras vazias. "Como integrar o ClickBank?" e "como integrar clickbank"
+    viram a mesma chave.
+    """
+    texto = unicodedata.normalize("NFKD", texto.lower())
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    palavras = re.findall(r"[a-z0-9]+", texto)
+    return " ".join(p for p in palavras if p not in PALAVRAS_IGNORADAS)
+
+
+def chave_resposta(mensagem_usuario, historico_recente=None):
+    """Chave do cache: pergunta normalizada e, opcionalmente, um hash da janela de histórico."""
+    chave = normalizar_mensagem(mensagem_usuario)
+    if historico_recente:
+        resumo = hashlib.sha1()
+        for item in historico_recente:
+            resumo.update(normalizar_mensagem(item["conteudo"]).encode("utf-8"))
+            resumo.update(b"\0")
+        chave += "#" + resumo.hexdigest()[:16]
+    return chave
+
+
+def _respostas_temas(texto):
+    texto = texto.lower()
+    return [resposta for tema, resposta in TEMAS.items() if tema in texto]
+
+
+def _resposta_local(mensagem_usuario, historico_recente):
+    partes = _respostas_temas(mensagem_usuario)
+    if not partes:
+        # Sem tema na mensagem atual: tenta o assunto da conversa recente
+        for item in reversed(historico_recente):
+            if item["tipo"] != "usuario_texto":
+                continue
+            partes = _respostas_temas(item["conteudo"])
+            if partes:
+                partes.insert(0, "Continuando o assunto anterior:")
+                break
+    if not partes:
+        partes = [
+            "Posso ajudar com Shopify, dropshipping, ClickBank, funis e automações. "
+            "Conte um pouco mais sobre o seu objetivo para eu indicar o próximo passo."
+        ]
+    return "\n\n".join(partes)
+
+
+# ==============================
+# Backends
+# ==============================
+class BackendAssistente:
+    """Interface dos backends: gerar() devolve a resposta em trechos (tokens)."""
+
+    def gerar(self, mensagem_usuario, historico_recente):
+        raise NotImplementedError
+
+    def depende_do_historico(self, mensagem_usuario):
+        """Se a resposta a esta mensagem muda com o histórico (um modelo de verdade sempre muda)."""
+        return True
+
+
+class BackendLocal(BackendAssistente):
+    """
+    Modelo local determinístico, para uso sem IA e para testes/benchmarks offline.
+    `atraso_por_token` simula a latência de geração de um modelo real.
+    """
+
+    def __init__(self, atraso_por_token=0.0):
+        self.atraso_por_token = atraso_por_token
+
+    def depende_do_historico(self, mensagem_usuario):
+        # Só a mensagem sem tema conhecido continua o assunto da conversa
+        return not _respostas_temas(mensagem_usuario)
+
+    def gerar(self, mensagem_usuario, historico_recente):
+        for trecho in re.findall(r"\S+\s*", _resposta_local(mensagem_usuario, historico_recente)):
+            if self.atraso_por_token:
+                time.sleep(self.atraso_por_token)
+            yield trecho
+
+
+# ==============================
+# Pipeline de respostas em streaming
+# ==============================
+_FIM = object()
+
+
+class PipelineRespostas:
+    """
+    Executa o backend num pool limitado de threads e repassa os trechos à
+    sessão conforme chegam. Respostas lentas ocupam só uma vaga do pool, sem
+    travar as demais sessões. Se quem consome o gerador desiste (ex.: o
+    usuário clica em "Stop" no Streamlit), a geração é cancelada.
+    """
+
+    def __init__(self, backend, max_trabalhadores=MAXIMO_RESPOSTAS_SIMULTANEAS,
+                 tempo_limite=TEMPO_LIMITE_RESPOSTA, cache=None, cache_usa_historico=False):
+        self.backend = backend
+        self.tempo_limite = tempo_limite
+        # Cache opcional (CacheLRU): perguntas repetidas não passam pelo backend. O
+        # histórico entra na chave sempre que a resposta depende dele
+        self.cache = cache
+        self.cache_usa_historico = cache_usa_historico
+        self._executor = ThreadPoolExecutor(max_workers=max_trabalhadores, thread_name_prefix="mssp")
+
+    def transmitir(self, mensagem_usuario, historico_recente, cancelamento=None):
+        """Gerador de trechos da resposta; respeita o tempo limite e o evento de cancelamento."""
+        chave = None
+        if self.cache is not None:
+            usa_historico = self.cache_usa_historico or self.backend.depende_do_historico(mensagem_usuario)
+            chave = chave_resposta(mensagem_usuario, historico_recente if usa_historico else None)
+            resposta = self.cache.obter(chave)
+            if resposta is not None:
+                yield resposta
+                return
+
+        cancelamento = cancelamento or threading.Event()
+        fila = queue.Queue()
+
+        def produzir():
+            try:
+                if cancelamento.is_set():
+                    # Cancelada enquanto esperava vaga no pool
+                    return
+                for trecho in self.backend.gerar(mensagem_usuario, historico_recente):
+                    if cancelamento.is_set():
+                        break
+                    fila.put(trecho)
+            except Exception as erro:
+                fila.put(erro)
+            finally:
+                fila.put(_FIM)
+
+        self._executor.submit(produzir)
+        prazo = time.monotonic() + self.tempo_limite
+        trechos = []
+        try:
+            while True:
+                restante = prazo - time.monotonic()
+                if restante <= 0:
+                    yield "\n\n⚠️ A resposta demorou demais e foi interrompida."
+                    return
+                try:
+                    item = fila.get(timeout=restante)
+                except queue.Empty:
+                    continue
+                if item is _FIM:
+                    # Só respostas completas entram no cache
+                    if chave is not None and trechos and not cancelamento.is_set():
+                        self.cache.guardar(chave, "".join(trechos))
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                trechos.append(item)
+                yield item
+        finally:
+            cancelamento.set()
+
+    def responder(self, mensagem_usuario, historico_recente):
+        return "".join(self.transmitir(mensagem_usuario, historico_recente))
+
+    def encerrar(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def responder_mssp(mensagem_usuario, historico_recente, backend=None):
+    """
+    Gera a resposta completa da MSSP (sem streaming). `historico_recente` já vem
+    limitado por janela_historico, então o custo não cresce com a conversa.
+    """
+    backend = backend or BackendLocal()
+    return "".join(backend.gerar(mensagem_usuario, historico_recente))
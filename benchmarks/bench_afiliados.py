@@ -0,0 +1,43 @@
+"""
+Busca de produtos em todos os países e plataformas: sequencial contra
+paralela, e a mesma busca repetida (cache).
+
+Uso:
+    python -m benchmarks.bench_afiliados --latencia 0.1
+"""
+import argparse
+import time
+
+from afiliados import PAISES, PLATAFORMAS, BuscadorProdutos, criar_provedores
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latencia", type=float, default=0.1, help="segundos por requisição simulada")
+    args = parser.parse_args()
+
+    provedores = criar_provedores(latencia=args.latencia)
+    inicio = time.perf_counter()
+    for pais in PAISES:
+        for plataforma in PLATAFORMAS:
+            provedores[plataforma].buscar("fone bluetooth", pais)
+    sequencial = time.perf_counter() - inicio
+
+    buscador = BuscadorProdutos(criar_provedores(latencia=args.latencia))
+    inicio = time.perf_counter()
+    produtos, _ = buscador.buscar("fone bluetooth", PAISES, PLATAFORMAS)
+    paralela = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    buscador.buscar("Fone Bluetooth", PAISES, PLATAFORMAS)
+    em_cache = time.perf_counter() - inicio
+    buscador.encerrar()
+
+    consultas = len(PAISES) * len(PLATAFORMAS)
+    print(f"{consultas} consultas, {len(produtos)} produtos, {args.latencia * 1000:.0f} ms por requisição")
+    print(f"sequencial: {sequencial * 1000:.0f} ms")
+    print(f"paralela:   {paralela * 1000:.0f} ms")
+    print(f"repetida:   {em_cache * 1000:.2f} ms ({buscador.cache.estatisticas()['acertos']} acertos no cache)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Agendador de postagens com 100 mil agendamentos: custo de montar o heap,
+CPU com o processo ocioso esperando o próximo disparo e vazão de uma
+rajada de disparos vencidos (com falhas e novas tentativas).
+
+Uso:
+    python -m benchmarks.bench_agendador --agendamentos 100000
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+from agendador import PLATAFORMAS_POSTAGEM, AgendadorPostagens, criar_publicadores
+from armazenamento import ArmazemExecucoes, ArmazemPostagens
+from modelos import AgendamentoPostagem
+
+HORARIOS = [f"{hora:02d}:00" for hora in range(6, 24)]
+
+
+def gerar_agendamentos(quantidade, horarios=None, semente=42):
+    sorteio = random.Random(semente)
+    criacao = datetime.now() - timedelta(days=1)
+    for i in range(quantidade):
+        yield AgendamentoPostagem(
+            id=f"post{i}",
+            data_criacao=(criacao + timedelta(microseconds=i)).isoformat(),
+            plataforma=sorteio.choice(PLATAFORMAS_POSTAGEM),
+            tipo_conteudo="oferta",
+            horarios=horarios or tuple(sorted(sorteio.sample(HORARIOS, sorteio.randint(1, 3)))),
+        )
+
+
+def criar_agendador(pasta, nome, agendamentos, **opcoes):
+    banco = os.path.join(pasta, nome)
+    armazem = ArmazemPostagens(banco)
+    armazem.inserir_em_massa(agendamentos)
+    return AgendadorPostagens(armazem, ArmazemExecucoes(banco), **opcoes)
+
+
+def medir_carga(pasta, quantidade):
+    # Relógio parado às 00:30: nenhum horário (06:00 a 23:00) vence durante a medição
+    meia_noite_e_meia = datetime.now().replace(hour=0, minute=30, second=0, microsecond=0).timestamp()
+    agendador = criar_agendador(
+        pasta, "carga.db", gerar_agendamentos(quantidade),
+        publicadores=criar_publicadores(), relogio=lambda: meia_noite_e_meia,
+    )
+    inicio, cpu = time.perf_counter(), time.process_time()
+    agendador.sincronizar()
+    print(f"heap com {len(agendador)} disparos de {quantidade} agendamentos: "
+          f"{(time.perf_counter() - inicio) * 1000:.0f} ms ({(time.process_time() - cpu) * 1000:.0f} ms de CPU)")
+
+    thread = threading.Thread(target=agendador.executar)
+    cpu = time.process_time()
+    thread.start()
+    time.sleep(3)
+    agendador.parar()
+    thread.join()
+    print(f"CPU em 3 s de espera com {len(agendador)} disparos no heap: {(time.process_time() - cpu) * 1000:.1f} ms")
+
+
+def medir_rajada(pasta, quantidade, latencia, taxa_falha):
+    # Todos no horário atual: vencem assim que o agendador começa
+    agora = datetime.now().strftime("%H:%M")
+    agendador = criar_agendador(
+        pasta, "rajada.db", gerar_agendamentos(quantidade, horarios=(agora,)),
+        publicadores=criar_publicadores(latencia=latencia, taxa_falha=taxa_falha),
+    )
+    thread = threading.Thread(target=agendador.executar)
+    inicio, cpu = time.perf_counter(), time.process_time()
+    thread.start()
+    while agendador.publicados + agendador.falhas < quantidade * (1 - taxa_falha) * 0.999:
+        time.sleep(0.05)
+    decorrido = time.perf_counter() - inicio
+    agendador.parar()
+    thread.join()
+    print(f"rajada de {quantidade} disparos ({latencia * 1000:.0f} ms por publicação, "
+          f"{taxa_falha:.0%} de falhas): {decorrido:.2f} s, {agendador.publicados / decorrido:,.0f} publicações/s, "
+          f"{(time.process_time() - cpu) * 1000 / quantidade:.3f} ms de CPU por disparo")
+    print(f"  execuções: {agendador.execucoes.contar_por_status()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--agendamentos", type=int, default=100000)
+    parser.add_argument("--rajada", type=int, default=10000)
+    parser.add_argument("--latencia", type=float, default=0.005, help="segundos por publicação simulada")
+    parser.add_argument("--taxa-falha", type=float, default=0.05)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        medir_carga(pasta, args.agendamentos)
+        medir_rajada(pasta, args.rajada, args.latencia, args.taxa_falha)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Geração de anúncios em lote: 10 mil produtos nos cinco idiomas, com
+exportação para CSV e JSON Lines.
+
+Uso:
+    python -m benchmarks.bench_anuncios --produtos 10000
+"""
+import argparse
+import random
+import time
+
+from afiliados import PAISES, PLATAFORMAS, Produto
+from anuncios import GeradorAnuncios, exportar_csv, exportar_jsonl
+
+
+def gerar_produtos(quantidade, semente=42):
+    sorteio = random.Random(semente)
+    produtos = []
+    for i in range(quantidade):
+        preco = round(sorteio.uniform(5, 300), 2)
+        produtos.append(Produto(
+            id=f"p{i}",
+            nome=f"Produto {i}",
+            preco=preco,
+            comissao=round(preco * 0.08, 2),
+            pais=sorteio.choice(PAISES),
+            plataforma=sorteio.choice(PLATAFORMAS),
+            link=f"https://afiliado.exemplo/p{i}",
+        ))
+    return produtos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--produtos", type=int, default=10000)
+    args = parser.parse_args()
+
+    produtos = gerar_produtos(args.produtos)
+    gerador = GeradorAnuncios()
+
+    inicio = time.perf_counter()
+    anuncios = list(gerador.gerar_lote(produtos))
+    geracao = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    csv_texto = exportar_csv(anuncios)
+    tempo_csv = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    jsonl_texto = exportar_jsonl(anuncios)
+    tempo_jsonl = time.perf_counter() - inicio
+
+    print(f"{len(anuncios)} anúncios ({args.produtos} produtos × 5 idiomas)")
+    print(f"geração: {geracao * 1000:.0f} ms ({len(anuncios) / geracao:,.0f} anúncios/s)")
+    print(f"CSV:     {tempo_csv * 1000:.0f} ms ({len(csv_texto) / 1e6:.1f} MB)")
+    print(f"JSONL:   {tempo_jsonl * 1000:.0f} ms ({len(jsonl_texto) / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Compara o armazenamento antigo (arquivo JSON inteiro) com o banco SQLite.
+
+Uso:
+    python -m benchmarks.bench_armazenamento --tamanhos 1000 100000 1000000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from armazenamento import ArmazemAgendamentos
+from benchmarks.dados_sinteticos import gerar_agendamentos_salao
+from modelos import AgendamentoSalao
+
+
+def cronometrar(funcao, repeticoes=1):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1000
+
+
+def medir_json(pasta, registros, data_consulta):
+    caminho = os.path.join(pasta, "agendamentos.json")
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(registros, f, ensure_ascii=False, indent=2)
+
+    def carregar():
+        with open(caminho, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def consultar():
+        lista = carregar()
+        return [ag for ag in lista if ag["data"] == data_consulta and ag["profissional"] == "Ana"]
+
+    def adicionar():
+        lista = carregar()
+        lista.append({"id": "novo", "data": data_consulta, "profissional": "Ana", "horario": "20:00"})
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(lista, f, ensure_ascii=False, indent=2)
+
+    return cronometrar(consultar), cronometrar(adicionar)
+
+
+def medir_sqlite(pasta, registros, data_consulta):
+    armazem = ArmazemAgendamentos(os.path.join(pasta, "agendamentos.db"))
+    armazem.salvar(AgendamentoSalao.de_dict(r) for r in registros)
+    contador = iter(range(10**9))
+
+    def consultar():
+        return armazem.buscar(data_consulta, "Ana")
+
+    def adicionar():
+        n = next(contador)
+        armazem.adicionar(AgendamentoSalao(f"novo_{n}", data_consulta, f"Extra{n}", "20:00"))
+
+    resultado = cronometrar(consultar, 100), cronometrar(adicionar, 100)
+    armazem.fechar()
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[1000, 100000, 1000000])
+    args = parser.parse_args()
+
+    print(f"{'registros':>10} | {'backend':>7} | {'consulta (ms)':>14} | {'inserção (ms)':>14}")
+    for tamanho in args.tamanhos:
+        registros = [ag.para_dict() for ag in gerar_agendamentos_salao(tamanho)]
+        data_consulta = registros[len(registros) // 2]["data"]
+        with tempfile.TemporaryDirectory() as pasta:
+            for nome, medir in (("json", medir_json), ("sqlite", medir_sqlite)):
+                consulta, insercao = medir(pasta, registros, data_consulta)
+                print(f"{tamanho:>10} | {nome:>7} | {consulta:>14.3f} | {insercao:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Tempo até o primeiro token e vazão do pipeline de respostas, com o modelo
+local determinístico simulando latência por token.
+
+Uso:
+    python -m benchmarks.bench_assistente --sessoes 16 --trabalhadores 4 --atraso 0.005
+"""
+import argparse
+import statistics
+import threading
+import time
+
+from assistente import BackendLocal, PipelineRespostas, responder_mssp
+
+MENSAGEM = "Como integrar ClickBank ao meu funil na Shopify?"
+
+
+def percentil(valores, p):
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(len(valores) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessoes", type=int, default=16)
+    parser.add_argument("--trabalhadores", type=int, default=4)
+    parser.add_argument("--atraso", type=float, default=0.005, help="segundos por token")
+    args = parser.parse_args()
+
+    backend = BackendLocal(atraso_por_token=args.atraso)
+
+    inicio = time.perf_counter()
+    responder_mssp(MENSAGEM, [], backend=backend)
+    bloqueante = time.perf_counter() - inicio
+
+    pipeline = PipelineRespostas(backend, max_trabalhadores=args.trabalhadores)
+    primeiros, totais, tokens = [], [], []
+    trava = threading.Lock()
+
+    def sessao():
+        comeco = time.perf_counter()
+        primeiro = None
+        quantidade = 0
+        for _ in pipeline.transmitir(MENSAGEM, []):
+            if primeiro is None:
+                primeiro = time.perf_counter() - comeco
+            quantidade += 1
+        with trava:
+            primeiros.append(primeiro)
+            totais.append(time.perf_counter() - comeco)
+            tokens.append(quantidade)
+
+    inicio = time.perf_counter()
+    threads = [threading.Thread(target=sessao) for _ in range(args.sessoes)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    duracao = time.perf_counter() - inicio
+    pipeline.encerrar()
+
+    print(f"resposta bloqueante (1 sessão): {bloqueante * 1000:.1f} ms até aparecer qualquer texto")
+    print(f"{args.sessoes} sessões, {args.trabalhadores} trabalhadores, {args.atraso * 1000:.1f} ms/token")
+    print(f"primeiro token: p50 {statistics.median(primeiros) * 1000:.1f} ms | p95 {percentil(primeiros, 0.95) * 1000:.1f} ms")
+    print(f"resposta completa: p50 {statistics.median(totais) * 1000:.1f} ms | p95 {percentil(totais, 0.95) * 1000:.1f} ms")
+    print(f"vazão: {sum(tokens) / duracao:.0f} tokens/s")
+
+
+if __name__ == "__main__":
+    main()
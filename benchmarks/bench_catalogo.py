@@ -0,0 +1,75 @@
+"""
+Ingestão em lotes e latência de busca no catálogo local (FTS5).
+
+Uso:
+    python -m benchmarks.bench_catalogo --produtos 1000000
+    python -m benchmarks.bench_catalogo --banco /tmp/catalogo.db   # ingere só na primeira vez
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from afiliados import PAISES, PLATAFORMAS
+from catalogo import CatalogoProdutos
+
+# Vocabulário nas cinco línguas, com acentos, para exercitar o tokenizador
+PRODUTOS = [
+    "fone bluetooth", "relógio inteligente", "auriculares inalámbricos", "montre connectée",
+    "kabellose kopfhörer", "orologio intelligente", "câmera de segurança", "cámara de seguridad",
+    "aspirateur robot", "staubsauger roboter", "friggitrice ad aria", "fritadeira elétrica",
+    "mochila de viagem", "sac à dos", "rucksack wasserdicht", "lampada led", "lâmpada inteligente",
+]
+ADJETIVOS = ["pro", "premium", "básico", "édition", "größe", "città", "compacto", "máximo", "über", "leggero"]
+CONSULTAS = ["relogio", "fone bluetooth", "camara seguridad", "montre", "kopfhorer", "friggitrice aria", "lampada", "uber pro"]
+
+
+def gerar_produtos(quantidade, semente=42):
+    sorteio = random.Random(semente)
+    for i in range(quantidade):
+        preco = round(sorteio.uniform(5, 300), 2)
+        yield {
+            "id": f"p{i}",
+            "nome": f"{sorteio.choice(PRODUTOS)} {sorteio.choice(ADJETIVOS)} {i % 997}",
+            "descricao": f"{sorteio.choice(ADJETIVOS)} {sorteio.choice(PRODUTOS)}",
+            "preco": preco,
+            "comissao": round(preco * sorteio.uniform(0.03, 0.2), 2),
+            "pais": sorteio.choice(PAISES),
+            "plataforma": sorteio.choice(PLATAFORMAS),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--produtos", type=int, default=1000000)
+    parser.add_argument("--repeticoes", type=int, default=20)
+    parser.add_argument("--banco", help="catálogo a reaproveitar entre execuções (criado se não existir)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = args.banco or os.path.join(pasta, "catalogo.db")
+        catalogo = CatalogoProdutos(caminho)
+        if catalogo.contar() != args.produtos:
+            inicio = time.perf_counter()
+            catalogo.ingerir(gerar_produtos(args.produtos))
+            print(f"ingestão de {args.produtos} produtos: {time.perf_counter() - inicio:.1f} s")
+        print(f"{catalogo.contar()} produtos em {caminho}")
+
+        print(f"{'consulta':>18} | {'p50 (ms)':>8} | {'p95 (ms)':>8} | resultados")
+        for consulta in CONSULTAS:
+            for filtros in ({}, {"paises": ["Portugal", "Espanha"], "plataformas": ["Awin"]}):
+                tempos = []
+                for _ in range(args.repeticoes):
+                    comeco = time.perf_counter()
+                    resultados = catalogo.buscar(consulta, **filtros)
+                    tempos.append((time.perf_counter() - comeco) * 1000)
+                tempos.sort()
+                nome = consulta + (" (filtro)" if filtros else "")
+                print(f"{nome:>18} | {statistics.median(tempos):>8.2f} | "
+                      f"{tempos[int(len(tempos) * 0.95) - 1]:>8.2f} | {len(resultados)}")
+
+
+if __name__ == "__main__":
+    main()
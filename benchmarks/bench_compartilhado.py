@@ -0,0 +1,137 @@
+"""
+50 sessões simultâneas reexecutando as páginas "Criador de Apps" e
+"Credenciais": cada rerun relendo os arquivos JSON (antes) contra a camada
+compartilhada, que só relê quando a fonte muda (agora). Durante a medição
+outra instância grava no banco e no arquivo, para exercitar a invalidação.
+
+Uso:
+    python -m benchmarks.bench_compartilhado --sessoes 50 --reruns 20
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+from armazenamento import ArmazemAgendamentos, gravar_json_atomico
+from benchmarks.dados_sinteticos import HORARIOS_PADRAO, PROFISSIONAIS, gerar_agendamentos_salao
+from compartilhado import ArquivoJSONCompartilhado, RecursoCompartilhado, VersaoBanco
+from disponibilidade import IndiceDisponibilidade
+from modelos import AgendamentoSalao
+
+
+def preparar(pasta, agendamentos):
+    banco = os.path.join(pasta, "salao.db")
+    armazem = ArmazemAgendamentos(banco)
+    registros = list(gerar_agendamentos_salao(agendamentos))
+    armazem.inserir_em_massa(registros)
+    caminho_json = os.path.join(pasta, "agendamentos_salao.json")
+    gravar_json_atomico(caminho_json, [ag.para_dict() for ag in registros])
+    caminho_credenciais = os.path.join(pasta, "credenciais.json")
+    gravar_json_atomico(caminho_credenciais, [
+        {"id": str(i), "plataforma": "Instagram", "usuario": f"conta{i}", "salva_em": "2024-01-01T00:00:00"}
+        for i in range(50)
+    ])
+    return banco, caminho_json, caminho_credenciais
+
+
+def medir(sessoes, reruns, pausa, rerun, escritor):
+    tempos = []
+    trava = threading.Lock()
+    parar = threading.Event()
+
+    def sessao(numero):
+        data = str(date(2024, 1, 1) + timedelta(days=numero % 30))
+        profissional = PROFISSIONAIS[numero % len(PROFISSIONAIS)]
+        locais = []
+        for _ in range(reruns):
+            inicio = time.perf_counter()
+            rerun(data, profissional)
+            locais.append(time.perf_counter() - inicio)
+            # Intervalo entre interações do usuário
+            time.sleep(pausa)
+        with trava:
+            tempos.extend(locais)
+
+    thread_escritor = threading.Thread(target=escritor, args=(parar,))
+    thread_escritor.start()
+    threads = [threading.Thread(target=sessao, args=(i,)) for i in range(sessoes)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    parar.set()
+    thread_escritor.join()
+    tempos.sort()
+    return statistics.median(tempos), tempos[int(len(tempos) * 0.95)]
+
+
+def criar_escritor(banco, caminho_credenciais, escritas):
+    """Outra instância do app: conexões e objetos próprios, gravando a cada 50 ms."""
+    def escrever(parar):
+        armazem = ArmazemAgendamentos(banco)
+        credenciais = ArquivoJSONCompartilhado(caminho_credenciais)
+        while not parar.wait(0.05):
+            n = escritas[0]
+            armazem.reservar(AgendamentoSalao(f"extra{n}", "2030-01-01", f"Extra{n}", HORARIOS_PADRAO[0]))
+            credenciais.atualizar(lambda lista: lista + [{"id": f"extra{n}", "plataforma": "TikTok", "usuario": "x"}])
+            escritas[0] += 1
+    return escrever
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessoes", type=int, default=50)
+    parser.add_argument("--reruns", type=int, default=20)
+    parser.add_argument("--agendamentos", type=int, default=20000)
+    parser.add_argument("--pausa", type=float, default=0.05, help="segundos entre reruns de uma sessão")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        banco, caminho_json, caminho_credenciais = preparar(pasta, args.agendamentos)
+        leituras = [0]
+
+        def rerun_antes(data, profissional):
+            # Como era: os dois arquivos relidos e percorridos a cada rerun
+            with open(caminho_credenciais, "r", encoding="utf-8") as f:
+                json.load(f)
+            with open(caminho_json, "r", encoding="utf-8") as f:
+                agendamentos = json.load(f)
+            leituras[0] += 2
+            ocupados = {a["horario"] for a in agendamentos if a["data"] == data and a["profissional"] == profissional}
+            return [h for h in HORARIOS_PADRAO if h not in ocupados]
+
+        p50, p95 = medir(args.sessoes, args.reruns, args.pausa, rerun_antes, lambda parar: parar.wait())
+        print(f"{args.sessoes} sessões × {args.reruns} reruns, {args.agendamentos} agendamentos")
+        print(f"antes: rerun p50 {p50 * 1000:.2f} ms, p95 {p95 * 1000:.2f} ms | "
+              f"{leituras[0]} leituras de arquivo")
+
+        armazem = ArmazemAgendamentos(banco)
+        indice = RecursoCompartilhado(
+            lambda: IndiceDisponibilidade.construir(armazem.ocupacoes()), VersaoBanco(banco)
+        )
+        credenciais = ArquivoJSONCompartilhado(caminho_credenciais)
+        escritas = [0]
+
+        def rerun_depois(data, profissional):
+            credenciais.obter()
+            return indice.obter().livres(data, profissional)
+
+        p50, p95 = medir(
+            args.sessoes, args.reruns, args.pausa, rerun_depois, criar_escritor(banco, caminho_credenciais, escritas)
+        )
+        print(f"agora: rerun p50 {p50 * 1000:.2f} ms, p95 {p95 * 1000:.2f} ms | "
+              f"{credenciais.construcoes} leituras de arquivo, {indice.construcoes} montagens do índice "
+              f"em {indice.verificacoes} reruns (outra instância gravou {escritas[0]} vezes)")
+
+        # A última gravação da outra instância tem que estar visível
+        with open(caminho_credenciais, "r", encoding="utf-8") as f:
+            assert len(credenciais.obter()) == len(json.load(f))
+        assert not indice.obter().esta_livre("2030-01-01", "Extra0", HORARIOS_PADRAO[0])
+
+
+if __name__ == "__main__":
+    main()
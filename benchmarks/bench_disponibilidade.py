@@ -0,0 +1,120 @@
+"""
+Agendas densas com serviços de durações diferentes: profissionais com
+grade de 5 minutos e expediente de 24 horas, dias quase lotados. Compara a
+checagem de conflito e a busca da próxima vaga de N minutos percorrendo
+todos os agendamentos do dia (antes) com as listas ordenadas e busca
+binária do IndiceDisponibilidade (agora).
+
+Uso:
+    python -m benchmarks.bench_disponibilidade --dias 200 --consultas 200000
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from disponibilidade import IndiceDisponibilidade
+from modelos import Profissional, formatar_horario, minutos
+
+DURACOES = (5, 5, 10, 15, 15, 30, 45, 60, 75, 150, 180)
+FIM_EXPEDIENTE = "23:55"
+PROFISSIONAIS = [Profissional(f"P{i}", (("00:00", FIM_EXPEDIENTE),), 5) for i in range(5)]
+
+
+def gerar_ocupacoes(dias, ocupacao, semente=42):
+    """Serviços encostados uns nos outros, com pequenas folgas, até `ocupacao` do dia."""
+    sorteio = random.Random(semente)
+    ocupacoes = []
+    for dia in range(dias):
+        data = str(date(2030, 1, 1) + timedelta(days=dia))
+        for profissional in PROFISSIONAIS:
+            atual = 0
+            while atual < 23 * 60:
+                if sorteio.random() < ocupacao:
+                    duracao = sorteio.choice(DURACOES)
+                    ocupacoes.append((data, profissional.nome, formatar_horario(atual), duracao))
+                    atual += duracao
+                else:
+                    atual += 5
+    return ocupacoes
+
+
+def por_dia(ocupacoes):
+    agenda = {}
+    for data, profissional, horario, duracao in ocupacoes:
+        inicio = minutos(horario)
+        agenda.setdefault((data, profissional), []).append((inicio, inicio + duracao))
+    return agenda
+
+
+def conflita_linear(intervalos, inicio, fim):
+    return any(a < fim and b > inicio for a, b in intervalos)
+
+
+def proxima_vaga_linear(intervalos, grade, duracao, depois_de):
+    for inicio, limite in grade:
+        if inicio >= depois_de and inicio + duracao <= limite and not conflita_linear(intervalos, inicio, inicio + duracao):
+            return formatar_horario(inicio)
+    return None
+
+
+def cronometrar(funcao, consultas):
+    inicio = time.perf_counter()
+    resultados = [funcao(*consulta) for consulta in consultas]
+    return (time.perf_counter() - inicio) / len(consultas) * 1e6, resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dias", type=int, default=200)
+    parser.add_argument("--ocupacao", type=float, default=0.9, help="chance de cada folga de 5 min virar serviço")
+    parser.add_argument("--consultas", type=int, default=200000)
+    args = parser.parse_args()
+
+    ocupacoes = gerar_ocupacoes(args.dias, args.ocupacao)
+    grades = {p.nome: p.grade() for p in PROFISSIONAIS}
+    inicio = time.perf_counter()
+    indice = IndiceDisponibilidade.construir(ocupacoes, grades=grades, grade_padrao=())
+    montagem = time.perf_counter() - inicio
+    agenda = por_dia(ocupacoes)
+    chaves = list(agenda)
+    media = len(ocupacoes) / len(chaves)
+    print(f"{len(ocupacoes)} agendamentos, {media:.0f} por profissional por dia; índice montado em {montagem:.2f} s")
+
+    sorteio = random.Random(1)
+    consultas = []
+    for _ in range(args.consultas):
+        data, profissional = sorteio.choice(chaves)
+        consultas.append((data, profissional, formatar_horario(sorteio.randrange(0, 23 * 60, 5)), sorteio.choice(DURACOES)))
+
+    limite = minutos(FIM_EXPEDIENTE)
+    antes, esperado = cronometrar(
+        lambda d, p, h, n: minutos(h) + n <= limite and not conflita_linear(agenda[(d, p)], minutos(h), minutos(h) + n),
+        consultas,
+    )
+    agora, obtido = cronometrar(indice.esta_livre, consultas)
+    assert esperado == obtido
+    print(f"conflito:       antes {antes:7.2f} µs | agora {agora:6.2f} µs por consulta")
+
+    consultas = consultas[: args.consultas // 20]
+    antes, esperado = cronometrar(
+        lambda d, p, h, n: proxima_vaga_linear(agenda[(d, p)], grades[p], n, minutos(h)), consultas
+    )
+    agora, obtido = cronometrar(lambda d, p, h, n: indice.proxima_vaga(d, p, n, h), consultas)
+    assert esperado == obtido
+    print(f"próxima vaga:   antes {antes:7.2f} µs | agora {agora:6.2f} µs por consulta")
+
+    antes, esperado = cronometrar(
+        lambda d, p, h, n: [
+            formatar_horario(i) for i, fim_periodo in grades[p]
+            if i + n <= fim_periodo and not conflita_linear(agenda[(d, p)], i, i + n)
+        ],
+        consultas[:1000],
+    )
+    agora, obtido = cronometrar(lambda d, p, h, n: indice.livres(d, p, n), consultas[:1000])
+    assert esperado == obtido
+    print(f"horários livres (grade de {len(grades['P0'])}): antes {antes / 1000:6.2f} ms | agora {agora / 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Exportação e importação de um milhão de agendamentos. Compara carregar
+tudo em memória (antes: carregar() + csv, leitura do arquivo inteiro e
+validação linha a linha) com o intercâmbio em lotes (agora: paginação pelo
+rowid na exportação; na importação, validação por coluna em Python ou
+vetorizada com pyarrow, gravando numa única transação que também confere
+sobreposição de horários).
+
+Cada operação roda duas vezes: uma para o tempo e outra, sob o
+tracemalloc, para o pico de memória (objetos Python somados ao pico do pool
+de memória do Arrow, quando ele é usado).
+
+Uso:
+    python -m benchmarks.bench_intercambio --linhas 1000000
+"""
+import argparse
+import csv
+import itertools
+import os
+import re
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+import intercambio
+from armazenamento import ArmazemAgendamentos
+from modelos import AgendamentoSalao
+
+PROFISSIONAIS = ("Ana", "Bruna", "Carla", "Diego", "Eduardo")
+HORARIOS = tuple(f"{h:02d}:{m:02d}" for h in range(9, 20) for m in (0, 30))
+
+
+def gerar(linhas):
+    por_dia = len(PROFISSIONAIS) * len(HORARIOS)
+    for i in range(linhas):
+        dia, resto = divmod(i, por_dia)
+        profissional, horario = divmod(resto, len(HORARIOS))
+        yield AgendamentoSalao(
+            f"ag{i}", str(date(2000, 1, 1) + timedelta(days=dia)), PROFISSIONAIS[profissional], HORARIOS[horario],
+            duracao=30, servico="Escova",
+        )
+
+
+def medir(funcao):
+    """(resultado, segundos, pico de memória em MiB)."""
+    inicio = time.perf_counter()
+    resultado = funcao()
+    segundos = time.perf_counter() - inicio
+    pool = intercambio.pa.default_memory_pool() if intercambio.pa is not None else None
+    if pool is not None:
+        pool.release_unused()
+    em_uso = pool.bytes_allocated() if pool is not None else 0
+    tracemalloc.start()
+    funcao()
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    if pool is not None:
+        pico += max(0, pool.max_memory() - em_uso)
+    return resultado, segundos, pico / 2**20
+
+
+def exportar_antes(armazem, caminho):
+    agendamentos = armazem.carregar()
+    with open(caminho, "w", encoding="utf-8", newline="") as f:
+        escritor = csv.writer(f)
+        escritor.writerow(intercambio.AGENDAMENTOS.colunas)
+        escritor.writerows(
+            (a.id, a.data, a.profissional, a.horario, a.status, a.duracao, a.servico) for a in agendamentos
+        )
+    return len(agendamentos)
+
+
+def importar_antes(armazem, caminho):
+    with open(caminho, encoding="utf-8", newline="") as f:
+        linhas = list(csv.DictReader(f))
+    data, horario = re.compile(intercambio.DATA), re.compile(intercambio.HORARIO)
+    validos = []
+    for linha in linhas:
+        if linha["id"] and data.match(linha["data"]) and horario.match(linha["horario"]) and linha["profissional"]:
+            validos.append(AgendamentoSalao(
+                linha["id"], linha["data"], linha["profissional"], linha["horario"],
+                linha["status"], int(linha["duracao"]), linha["servico"],
+            ))
+    armazem.inserir_em_massa(validos)
+    return len(validos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--linhas", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        origem = ArmazemAgendamentos(os.path.join(pasta, "origem.db"))
+        origem.inserir_em_massa(gerar(args.linhas))
+        csv_antes, csv_agora = os.path.join(pasta, "antes.csv"), os.path.join(pasta, "agora.csv")
+        parquet = os.path.join(pasta, "agora.parquet")
+        print(f"{args.linhas} agendamentos")
+        print(f"  {'operação':<40} {'segundos':>8} {'linhas/s':>10} {'pico (MiB)':>11}")
+
+        def linha(rotulo, funcao):
+            total, segundos, pico = medir(funcao)
+            assert total == args.linhas, (rotulo, total)
+            print(f"  {rotulo:<40} {segundos:>8.2f} {total / segundos:>10.0f} {pico:>11.1f}")
+
+        linha("exportar CSV (antes: tudo em memória)", lambda: exportar_antes(origem, csv_antes))
+        linha("exportar CSV (em lotes)", lambda: intercambio.exportar(intercambio.AGENDAMENTOS, origem.lotes(), csv_agora))
+        if intercambio.pa is not None:
+            linha("exportar Parquet (em lotes)",
+                  lambda: intercambio.exportar(intercambio.AGENDAMENTOS, origem.lotes(), parquet, "parquet"))
+        print(f"  tamanho: CSV {os.path.getsize(csv_agora) / 2**20:.1f} MiB"
+              + (f", Parquet {os.path.getsize(parquet) / 2**20:.1f} MiB" if intercambio.pa is not None else ""))
+
+        destinos = itertools.count()
+
+        def novo_armazem():
+            return ArmazemAgendamentos(os.path.join(pasta, f"destino{next(destinos)}.db"))
+
+        def importar(arquivo, **opcoes):
+            armazem = novo_armazem()
+            resultado = intercambio.importar(
+                intercambio.AGENDAMENTOS, arquivo, intercambio.gravar_agendamentos(armazem), **opcoes
+            )
+            assert resultado.rejeitados == 0 and armazem.contar() == resultado.importados
+            return resultado.importados
+
+        linha("importar CSV (antes: arquivo inteiro)", lambda: importar_antes(novo_armazem(), csv_agora))
+        linha("importar CSV (lotes, validação Python)", lambda: importar(csv_agora, vetorizado=False))
+        if intercambio.pa is not None:
+            linha("importar CSV (lotes, validação Arrow)", lambda: importar(csv_agora, vetorizado=True))
+            linha("importar Parquet (lotes, Arrow)", lambda: importar(parquet))
+
+
+if __name__ == "__main__":
+    main()
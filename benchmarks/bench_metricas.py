@@ -0,0 +1,63 @@
+"""
+Custo da instrumentação: registrar uma medição no buffer circular (50
+threads ao mesmo tempo, como sessões do Streamlit), calcular os percentis
+do painel e servir /metrics no formato do Prometheus.
+
+Uso:
+    python -m benchmarks.bench_metricas --medicoes 200000
+"""
+import argparse
+import random
+import threading
+import time
+import urllib.request
+
+from metricas import RegistroMetricas, servir_prometheus
+
+PAGINAS = ["Início", "Criador de Apps", "Chat da MSSP", "Produtos Afiliados (Europa)"]
+SECOES = ["disponibilidade", "contagem", "lista", "busca_catalogo"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--medicoes", type=int, default=200000)
+    parser.add_argument("--threads", type=int, default=50)
+    args = parser.parse_args()
+
+    registro = RegistroMetricas()
+    por_thread = args.medicoes // args.threads
+
+    def sessao(numero):
+        sorteio = random.Random(numero)
+        for _ in range(por_thread):
+            with registro.medir("secao", pagina=sorteio.choice(PAGINAS), secao=sorteio.choice(SECOES)):
+                pass
+
+    threads = [threading.Thread(target=sessao, args=(i,)) for i in range(args.threads)]
+    inicio = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    total = time.perf_counter() - inicio
+    medicoes = por_thread * args.threads
+    print(f"{medicoes} medições em {args.threads} threads: {total / medicoes * 1e6:.2f} µs por medição")
+
+    inicio = time.perf_counter()
+    resumo = registro.resumo()
+    print(f"resumo de {len(resumo)} séries: {(time.perf_counter() - inicio) * 1000:.2f} ms")
+
+    servidor = servir_prometheus(0, registro)
+    try:
+        url = f"http://127.0.0.1:{servidor.server_address[1]}/metrics"
+        inicio = time.perf_counter()
+        with urllib.request.urlopen(url) as resposta:
+            corpo = resposta.read().decode("utf-8")
+        print(f"GET /metrics: {(time.perf_counter() - inicio) * 1000:.2f} ms, {len(corpo)} bytes")
+        assert 'mssp_secao_segundos_count{pagina="Início",secao="lista"}' in corpo
+    finally:
+        servidor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Custo de montar a lista "Agendamentos Salvos" a cada rerun: lista completa
+ordenada em Python (antes) contra uma página lida do banco (agora).
+
+Mede o caminho de dados e a quantidade de elementos que seriam enviados ao
+navegador; o tempo de desenho do Streamlit é proporcional a esse número.
+
+Uso:
+    python -m benchmarks.bench_paginacao --registros 10000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from armazenamento import ArmazemAgendamentos
+from benchmarks.dados_sinteticos import gerar_agendamentos_salao
+
+ITENS_POR_PAGINA = 20
+
+
+def lista_completa(armazem):
+    agendamentos = sorted(armazem.carregar(), key=lambda x: (x.data, x.horario))
+    # Antes: markdown + separador por registro
+    elementos = []
+    for ag in agendamentos:
+        elementos.append(f"**{ag.profissional}** • {ag.data} às {ag.horario}")
+        elementos.append("---")
+    return elementos
+
+
+def lista_paginada(armazem, deslocamento):
+    armazem.contar()
+    elementos = []
+    for ag in armazem.listar(ITENS_POR_PAGINA, deslocamento):
+        # Agora: markdown + botão de cancelar por registro visível
+        elementos.append(f"**{ag.profissional}** • {ag.data} às {ag.horario}")
+        elementos.append(f"cancelar_{ag.id}")
+    return elementos
+
+
+def medir(funcao, repeticoes):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        elementos = funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1000, len(elementos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--registros", type=int, default=10000)
+    parser.add_argument("--repeticoes", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        armazem = ArmazemAgendamentos(os.path.join(pasta, "salao.db"))
+        armazem.inserir_em_massa(gerar_agendamentos_salao(args.registros))
+
+        resultados = [
+            ("lista completa", medir(lambda: lista_completa(armazem), args.repeticoes)),
+            ("primeira página", medir(lambda: lista_paginada(armazem, 0), args.repeticoes)),
+            ("última página", medir(lambda: lista_paginada(armazem, args.registros - ITENS_POR_PAGINA), args.repeticoes)),
+        ]
+        print(f"{args.registros} agendamentos")
+        print(f"{'modo':>16} | {'tempo (ms)':>10} | {'elementos':>9}")
+        for nome, (tempo, elementos) in resultados:
+            print(f"{nome:>16} | {tempo:>10.3f} | {elementos:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Custo de abrir cada página: importação a frio do módulo da página (num
+processo novo, como no primeiro acesso depois de um deploy) e tempo de
+rerun por interação, medido com o AppTest do Streamlit.
+
+A linha "todas as páginas" corresponde ao app antigo, em que o app.py
+importava tudo a cada início de processo, qualquer que fosse a página.
+
+Uso:
+    python -m benchmarks.bench_paginas --reruns 20
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from paginas import PAGINAS  # noqa: E402
+
+CODIGO_IMPORTACAO = """
+import importlib, sys, time
+inicio = time.perf_counter()
+import streamlit
+base = time.perf_counter()
+for modulo in sys.argv[1:]:
+    importlib.import_module(modulo)
+fim = time.perf_counter()
+print(f"{(base - inicio) * 1000:.1f} {(fim - base) * 1000:.1f}")
+"""
+
+
+def importacao_a_frio(modulos, pasta, repeticoes):
+    """Mediana (ms) de importar `modulos` num interpretador novo, descontado o import do streamlit."""
+    ambiente = dict(os.environ, PYTHONPATH=RAIZ)
+    tempos_streamlit, tempos_modulos = [], []
+    for _ in range(repeticoes):
+        saida = subprocess.run(
+            [sys.executable, "-c", CODIGO_IMPORTACAO, *modulos],
+            cwd=pasta, env=ambiente, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        tempos_streamlit.append(float(saida[0]))
+        tempos_modulos.append(float(saida[1]))
+    return statistics.median(tempos_streamlit), statistics.median(tempos_modulos)
+
+
+def reruns(pasta, reruns_por_pagina):
+    """(primeira abertura, mediana dos reruns seguintes) em ms, por página, via AppTest."""
+    from streamlit.testing.v1 import AppTest
+
+    os.chdir(pasta)  # bancos e arquivos do app ficam na pasta temporária
+    app = AppTest.from_file(os.path.join(RAIZ, "app.py"), default_timeout=60)
+    app.run()
+    resultados = {}
+    for pagina in PAGINAS:
+        inicio = time.perf_counter()
+        app.sidebar.radio[0].set_value(pagina).run()
+        primeira = time.perf_counter() - inicio
+        tempos = []
+        for _ in range(reruns_por_pagina):
+            inicio = time.perf_counter()
+            app.run()
+            tempos.append(time.perf_counter() - inicio)
+        if app.exception:
+            raise RuntimeError(f"{pagina}: {app.exception[0].value}")
+        resultados[pagina] = (primeira * 1000, statistics.median(tempos) * 1000)
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reruns", type=int, default=20, help="reruns medidos por página")
+    parser.add_argument("--repeticoes", type=int, default=5, help="processos novos por medição de importação")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        print("Importação a frio (processo novo, sem contar o import do streamlit)")
+        streamlit_ms = None
+        for pagina, modulo in PAGINAS.items():
+            streamlit_ms, modulo_ms = importacao_a_frio([modulo], pasta, args.repeticoes)
+            print(f"  {pagina:<30} {modulo_ms:8.1f} ms")
+        _, todas_ms = importacao_a_frio(list(PAGINAS.values()), pasta, args.repeticoes)
+        print(f"  {'todas as páginas (antes)':<30} {todas_ms:8.1f} ms")
+        print(f"  {'import streamlit':<30} {streamlit_ms:8.1f} ms")
+
+        print(f"\nRerun por página (AppTest, mediana de {args.reruns})")
+        print(f"  {'página':<30} {'abrir (ms)':>11} {'rerun (ms)':>11}")
+        for pagina, (primeira, rerun) in reruns(pasta, args.reruns).items():
+            print(f"  {pagina:<30} {primeira:11.1f} {rerun:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
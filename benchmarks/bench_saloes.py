@@ -0,0 +1,157 @@
+"""
+Teste de carga com 500 salões: sessões consultando a disponibilidade e
+reservando horários em todos os salões ao mesmo tempo, enquanto um salão
+movimentado grava sem parar. Compara todos os salões num único banco
+(antes) com um banco por salão (agora).
+
+Os nomes dos profissionais são únicos entre salões, para que o modo "um
+banco" possa guardar todos na mesma tabela.
+
+Uso:
+    python -m benchmarks.bench_saloes --saloes 500 --segundos 5
+"""
+import argparse
+import itertools
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+from armazenamento import ArmazemSaloes
+from modelos import AgendamentoSalao, Profissional, Salao
+from saloes import AgendaSaloes
+
+DURACOES = (15, 30, 45, 60)
+EXPEDIENTES = (
+    (("09:00", "13:00"), ("14:00", "20:00")),
+    (("08:00", "12:00"), ("13:00", "17:00")),
+    (("10:00", "19:00"),),
+    (("12:00", "22:00"),),
+)
+DATAS = [str(date(2030, 1, 1) + timedelta(days=i)) for i in range(7)]
+
+
+def gerar_saloes(quantidade, semente=42):
+    sorteio = random.Random(semente)
+    return [
+        Salao(
+            id=f"salao{t:04d}",
+            nome=f"Salão {t}",
+            profissionais=tuple(
+                Profissional(f"P{j}_s{t}", sorteio.choice(EXPEDIENTES), sorteio.choice(DURACOES))
+                for j in range(sorteio.randint(2, 8))
+            ),
+        )
+        for t in range(quantidade)
+    ]
+
+
+def preparar(pasta, saloes, um_banco, reservas_por_salao):
+    agenda = AgendaSaloes(ArmazemSaloes(os.path.join(pasta, "saloes.db")), pasta)
+    banco_unico = os.path.join(pasta, "todos.db") if um_banco else None
+    agenda.cadastro.inserir_em_massa((salao, banco_unico or agenda.caminho_padrao(salao.id)) for salao in saloes)
+    existentes = {salao.id: itertools.islice(reservas_existentes(salao), reservas_por_salao) for salao in saloes}
+    if um_banco:
+        # Uma carga só: recriar o índice único a cada salão seria quadrático
+        agenda.armazem(saloes[0].id).inserir_em_massa(itertools.chain.from_iterable(existentes.values()))
+    else:
+        for salao in saloes:
+            agenda.armazem(salao.id).inserir_em_massa(existentes[salao.id])
+    return agenda
+
+
+def reservas_existentes(salao):
+    """Todos os horários de todos os profissionais, dia após dia, em datas anteriores às da medição."""
+    for dia in itertools.count():
+        data = str(date(2029, 1, 1) + timedelta(days=dia))
+        for profissional in salao.profissionais:
+            for horario in profissional.horarios():
+                yield AgendamentoSalao(
+                    f"{salao.id}_{data}_{profissional.nome}_{horario}", data, profissional.nome, horario,
+                    duracao=profissional.duracao,
+                )
+
+
+def medir(agenda, saloes, threads, segundos):
+    """Interações (disponibilidade + reserva) por thread, cada thread atendendo uma parte dos salões."""
+    tempos, aceitas = [], [0]
+    trava = threading.Lock()
+    fim = time.perf_counter() + segundos
+    parar = threading.Event()
+
+    def sessoes(numero):
+        sorteio = random.Random(numero)
+        meus = saloes[numero::threads]
+        locais, minhas = [], 0
+        while time.perf_counter() < fim:
+            salao = sorteio.choice(meus)
+            profissional = sorteio.choice(salao.profissionais)
+            data = sorteio.choice(DATAS)
+            inicio = time.perf_counter()
+            livres = agenda.livres(salao.id, data, profissional.nome, profissional.duracao)
+            if livres:
+                agendamento = AgendamentoSalao(
+                    f"{salao.id}_{numero}_{len(locais)}", data, profissional.nome, sorteio.choice(livres),
+                    duracao=profissional.duracao,
+                )
+                minhas += agenda.reservar(salao.id, agendamento)
+            locais.append(time.perf_counter() - inicio)
+        with trava:
+            tempos.extend(locais)
+            aceitas[0] += minhas
+
+    def salao_movimentado():
+        # Grava o mais rápido que consegue, sempre no mesmo salão
+        salao = saloes[0]
+        sorteio = random.Random(0)
+        n = 0
+        while not parar.is_set():
+            profissional = sorteio.choice(salao.profissionais)
+            n += agenda.reservar(salao.id, AgendamentoSalao(
+                f"quente_{n}_{sorteio.random()}", str(date(2031, 1, 1) + timedelta(days=sorteio.randrange(3650))),
+                profissional.nome, sorteio.choice(profissional.horarios()), duracao=profissional.duracao,
+            ))
+        gravacoes[0] = n
+
+    gravacoes = [0]
+    escritor = threading.Thread(target=salao_movimentado)
+    escritor.start()
+    trabalhadores = [threading.Thread(target=sessoes, args=(i,)) for i in range(threads)]
+    for thread in trabalhadores:
+        thread.start()
+    for thread in trabalhadores:
+        thread.join()
+    parar.set()
+    escritor.join()
+    tempos.sort()
+    return len(tempos), aceitas[0], gravacoes[0], statistics.median(tempos), tempos[int(len(tempos) * 0.95)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--saloes", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--segundos", type=float, default=5)
+    parser.add_argument("--reservas", type=int, default=200, help="reservas existentes por salão")
+    args = parser.parse_args()
+
+    saloes = gerar_saloes(args.saloes)
+    print(f"{args.saloes} salões, {sum(len(s.profissionais) for s in saloes)} profissionais, "
+          f"{args.reservas} reservas cada; {args.threads} threads por {args.segundos:g} s, salão 0 gravando sem parar")
+    print(f"  {'modo':<20} {'interações':>10} {'aceitas':>8} {'salão 0':>8} {'p50 (ms)':>9} {'p95 (ms)':>9}")
+    for rotulo, um_banco in (("um banco (antes)", True), ("um banco por salão", False)):
+        with tempfile.TemporaryDirectory() as pasta:
+            agenda = preparar(pasta, saloes, um_banco, args.reservas)
+            interacoes, aceitas, gravacoes, p50, p95 = medir(agenda, saloes, args.threads, args.segundos)
+            if not um_banco:
+                # Cada reserva aceita está no banco do seu salão, sem horário duplicado
+                confirmadas = sum(len(agenda.armazem(s.id).ocupacoes()) for s in saloes)
+                assert confirmadas == args.saloes * args.reservas + aceitas + gravacoes, confirmadas
+            print(f"  {rotulo:<20} {interacoes:>10} {aceitas:>8} {gravacoes:>8} {p50 * 1000:>9.2f} {p95 * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
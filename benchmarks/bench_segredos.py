@@ -0,0 +1,83 @@
+"""
+Resolução de credenciais num laço de publicação: consultar o provedor a
+cada chamada (antes: montar o nome da variável e ler o ambiente, ou
+decifrar o arquivo de segredos) contra o ResolvedorCredenciais com cache
+em memória (agora). Mostra também quantas consultas chegaram ao provedor
+com várias threads publicando ao mesmo tempo.
+
+Uso:
+    python -m benchmarks.bench_segredos --consultas 200000
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+import segredos
+from agendador import PLATAFORMAS_POSTAGEM
+from segredos import ProvedorAmbiente, ProvedorMemoria, ResolvedorCredenciais, nome_segredo
+
+
+def cronometrar(funcao, consultas):
+    inicio = time.perf_counter()
+    for i in range(consultas):
+        funcao(PLATAFORMAS_POSTAGEM[i % len(PLATAFORMAS_POSTAGEM)])
+    return (time.perf_counter() - inicio) / consultas * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--consultas", type=int, default=200000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    senhas = {nome_segredo(p): f"senha-{p}" for p in PLATAFORMAS_POSTAGEM}
+    os.environ.update(senhas)
+    ambiente = ProvedorAmbiente()
+    # rótulo -> (provedor, consulta sem cache)
+    provedores = {"ambiente": (ambiente, ambiente.obter)}
+    pasta = tempfile.TemporaryDirectory()
+    if segredos.Fernet is not None:
+        arquivo = segredos.ProvedorArquivoCriptografado(
+            os.path.join(pasta.name, "segredos.enc"), segredos.Fernet.generate_key()
+        )
+        for nome, valor in senhas.items():
+            arquivo.gravar(nome, valor)
+        # Sem cache, o arquivo seria lido e decifrado a cada consulta
+        provedores["arquivo"] = (arquivo, lambda nome: arquivo._ler().get(nome))
+    else:
+        print("(cryptography não instalado: sem o provedor de arquivo)")
+
+    print(f"{args.consultas} consultas, {len(PLATAFORMAS_POSTAGEM)} plataformas")
+    for rotulo, (provedor, sem_cache) in provedores.items():
+        consultas = args.consultas if rotulo == "ambiente" else args.consultas // 100
+        antes = cronometrar(lambda p: sem_cache(nome_segredo(p)), consultas)
+        resolvedor = ResolvedorCredenciais([provedor])
+        agora = cronometrar(resolvedor.obter, args.consultas)
+        print(f"  {rotulo:<9} antes {antes:9.2f} µs | agora {agora:5.2f} µs por consulta")
+
+    memoria = ProvedorMemoria(senhas)
+    resolvedor = ResolvedorCredenciais([memoria], validade=0.05)
+    fim = time.perf_counter() + 1.0
+    totais = []
+
+    def publicar():
+        n = 0
+        while time.perf_counter() < fim:
+            assert resolvedor.obter(PLATAFORMAS_POSTAGEM[n % len(PLATAFORMAS_POSTAGEM)]) is not None
+            n += 1
+        totais.append(n)
+
+    threads = [threading.Thread(target=publicar) for _ in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f"  {args.threads} threads por 1 s, validade de 50 ms: {sum(totais)} consultas, "
+          f"{memoria.consultas} chegaram ao provedor")
+    pasta.cleanup()
+
+
+if __name__ == "__main__":
+    main()
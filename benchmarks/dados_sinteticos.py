@@ -0,0 +1,25 @@
+"""Geradores de dados sintéticos usados pelos benchmarks."""
+from datetime import date, timedelta
+
+from modelos import AgendamentoSalao
+
+PROFISSIONAIS = ["Ana", "Bruna", "Carla", "Diego", "Eduardo"]
+# Horários de hora em hora da grade antiga: um agendamento por horário
+HORARIOS_PADRAO = [
+    "09:00", "10:00", "11:00", "12:00",
+    "14:00", "15:00", "16:00", "17:00", "18:00", "19:00"
+]
+
+
+def gerar_agendamentos_salao(quantidade, inicio=date(2024, 1, 1)):
+    """Preenche os dias em sequência, todos os horários de todos os profissionais."""
+    por_dia = len(PROFISSIONAIS) * len(HORARIOS_PADRAO)
+    for i in range(quantidade):
+        dia, resto = divmod(i, por_dia)
+        prof, hora = divmod(resto, len(HORARIOS_PADRAO))
+        yield AgendamentoSalao(
+            id=f"bench_{i:08d}",
+            data=str(inicio + timedelta(days=dia)),
+            profissional=PROFISSIONAIS[prof],
+            horario=HORARIOS_PADRAO[hora],
+        )
@@ -0,0 +1,109 @@
+"""
+Teste de estresse de reservas concorrentes em vários processos.
+
+Vários processos disputam os mesmos horários ao mesmo tempo, com serviços
+de durações diferentes começando a cada 15 minutos. Ao final verifica que
+nenhuma reserva aceita se perdeu e que nenhum par de agendamentos
+confirmados do mesmo profissional se sobrepõe.
+
+Uso:
+    python -m benchmarks.stress_reservas --processos 8 --tentativas 200
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+from armazenamento import ArmazemAgendamentos
+from modelos import SERVICOS_PADRAO, AgendamentoSalao, formatar_horario, minutos
+
+PROFISSIONAIS = ["Ana", "Bruna", "Carla"]
+DATAS = ["2025-03-01", "2025-03-08"]
+INICIO_EXPEDIENTE, FIM_EXPEDIENTE = 9 * 60, 19 * 60
+# Para cada serviço, os inícios (a cada 15 minutos) em que ele termina dentro do expediente
+INICIOS = {
+    servico.nome: [
+        formatar_horario(inicio) for inicio in range(INICIO_EXPEDIENTE, FIM_EXPEDIENTE - servico.duracao + 1, 15)
+    ]
+    for servico in SERVICOS_PADRAO
+}
+
+
+def disputar(args):
+    caminho, processo, tentativas, inicio = args
+    armazem = ArmazemAgendamentos(caminho)
+    sorteio = random.Random(processo)
+    while time.time() < inicio:
+        time.sleep(0.001)
+    aceitos = []
+    for i in range(tentativas):
+        servico = sorteio.choice(SERVICOS_PADRAO)
+        agendamento = AgendamentoSalao(
+            id=f"p{processo}_{i}",
+            data=sorteio.choice(DATAS),
+            profissional=sorteio.choice(PROFISSIONAIS),
+            horario=sorteio.choice(INICIOS[servico.nome]),
+            duracao=servico.duracao,
+            servico=servico.nome,
+        )
+        if armazem.reservar(agendamento):
+            aceitos.append(agendamento.id)
+    armazem.fechar()
+    return aceitos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--processos", type=int, default=8)
+    parser.add_argument("--tentativas", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "reservas.db")
+        ArmazemAgendamentos(caminho).fechar()
+        inicio = time.time() + 0.5
+        tarefas = [(caminho, p, args.tentativas, inicio) for p in range(args.processos)]
+
+        comeco = time.perf_counter()
+        with multiprocessing.Pool(args.processos) as pool:
+            resultados = pool.map(disputar, tarefas)
+        duracao = time.perf_counter() - comeco
+
+        aceitos = {id_ for lista in resultados for id_ in lista}
+        armazem = ArmazemAgendamentos(caminho)
+        gravados = {ag.id: ag for ag in armazem.carregar()}
+        por_profissional = {}
+        for ag in gravados.values():
+            if ag.status == "confirmado":
+                por_profissional.setdefault((ag.data, ag.profissional), []).append(ag)
+
+        # Em ordem de início, cada agendamento tem de começar depois do fim do anterior
+        sobrepostos = []
+        for agendamentos in por_profissional.values():
+            agendamentos.sort(key=lambda ag: minutos(ag.horario))
+            for anterior, seguinte in zip(agendamentos, agendamentos[1:]):
+                if minutos(seguinte.horario) < minutos(anterior.horario) + anterior.duracao:
+                    sobrepostos.append((anterior, seguinte))
+
+        perdidos = aceitos - gravados.keys()
+        fantasmas = gravados.keys() - aceitos
+        reservados = sum(ag.duracao for ag in gravados.values())
+        expediente = len(DATAS) * len(PROFISSIONAIS) * (FIM_EXPEDIENTE - INICIO_EXPEDIENTE)
+
+        total = args.processos * args.tentativas
+        print(f"tentativas: {total} em {duracao:.2f}s ({total / duracao:.0f}/s)")
+        print(f"aceitas: {len(aceitos)}, {reservados} de {expediente} minutos reservados")
+        print(f"perdidas: {len(perdidos)} | não reconhecidas: {len(fantasmas)} | sobreposições: {len(sobrepostos)}")
+        for anterior, seguinte in sobrepostos[:10]:
+            print(f"  {anterior.data} {anterior.profissional}: {anterior.horario}-{anterior.fim} e "
+                  f"{seguinte.horario}-{seguinte.fim}")
+
+        if perdidos or fantasmas or sobrepostos:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
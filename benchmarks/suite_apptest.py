@@ -0,0 +1,370 @@
+"""
+Suíte de desempenho do app inteiro com o AppTest do Streamlit. Gera dados
+sintéticos do tamanho pedido, percorre as páginas com interações
+roteirizadas (abrir, rerun, reservar, salvar, buscar, enviar...) e mede,
+por interação: a latência do rerun (p50 e p95), o pico de memória alocada
+durante a interação (tracemalloc, numa repetição à parte) e a E/S do
+processo (bytes lidos e gravados, de /proc/self/io; só no Linux). O roteiro
+inteiro roda várias vezes (--rodadas) e cada métrica é a mediana das
+rodadas: uma pausa da máquina no meio de uma rodada não vira regressão.
+
+Os resultados podem ser gravados como base (JSON, com os limites de
+regressão) e comparados nas execuções seguintes: o processo sai com código
+1 se alguma interação piorar além do limite.
+
+Os dados são gerados nos formatos de arquivo do app original (JSON misto de
+agendamentos, credenciais.json), que a versão atual migra ao abrir. Com
+--raiz apontando para outra cópia do repositório, a mesma suíte mede outra
+versão do app, por exemplo o comportamento original de arquivos JSON
+inteiros (base em benchmarks/base_apptest_json.json; gerada com
+--postagens 0 --rodadas 1, porque o app original quebra com postagens e
+agendamentos do salão no mesmo arquivo, e o "salvar" do Agendador grava
+uma postagem que quebra a rodada seguinte). Interações que levantam exceção são gravadas
+como erro e ficam fora da comparação.
+
+Uso:
+    python -m benchmarks.suite_apptest --comparar benchmarks/base_apptest.json
+    python -m benchmarks.suite_apptest --agendamentos 20000 --salvar-base /tmp/base.json
+    git worktree add /tmp/mssp-original <commit inicial>
+    python -m benchmarks.suite_apptest --raiz /tmp/mssp-original --postagens 0 --rodadas 1 \
+        --salvar-base benchmarks/base_apptest_json.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Mesmos valores do app (repetidos aqui: a suíte não importa módulos do app,
+# para poder medir outra cópia do repositório com --raiz)
+PROFISSIONAIS = ("Ana", "Bruna", "Carla", "Diego", "Eduardo")
+HORARIOS = ("09:00", "10:00", "11:00", "12:00", "14:00", "15:00", "16:00", "17:00", "18:00", "19:00")
+PLATAFORMAS_POSTAGEM = ("Instagram", "TikTok", "Facebook", "Shopify Blog")
+PLATAFORMAS_CREDENCIAIS = ("Instagram", "TikTok", "Facebook", "Email", "Afiliados")
+TERMOS_BUSCA = ("fone bluetooth", "relógio smart", "garrafa térmica", "mochila", "carregador")
+
+LIMITES_PADRAO = {
+    "latencia": 1.25,    # p50 pode crescer até 25%...
+    "folga_ms": 20.0,    # ...mais 20 ms (interações de ~100 ms oscilam bem mais que 2 ms)
+    "memoria": 1.30,
+    "io": 1.50,
+    "folga_kib": 64.0,
+}
+
+
+# ==============================
+# Dados sintéticos
+# ==============================
+def gerar_dados(pasta, agendamentos, postagens, credenciais, mensagens, semente=42):
+    """Arquivos de dados do app em `pasta`; os agendamentos do salão ficam em datas passadas."""
+    sorteio = random.Random(semente)
+    por_dia = len(PROFISSIONAIS) * len(HORARIOS)
+    primeiro_dia = date.today() - timedelta(days=agendamentos // por_dia + 1)
+    registros = []
+    for i in range(agendamentos):
+        dia, resto = divmod(i, por_dia)
+        profissional, horario = divmod(resto, len(HORARIOS))
+        registros.append({
+            "id": f"salao_{i:08d}", "data": str(primeiro_dia + timedelta(days=dia)),
+            "profissional": PROFISSIONAIS[profissional], "horario": HORARIOS[horario], "status": "confirmado",
+        })
+    inicio = datetime(2024, 1, 1)
+    for i in range(postagens):
+        registros.append({
+            "id": f"postagem_{i:08d}", "data_criacao": (inicio + timedelta(minutes=i)).isoformat(),
+            "plataforma": sorteio.choice(PLATAFORMAS_POSTAGEM), "tipo_conteudo": f"conteúdo {i}",
+            "horarios": sorted(sorteio.sample(("09:00", "15:00", "21:00"), 2)),
+        })
+    with open(os.path.join(pasta, "agendamentos_salao.json"), "w", encoding="utf-8") as f:
+        json.dump(registros, f, ensure_ascii=False, indent=2)
+
+    with open(os.path.join(pasta, "credenciais.json"), "w", encoding="utf-8") as f:
+        json.dump([
+            {
+                "id": f"cred_{i:06d}", "plataforma": sorteio.choice(PLATAFORMAS_CREDENCIAIS),
+                "usuario": f"usuario{i}", "salva_em": (inicio + timedelta(hours=i)).isoformat(),
+            }
+            for i in range(credenciais)
+        ], f, ensure_ascii=False, indent=2)
+
+    with open(os.path.join(pasta, "historico_conversas.jsonl"), "w", encoding="utf-8") as f:
+        for i in range(mensagens):
+            tipo = "usuario_texto" if i % 2 == 0 else "ia_resposta"
+            f.write(json.dumps({
+                "id": uuid.UUID(int=sorteio.getrandbits(128)).hex, "tipo": tipo,
+                "conteudo": f"mensagem sintética {i}", "data_hora": (inicio + timedelta(seconds=i)).isoformat(),
+            }, ensure_ascii=False) + "\n")
+
+
+# ==============================
+# Roteiro de interações
+# ==============================
+@dataclass
+class Interacao:
+    pagina: str
+    nome: str
+    executar: object          # (app, i) -> termina com um run(); é o que é medido
+    preparar: object = None   # (app, i) -> ajustes de widgets, fora da medição
+
+
+def _rotulado(elementos, rotulo):
+    for elemento in elementos:
+        if elemento.label == rotulo:
+            return elemento
+    raise LookupError(f"Widget {rotulo!r} não encontrado")
+
+
+def _botao(app, prefixo):
+    for botao in app.button:
+        if botao.label.startswith(prefixo):
+            return botao
+    raise LookupError(f"Botão {prefixo!r} não encontrado")
+
+
+def _ir_para(app, pagina):
+    app.sidebar.radio[0].set_value(pagina).run()
+
+
+def _abrir(pagina):
+    # Mede a troca de página; a página anterior é sempre o Início
+    return [
+        Interacao(pagina, "abrir", lambda app, i: _ir_para(app, pagina), lambda app, i: _ir_para(app, "Início")),
+        Interacao(pagina, "rerun", lambda app, i: app.run()),
+    ]
+
+
+def _preparar_reserva(app, i):
+    # Um profissional e um dia diferentes a cada repetição: sempre há horário livre
+    _rotulado(app.date_input, "Data:").set_value(date.today() + timedelta(days=1 + i // len(PROFISSIONAIS)))
+    _rotulado(app.selectbox, "Cabeleireiro(a):").set_value(PROFISSIONAIS[i % len(PROFISSIONAIS)])
+    app.run()
+
+
+def _preparar_credencial(app, i):
+    _rotulado(app.text_input, "Usuário/Login:").set_value(f"suite{i}")
+    _rotulado(app.text_input, "Senha:").set_value("senha-da-suite")
+
+
+def roteiro():
+    return [
+        *_abrir("Criador de Apps"),
+        Interacao("Criador de Apps", "reservar",
+                  lambda app, i: _botao(app, "✅ Confirmar Agendamento").click().run(), _preparar_reserva),
+        *_abrir("Agendador de Postagens"),
+        Interacao("Agendador de Postagens", "salvar",
+                  lambda app, i: _botao(app, "💾 Salvar Agendamento").click().run(),
+                  lambda app, i: _rotulado(app.text_input, "Tipo de conteúdo:").set_value(f"oferta {i}")),
+        *_abrir("Produtos Afiliados (Europa)"),
+        Interacao("Produtos Afiliados (Europa)", "buscar",
+                  lambda app, i: _botao(app, "🔍 Buscar produtos").click().run(),
+                  lambda app, i: _rotulado(app.text_input, "Palavra-chave do produto:").set_value(
+                      TERMOS_BUSCA[i % len(TERMOS_BUSCA)])),
+        *_abrir("Chat da MSSP"),
+        Interacao("Chat da MSSP", "enviar",
+                  lambda app, i: _botao(app, "📤 Enviar").click().run(),
+                  lambda app, i: app.text_input(key="input_fixo").set_value(f"Como vender na Europa? ({i % 3})")),
+        *_abrir("Credenciais"),
+        Interacao("Credenciais", "salvar",
+                  lambda app, i: _botao(app, "💾 Salvar com segurança").click().run(), _preparar_credencial),
+        Interacao("Credenciais", "usar", lambda app, i: _botao(app, "🔍 Usar credencial").click().run()),
+    ]
+
+
+# ==============================
+# Medição
+# ==============================
+def _io_processo():
+    """(bytes lidos, bytes gravados) pelo processo até agora, ou None fora do Linux."""
+    try:
+        with open("/proc/self/io") as f:
+            campos = dict(linha.split(": ") for linha in f.read().splitlines())
+        return int(campos["rchar"]), int(campos["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def medir(app, interacao, repeticoes, primeira=0):
+    """Uma rodada de `repeticoes` execuções; `primeira` numera as repetições entre rodadas."""
+    tempos, lidos, gravados = [], [], []
+    for i in range(primeira, primeira + repeticoes + 1):
+        if interacao.preparar:
+            interacao.preparar(app, i)
+        rastrear = i == primeira + repeticoes  # a última repetição só mede memória (o tracemalloc atrasa)
+        if rastrear:
+            tracemalloc.start()
+        io_antes = _io_processo()
+        inicio = time.perf_counter()
+        interacao.executar(app, i)
+        duracao = time.perf_counter() - inicio
+        io_depois = _io_processo()
+        if rastrear:
+            pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        else:
+            tempos.append(duracao)
+            if io_antes and io_depois:
+                lidos.append(io_depois[0] - io_antes[0])
+                gravados.append(io_depois[1] - io_antes[1])
+        if app.exception:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            return {"erro": str(app.exception[0].value).splitlines()[0][:200]}
+    tempos.sort()
+    return {
+        "p50_ms": round(statistics.median(tempos) * 1000, 2),
+        "p95_ms": round(tempos[min(len(tempos) - 1, round(0.95 * (len(tempos) - 1)))] * 1000, 2),
+        "memoria_kib": round(pico / 1024, 1),
+        "leitura_kib": round(statistics.median(lidos) / 1024, 1) if lidos else None,
+        "escrita_kib": round(statistics.median(gravados) / 1024, 1) if gravados else None,
+    }
+
+
+def _mediana(rodadas, metrica):
+    valores = [r[metrica] for r in rodadas if r[metrica] is not None]
+    return round(statistics.median(valores), 2 if metrica.endswith("_ms") else 1) if valores else None
+
+
+def executar_suite(raiz, repeticoes, filtro=None, rodadas=1):
+    from streamlit.testing.v1 import AppTest
+
+    sys.path.insert(0, raiz)
+    app = AppTest.from_file(os.path.join(raiz, "app.py"), default_timeout=120)
+    app.run()
+    medicoes = {}
+    for rodada in range(rodadas):
+        pagina_atual = None
+        for interacao in roteiro():
+            if filtro and interacao.pagina not in filtro:
+                continue
+            chave = f"{interacao.pagina} / {interacao.nome}"
+            anteriores = medicoes.setdefault(chave, [])
+            if anteriores and "erro" in anteriores[-1]:
+                continue
+            if interacao.pagina != pagina_atual:
+                # Primeira abertura (importação, migração, montagem de caches) fora da medição
+                _ir_para(app, interacao.pagina)
+                pagina_atual = interacao.pagina
+            try:
+                # Repetições numeradas sem repetir entre rodadas: cada reserva cai num horário livre
+                anteriores.append(medir(app, interacao, repeticoes, rodada * (repeticoes + 1)))
+            except LookupError as erro:
+                anteriores.append({"erro": str(erro)})
+            if "erro" in anteriores[-1]:
+                _ir_para(app, interacao.pagina)
+    resultados = {}
+    for chave, medidas in medicoes.items():
+        if "erro" in medidas[-1]:
+            resultados[chave] = medidas[-1]
+        else:
+            resultados[chave] = {metrica: _mediana(medidas, metrica) for metrica in medidas[0]}
+    return resultados
+
+
+# ==============================
+# Base e comparação
+# ==============================
+def comparar(base, resultados):
+    """Linhas (interação, métrica, base, agora, razão, regrediu) das interações presentes nos dois."""
+    limites = {**LIMITES_PADRAO, **base.get("limites", {})}
+    linhas = []
+    for chave, atual in resultados.items():
+        anterior = base["interacoes"].get(chave)
+        if not anterior or "erro" in anterior or "erro" in atual:
+            continue
+        io_anterior = (anterior["leitura_kib"] or 0) + (anterior["escrita_kib"] or 0)
+        io_atual = (atual["leitura_kib"] or 0) + (atual["escrita_kib"] or 0)
+        for metrica, antes, agora, fator, folga in (
+            ("p50 (ms)", anterior["p50_ms"], atual["p50_ms"], limites["latencia"], limites["folga_ms"]),
+            ("memória (KiB)", anterior["memoria_kib"], atual["memoria_kib"], limites["memoria"], limites["folga_kib"]),
+            ("E/S (KiB)", io_anterior, io_atual, limites["io"], limites["folga_kib"]),
+        ):
+            razao = agora / antes if antes else None
+            linhas.append((chave, metrica, antes, agora, razao, agora > antes * fator + folga))
+    return linhas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--raiz", default=RAIZ, help="cópia do repositório a medir (padrão: esta)")
+    parser.add_argument("--agendamentos", type=int, default=5000, help="agendamentos do salão existentes")
+    parser.add_argument("--postagens", type=int, default=1000)
+    parser.add_argument("--credenciais", type=int, default=100)
+    parser.add_argument("--mensagens", type=int, default=1000, help="mensagens no histórico de conversas")
+    parser.add_argument("--repeticoes", type=int, default=20, help="repetições medidas por interação, em cada rodada")
+    parser.add_argument("--rodadas", type=int, default=3, help="passadas pelo roteiro; vale a mediana delas")
+    parser.add_argument("--paginas", nargs="*", help="só estas páginas")
+    parser.add_argument("--salvar-base", metavar="JSON", help="grava os resultados como nova base")
+    parser.add_argument("--comparar", metavar="JSON", help="compara com uma base e sai com 1 se houver regressão")
+    for nome, valor in LIMITES_PADRAO.items():
+        parser.add_argument(f"--limite-{nome.replace('_', '-')}", dest=nome, type=float, default=valor,
+                            help=f"gravado na base (padrão {valor})")
+    args = parser.parse_args()
+
+    raiz = os.path.abspath(args.raiz)
+    # A suíte roda numa pasta temporária: caminhos relativos valem a partir daqui
+    salvar_base = args.salvar_base and os.path.abspath(args.salvar_base)
+    base_comparada = args.comparar and os.path.abspath(args.comparar)
+    parametros = {
+        "agendamentos": args.agendamentos, "postagens": args.postagens, "credenciais": args.credenciais,
+        "mensagens": args.mensagens, "repeticoes": args.repeticoes,
+        "rodadas": args.rodadas,
+    }
+    with tempfile.TemporaryDirectory() as pasta:
+        gerar_dados(pasta, args.agendamentos, args.postagens, args.credenciais, args.mensagens)
+        os.chdir(pasta)  # bancos e arquivos do app ficam na pasta temporária
+        resultados = executar_suite(raiz, args.repeticoes, args.paginas, args.rodadas)
+
+    print(f"{raiz}: {', '.join(f'{k}={v}' for k, v in parametros.items())}")
+    print(f"  {'interação':<42} {'p50 (ms)':>9} {'p95 (ms)':>9} {'memória (KiB)':>14} {'lido (KiB)':>11} {'gravado (KiB)':>14}")
+    for chave, r in resultados.items():
+        if "erro" in r:
+            print(f"  {chave:<42} erro: {r['erro']}")
+            continue
+        print(f"  {chave:<42} {r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['memoria_kib']:>14.1f} "
+              f"{r['leitura_kib'] if r['leitura_kib'] is not None else '—':>11} "
+              f"{r['escrita_kib'] if r['escrita_kib'] is not None else '—':>14}")
+
+    if salvar_base:
+        import streamlit
+        base = {
+            "gerado_em": datetime.now().isoformat(timespec="seconds"),
+            "ambiente": {"python": platform.python_version(), "streamlit": streamlit.__version__,
+                         "sistema": platform.platform()},
+            "parametros": parametros,
+            "limites": {nome: getattr(args, nome) for nome in LIMITES_PADRAO},
+            "interacoes": resultados,
+        }
+        with open(salvar_base, "w", encoding="utf-8") as f:
+            json.dump(base, f, ensure_ascii=False, indent=2)
+        print(f"Base gravada em {salvar_base}.")
+
+    if base_comparada:
+        with open(base_comparada, encoding="utf-8") as f:
+            base = json.load(f)
+        if base.get("parametros") != parametros:
+            print(f"Aviso: a base foi gerada com {base.get('parametros')}")
+        linhas = comparar(base, resultados)
+        regressoes = [linha for linha in linhas if linha[5]]
+        print(f"\nComparação com {base_comparada}")
+        for chave, metrica, antes, agora, razao, regrediu in linhas:
+            marca = "REGRESSÃO" if regrediu else ""
+            print(f"  {chave:<42} {metrica:<14} {antes:>10.1f} -> {agora:>10.1f} "
+                  f"{f'{razao:.2f}x' if razao is not None else '—':>7} {marca}")
+        if regressoes:
+            print(f"{len(regressoes)} regressões além dos limites.")
+            sys.exit(1)
+        print("Nenhuma regressão além dos limites.")
+
+
+if __name__ == "__main__":
+    main()
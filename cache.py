@@ -0,0 +1,104 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from armazenamento import gravar_json_atomico
+
+# ==============================
+# Cache LRU com validade (TTL)
+# ==============================
+# Guarda até `capacidade` itens; o menos usado sai primeiro. Itens mais
+# velhos que `ttl` segundos são descartados na leitura. Opcionalmente é
+# persistido em JSON para sobreviver a reinícios do app.
+
+
+class CacheLRU:
+    """Cache LRU + TTL com contadores de acertos e falhas."""
+
+    def __init__(self, capacidade=500, ttl=None, caminho=None, salvar_a_cada=20, relogio=time.time):
+        self.capacidade = capacidade
+        self.ttl = ttl
+        self.caminho = caminho
+        self.salvar_a_cada = salvar_a_cada
+        self._relogio = relogio
+        self._itens = OrderedDict()  # chave -> (momento de gravação, valor)
+        self._trava = threading.Lock()
+        self._alteracoes = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.expirados = 0
+        if caminho:
+            self._carregar()
+
+    def _expirado(self, momento, agora):
+        return self.ttl is not None and agora - momento > self.ttl
+
+    def obter(self, chave, padrao=None):
+        with self._trava:
+            entrada = self._itens.get(chave)
+            if entrada is not None:
+                momento, valor = entrada
+                if not self._expirado(momento, self._relogio()):
+                    self._itens.move_to_end(chave)
+                    self.acertos += 1
+                    return valor
+                del self._itens[chave]
+                self.expirados += 1
+            self.falhas += 1
+            return padrao
+
+    def guardar(self, chave, valor):
+        with self._trava:
+            self._itens[chave] = (self._relogio(), valor)
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.capacidade:
+                self._itens.popitem(last=False)
+            self._alteracoes += 1
+            deve_salvar = self.caminho and self._alteracoes >= self.salvar_a_cada
+        if deve_salvar:
+            self.salvar()
+
+    def limpar(self):
+        with self._trava:
+            self._itens.clear()
+            self.acertos = self.falhas = self.expirados = 0
+        if self.caminho:
+            self.salvar()
+
+    def __len__(self):
+        return len(self._itens)
+
+    def estatisticas(self):
+        consultas = self.acertos + self.falhas
+        return {
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "expirados": self.expirados,
+            "itens": len(self._itens),
+            "capacidade": self.capacidade,
+            "taxa_acerto": self.acertos / consultas if consultas else 0.0,
+        }
+
+    # ------------------------------
+    # Persistência
+    # ------------------------------
+    def salvar(self):
+        with self._trava:
+            dados = [[chave, momento, valor] for chave, (momento, valor) in self._itens.items()]
+            self._alteracoes = 0
+        gravar_json_atomico(self.caminho, dados)
+
+    def _carregar(self):
+        if not os.path.exists(self.caminho):
+            return
+        try:
+            with open(self.caminho, "r", encoding="utf-8") as f:
+                dados = json.load(f)
+        except Exception:
+            return
+        agora = self._relogio()
+        for chave, momento, valor in dados[-self.capacidade:]:
+            if not self._expirado(momento, agora):
+                self._itens[chave] = (momento, valor)
@@ -0,0 +1,273 @@
+import csv
+import io
+import json
+import re
+import unicodedata
+from functools import lru_cache
+
+from afiliados import Produto
+from armazenamento import TAMANHO_LOTE, BancoSQLite
+
+# ==============================
+# Catálogo local de produtos (SQLite FTS5)
+# ==============================
+# Feeds dos provedores (CSV ou JSON Lines) são lidos em lotes e indexados
+# num índice invertido FTS5. O tokenizador unicode61 com remove_diacritics
+# ignora acentos, então "relogio" encontra "relógio", "montre" encontra
+# "montré" etc. (português, espanhol, francês, alemão e italiano).
+
+# Nomes de campos aceitos nos feeds -> campo do catálogo
+APELIDOS_CAMPOS = {
+    "id": "id", "sku": "id", "product_id": "id",
+    "nome": "nome", "name": "nome", "title": "nome", "titulo": "nome",
+    "descricao": "descricao", "description": "descricao",
+    "preco": "preco", "price": "preco",
+    "comissao": "comissao", "commission": "comissao",
+    "pais": "pais", "country": "pais",
+    "plataforma": "plataforma", "platform": "plataforma",
+    "link": "link", "url": "link",
+}
+
+# Peso da comissão e do preço na ordenação (a relevância textual vem do
+# nível, palavras no nome antes de palavras só na descrição, e do bm25)
+PESO_COMISSAO = 0.05
+PESO_PRECO = 0.002
+# Em cada nível, no máximo tantos produtos são lidos do índice e pontuados
+CANDIDATOS_POR_BUSCA = 1000
+# Parâmetros usuais do bm25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def converter_valor(texto):
+    """Converte "€49,99", "1.299,00", "49.99" ou 49.99 em float."""
+    if isinstance(texto, (int, float)):
+        return float(texto)
+    texto = re.sub(r"[^\d,.\-]", "", str(texto or ""))
+    if "," in texto and "." in texto:
+        if texto.rfind(",") > texto.rfind("."):
+            texto = texto.replace(".", "").replace(",", ".")
+        else:
+            texto = texto.replace(",", "")
+    else:
+        texto = texto.replace(",", ".")
+    try:
+        return float(texto)
+    except ValueError:
+        return 0.0
+
+
+def termos_busca(texto):
+    """Palavras da busca sem acentos, prontas para a expressão MATCH."""
+    texto = unicodedata.normalize("NFKD", texto.lower())
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    return re.findall(r"\w+", texto)
+
+
+@lru_cache(maxsize=65536)
+def _sem_acentos(palavra):
+    # Os nomes repetem poucas palavras: cada uma é normalizada uma vez só
+    if palavra.isascii():
+        return palavra
+    palavra = unicodedata.normalize("NFKD", palavra)
+    return "".join(c for c in palavra if not unicodedata.combining(c))
+
+
+def relevancia_bm25(termos, textos):
+    """
+    bm25 de cada texto para os termos (prefixos), com o comprimento médio dos
+    próprios textos. Sem o idf: os candidatos contêm todos os termos, então ele
+    quase não muda a ordem, e calculá-lo exigiria percorrer todas as ocorrências
+    no índice (é o que torna o bm25 do FTS5 caro em catálogos grandes).
+    """
+    palavras = [[_sem_acentos(p) for p in re.findall(r"\w+", texto.lower())] for texto in textos]
+    medio = sum(map(len, palavras)) / len(palavras) if palavras else 1
+    relevancias = []
+    for tokens in palavras:
+        norma = BM25_K1 * (1 - BM25_B + BM25_B * len(tokens) / (medio or 1))
+        total = 0.0
+        for termo in termos:
+            frequencia = sum(1 for token in tokens if token.startswith(termo))
+            total += frequencia * (BM25_K1 + 1) / (frequencia + norma)
+        relevancias.append(total)
+    return relevancias
+
+
+def faceta(campo, valor):
+    """
+    País e plataforma também viram palavras do índice (ex.: "paisfranca",
+    "plataformaamazoneu"), para que os filtros sejam resolvidos pelo FTS5.
+    """
+    return campo + "".join(termos_busca(valor))
+
+
+class CatalogoProdutos(BancoSQLite):
+    """Catálogo local com busca por palavra-chave em texto completo."""
+
+    ESQUEMA = """
+        CREATE TABLE IF NOT EXISTS produtos (
+            id TEXT UNIQUE NOT NULL,
+            nome TEXT NOT NULL,
+            descricao TEXT NOT NULL DEFAULT '',
+            preco REAL NOT NULL,
+            comissao REAL NOT NULL,
+            pais TEXT NOT NULL,
+            plataforma TEXT NOT NULL,
+            link TEXT NOT NULL DEFAULT '',
+            facetas TEXT NOT NULL
+        );
+        CREATE VIRTUAL TABLE IF NOT EXISTS produtos_fts USING fts5(
+            nome, descricao, facetas,
+            content='produtos', content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+        );
+        CREATE TRIGGER IF NOT EXISTS produtos_ai AFTER INSERT ON produtos BEGIN
+            INSERT INTO produtos_fts (rowid, nome, descricao, facetas)
+                VALUES (new.rowid, new.nome, new.descricao, new.facetas);
+        END;
+        CREATE TRIGGER IF NOT EXISTS produtos_au AFTER UPDATE ON produtos BEGIN
+            INSERT INTO produtos_fts (produtos_fts, rowid, nome, descricao, facetas)
+                VALUES ('delete', old.rowid, old.nome, old.descricao, old.facetas);
+            INSERT INTO produtos_fts (rowid, nome, descricao, facetas)
+                VALUES (new.rowid, new.nome, new.descricao, new.facetas);
+        END;
+        CREATE TRIGGER IF NOT EXISTS produtos_ad AFTER DELETE ON produtos BEGIN
+            INSERT INTO produtos_fts (produtos_fts, rowid, nome, descricao, facetas)
+                VALUES ('delete', old.rowid, old.nome, old.descricao, old.facetas);
+        END;
+    """
+    _INSERIR = """
+        INSERT INTO produtos (id, nome, descricao, preco, comissao, pais, plataforma, link, facetas)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (id) DO UPDATE SET
+            nome = excluded.nome, descricao = excluded.descricao, preco = excluded.preco,
+            comissao = excluded.comissao, pais = excluded.pais,
+            plataforma = excluded.plataforma, link = excluded.link, facetas = excluded.facetas
+    """
+
+    def contar(self):
+        return self._conexao().execute("SELECT COUNT(*) FROM produtos").fetchone()[0]
+
+    # ------------------------------
+    # Ingestão
+    # ------------------------------
+    @staticmethod
+    def _linha(registro, pais_padrao, plataforma_padrao):
+        campos = {}
+        for chave, valor in registro.items():
+            destino = APELIDOS_CAMPOS.get(str(chave).strip().lower())
+            if destino:
+                campos[destino] = valor
+        if not campos.get("id") or not campos.get("nome"):
+            return None
+        pais = str(campos.get("pais") or pais_padrao)
+        plataforma = str(campos.get("plataforma") or plataforma_padrao)
+        return (
+            str(campos["id"]),
+            str(campos["nome"]),
+            str(campos.get("descricao") or ""),
+            converter_valor(campos.get("preco")),
+            converter_valor(campos.get("comissao")),
+            pais,
+            plataforma,
+            str(campos.get("link") or ""),
+            f"{faceta('pais', pais)} {faceta('plataforma', plataforma)}",
+        )
+
+    def ingerir(self, registros, pais_padrao="", plataforma_padrao=""):
+        """
+        Ingere um iterável de dicts em lotes de TAMANHO_LOTE, cada lote na sua
+        própria transação: a memória fica limitada a um lote. Retorna quantos
+        produtos entraram (registros sem id ou nome são ignorados).
+        """
+        total = 0
+        lote = []
+        for registro in registros:
+            linha = self._linha(registro, pais_padrao, plataforma_padrao)
+            if linha is None:
+                continue
+            lote.append(linha)
+            if len(lote) >= TAMANHO_LOTE:
+                total += self._gravar_lote(lote)
+                lote = []
+        if lote:
+            total += self._gravar_lote(lote)
+        return total
+
+    def _gravar_lote(self, lote):
+        with self._transacao() as conn:
+            conn.executemany(self._INSERIR, lote)
+        return len(lote)
+
+    def ingerir_arquivo(self, arquivo, formato=None, **padroes):
+        """
+        Ingere um feed CSV ou JSON Lines. `arquivo` pode ser um caminho ou um
+        arquivo aberto (texto ou binário); o conteúdo é lido linha a linha.
+        """
+        if isinstance(arquivo, str):
+            formato = formato or ("csv" if arquivo.lower().endswith(".csv") else "jsonl")
+            with open(arquivo, "r", encoding="utf-8", newline="") as f:
+                return self.ingerir_arquivo(f, formato, **padroes)
+        if isinstance(arquivo.read(0), bytes):
+            arquivo = io.TextIOWrapper(arquivo, encoding="utf-8", newline="")
+        if formato == "csv":
+            registros = csv.DictReader(arquivo)
+        else:
+            registros = (json.loads(linha) for linha in arquivo if linha.strip())
+        return self.ingerir(registros, **padroes)
+
+    # ------------------------------
+    # Busca
+    # ------------------------------
+    def buscar(self, palavra_chave, paises=None, plataformas=None, limite=50):
+        """
+        Produtos que contêm todas as palavras (prefixo, sem acentos). Produtos
+        com as palavras no nome vêm antes dos que só as têm na descrição; dentro
+        de cada nível, a ordem é o bm25 do texto multiplicado pelo peso da
+        comissão (mais alta sobe) e do preço (mais baixo sobe).
+
+        Cada nível lê no máximo CANDIDATOS_POR_BUSCA produtos, os mais recentes
+        do catálogo: o FTS5 para de percorrer o índice ao atingir o limite, então
+        a latência não cresce com o número de produtos que casam com a busca.
+        O nível da descrição só é consultado se o do nome não preencher `limite`.
+        """
+        termos = termos_busca(palavra_chave)
+        if not termos:
+            return []
+        palavras = " AND ".join(f'"{termo}"*' for termo in termos)
+        filtros = ""
+        if paises:
+            filtros += " AND facetas: (" + " OR ".join(faceta("pais", p) for p in paises) + ")"
+        if plataformas:
+            filtros += " AND facetas: (" + " OR ".join(faceta("plataforma", p) for p in plataformas) + ")"
+
+        conn = self._conexao()
+        vistos = set()
+        pontuados = []
+        for nivel, colunas in enumerate(("nome", "{nome descricao}")):
+            candidatos = []
+            cur = conn.execute(
+                f"""
+                SELECT p.rowid, p.id, p.nome, p.preco, p.comissao, p.pais, p.plataforma, p.link, p.descricao
+                FROM (
+                    SELECT rowid FROM produtos_fts WHERE produtos_fts MATCH ?
+                    ORDER BY rowid DESC LIMIT {CANDIDATOS_POR_BUSCA}
+                ) AS c
+                JOIN produtos AS p ON p.rowid = c.rowid
+                """,
+                (f"{colunas}: ({palavras}){filtros}",),
+            )
+            for linha in cur:
+                if linha[0] not in vistos:
+                    vistos.add(linha[0])
+                    candidatos.append(linha)
+            textos = [linha[2] if nivel == 0 else f"{linha[2]} {linha[8]}" for linha in candidatos]
+            for linha, relevancia in zip(candidatos, relevancia_bm25(termos, textos)):
+                preco, comissao = linha[3], linha[4]
+                pontuacao = relevancia * (1 + PESO_COMISSAO * comissao) / (1 + PESO_PRECO * preco)
+                pontuados.append(((nivel, -pontuacao), linha[1:8]))
+            if len(pontuados) >= limite:
+                # Produtos do nível seguinte ficariam todos depois destes
+                break
+        pontuados.sort(key=lambda item: item[0])
+        return [Produto(*linha) for _, linha in pontuados[:limite]]
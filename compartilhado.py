@@ -0,0 +1,147 @@
+import json
+import os
+import sqlite3
+import threading
+from types import MappingProxyType
+
+from armazenamento import gravar_json_atomico
+
+# ==============================
+# Dados compartilhados entre sessões
+# ==============================
+# O Streamlit reexecuta o script inteiro a cada interação. Os recursos daqui
+# são montados uma vez por processo (via st.cache_resource no app) e só são
+# refeitos quando a fonte muda: arquivos pela assinatura do os.stat (mtime,
+# tamanho e inode) e bancos SQLite pelo PRAGMA data_version, que muda quando
+# outra conexão — de outra thread ou de outro processo — grava no banco.
+# Conferir a versão custa um stat ou um PRAGMA, não uma leitura do arquivo.
+
+
+def congelar(valor):
+    """Visão somente leitura (dicts viram MappingProxyType, listas viram tuplas), compartilhável entre sessões."""
+    if isinstance(valor, dict):
+        return MappingProxyType({chave: congelar(item) for chave, item in valor.items()})
+    if isinstance(valor, list):
+        return tuple(congelar(item) for item in valor)
+    return valor
+
+
+class VersaoArquivo:
+    """Versão de um arquivo: muda quando ele é regravado (inclusive via os.replace)."""
+
+    def __init__(self, caminho):
+        self.caminho = str(caminho)
+
+    def __call__(self):
+        try:
+            estado = os.stat(self.caminho)
+        except FileNotFoundError:
+            return None
+        return estado.st_mtime_ns, estado.st_size, estado.st_ino
+
+
+class VersaoBanco:
+    """
+    Versão de um banco SQLite. Usa uma conexão própria que nunca grava, então
+    qualquer gravação (deste ou de outro processo) muda o PRAGMA data_version.
+    """
+
+    def __init__(self, caminho):
+        self._conn = sqlite3.connect(str(caminho), timeout=30, isolation_level=None, check_same_thread=False)
+        self._trava = threading.Lock()
+
+    def __call__(self):
+        with self._trava:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def gravar(self, funcao):
+        """
+        Executa funcao(conexão) com a conexão desta versão. O data_version não
+        muda com as gravações da própria conexão: o que for gravado por aqui não
+        conta como mudança, e quem grava atualiza o valor montado (ver alterar).
+        """
+        with self._trava:
+            return funcao(self._conn)
+
+
+class RecursoCompartilhado:
+    """
+    Valor montado por `construir()` e reaproveitado enquanto `versao()` não
+    muda. A versão é lida antes de montar: uma gravação no meio da montagem
+    muda a versão de novo e força outra montagem na próxima leitura. Só uma
+    sessão remonta por vez; as demais continuam com o valor anterior.
+    """
+
+    def __init__(self, construir, versao):
+        self._construir = construir
+        self._versao = versao
+        self._trava = threading.Lock()
+        self._valor = None
+        self._versao_valor = None
+        self._montado = False
+        self.construcoes = 0
+        self.verificacoes = 0
+
+    def obter(self):
+        self.verificacoes += 1
+        versao = self._versao()
+        if self._montado and versao == self._versao_valor:
+            return self._valor
+        if self._montado and not self._trava.acquire(blocking=False):
+            # Outra sessão já está remontando: esta segue com o valor anterior
+            # em vez de esperar na fila (vê a mudança no próximo rerun)
+            return self._valor
+        if not self._montado:
+            self._trava.acquire()
+        try:
+            # Outra sessão pode ter remontado enquanto esta esperava a trava
+            if not self._montado or versao != self._versao_valor:
+                self._valor = self._construir()
+                self._versao_valor = versao
+                self._montado = True
+                self.construcoes += 1
+            return self._valor
+        finally:
+            self._trava.release()
+
+    def invalidar(self):
+        with self._trava:
+            self._montado = False
+
+    def alterar(self, funcao):
+        """
+        Executa funcao(valor montado, ou None) com a trava de montagem: para
+        quem grava na fonte e atualiza o valor na hora, em vez de remontá-lo.
+        Nunca corre junto com uma remontagem.
+        """
+        with self._trava:
+            return funcao(self._valor if self._montado else None)
+
+
+class ArquivoJSONCompartilhado(RecursoCompartilhado):
+    """Lista JSON lida uma vez por processo; as sessões recebem a mesma visão somente leitura."""
+
+    def __init__(self, caminho):
+        self.caminho = str(caminho)
+        super().__init__(lambda: congelar(self._ler()), VersaoArquivo(self.caminho))
+
+    def _ler(self):
+        if not os.path.exists(self.caminho):
+            return []
+        try:
+            with open(self.caminho, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return []
+
+    def atualizar(self, funcao):
+        """
+        Aplica `funcao` a uma cópia mutável do conteúdo atual do disco e grava
+        o resultado de forma atômica. As gravações do processo são serializadas,
+        então duas sessões salvando ao mesmo tempo não perdem uma à outra.
+        """
+        with self._trava:
+            dados = funcao(self._ler())
+            gravar_json_atomico(self.caminho, dados)
+            self._montado = False
+        return self.obter()
@@ -0,0 +1,174 @@
+import threading
+from bisect import bisect_left, bisect_right
+
+from modelos import DURACAO_PADRAO, Profissional, formatar_horario, minutos
+
+# ==============================
+# Índice de disponibilidade em memória
+# ==============================
+# Cada agendamento ocupa um intervalo [início, início + duração) em minutos.
+# Para cada (data, profissional) os intervalos ocupados ficam em listas
+# ordenadas pelo início, com o maior fim até cada posição: checar conflito é
+# uma busca binária (mesmo se uma carga em massa trouxe sobreposições) e
+# achar a próxima lacuna de N minutos pula direto os intervalos que
+# atrapalham. Os horários oferecidos vêm da grade do profissional
+# (inícios possíveis e o fim do período do expediente de cada um).
+
+GRADE_PADRAO = Profissional("").grade()
+
+
+class IntervalosOcupados:
+    """
+    Intervalos [início, fim) de um profissional num dia, ordenados pelo início.
+    `alcance[i]` é o maior fim entre os i + 1 primeiros: as reservas não se
+    sobrepõem, mas salvar() e inserir_em_massa() podem carregar sobreposições,
+    e o fim do intervalo anterior sozinho não bastaria.
+    """
+
+    __slots__ = ("inicios", "fins", "alcance")
+
+    def __init__(self):
+        self.inicios = []
+        self.fins = []
+        self.alcance = []
+
+    def __len__(self):
+        return len(self.inicios)
+
+    def _recalcular(self, posicao):
+        # O alcance só muda a partir de `posicao`, e só até voltar a coincidir com o anterior
+        maximo = self.alcance[posicao - 1] if posicao else 0
+        for i in range(posicao, len(self.fins)):
+            maximo = max(maximo, self.fins[i])
+            if i > posicao and self.alcance[i] == maximo:
+                break
+            self.alcance[i] = maximo
+
+    def ocupar(self, inicio, fim):
+        posicao = bisect_right(self.inicios, inicio)
+        self.inicios.insert(posicao, inicio)
+        self.fins.insert(posicao, fim)
+        self.alcance.insert(posicao, fim)
+        self._recalcular(posicao)
+
+    def liberar(self, inicio, fim=None):
+        """Retira o intervalo que começa em `inicio` (e termina em `fim`, se houver mais de um)."""
+        posicao = bisect_left(self.inicios, inicio)
+        while posicao < len(self.inicios) and self.inicios[posicao] == inicio:
+            if fim is None or self.fins[posicao] == fim:
+                del self.inicios[posicao]
+                del self.fins[posicao]
+                del self.alcance[posicao]
+                if posicao < len(self.fins):
+                    self._recalcular(posicao)
+                return
+            posicao += 1
+
+    def conflita(self, inicio, fim):
+        """O(log n): algum intervalo que começa antes de `fim` termina depois de `inicio`."""
+        posicao = bisect_left(self.inicios, fim)
+        return posicao > 0 and self.alcance[posicao - 1] > inicio
+
+    def proxima_lacuna(self, inicio, duracao):
+        """Primeiro instante >= `inicio` com `duracao` minutos livres em seguida."""
+        posicao = bisect_right(self.inicios, inicio)
+        if posicao > 0 and self.alcance[posicao - 1] > inicio:
+            inicio = self.alcance[posicao - 1]
+        while posicao < len(self.inicios) and self.inicios[posicao] < inicio + duracao:
+            inicio = max(inicio, self.fins[posicao])
+            posicao += 1
+        return inicio
+
+
+class IndiceDisponibilidade:
+    """Intervalos ocupados por (data, profissional), consultados contra a grade de cada profissional."""
+
+    def __init__(self, grades=None, grade_padrao=GRADE_PADRAO):
+        # profissional -> (inícios possíveis, fim do período de cada início), em minutos
+        self._grades = {profissional: self._separar(grade) for profissional, grade in (grades or {}).items()}
+        self._grade_padrao = self._separar(grade_padrao)
+        self._ocupados = {}
+        self._trava = threading.Lock()
+
+    @staticmethod
+    def _separar(grade):
+        return [inicio for inicio, _ in grade], [limite for _, limite in grade]
+
+    @classmethod
+    def construir(cls, ocupacoes, grades=None, grade_padrao=GRADE_PADRAO):
+        """Monta o índice a partir de tuplas (data, profissional, horario, duracao)."""
+        indice = cls(grades, grade_padrao)
+        for data, profissional, horario, duracao in ocupacoes:
+            indice._ocupar(data, profissional, horario, duracao)
+        return indice
+
+    def _ocupar(self, data, profissional, horario, duracao):
+        intervalos = self._ocupados.get((data, profissional))
+        if intervalos is None:
+            intervalos = self._ocupados[(data, profissional)] = IntervalosOcupados()
+        inicio = minutos(horario)
+        intervalos.ocupar(inicio, inicio + duracao)
+
+    def marcar(self, data, profissional, horario, duracao=DURACAO_PADRAO):
+        with self._trava:
+            self._ocupar(data, profissional, horario, duracao)
+
+    def desmarcar(self, data, profissional, horario, duracao=None):
+        with self._trava:
+            intervalos = self._ocupados.get((data, profissional))
+            if intervalos is not None:
+                inicio = minutos(horario)
+                intervalos.liberar(inicio, None if duracao is None else inicio + duracao)
+                if not intervalos:
+                    del self._ocupados[(data, profissional)]
+
+    def horarios_de(self, profissional):
+        return [formatar_horario(inicio) for inicio in self._grades.get(profissional, self._grade_padrao)[0]]
+
+    def esta_livre(self, data, profissional, horario, duracao=DURACAO_PADRAO):
+        """O horário está na grade, o serviço termina dentro do expediente e não conflita com nada."""
+        inicios, limites = self._grades.get(profissional, self._grade_padrao)
+        inicio = minutos(horario)
+        posicao = bisect_left(inicios, inicio)
+        if posicao == len(inicios) or inicios[posicao] != inicio or inicio + duracao > limites[posicao]:
+            return False
+        intervalos = self._ocupados.get((data, profissional))
+        return intervalos is None or not intervalos.conflita(inicio, inicio + duracao)
+
+    def livres(self, data, profissional, duracao=DURACAO_PADRAO):
+        """Inícios da grade em que cabe um serviço de `duracao` minutos, em ordem."""
+        inicios, limites = self._grades.get(profissional, self._grade_padrao)
+        intervalos = self._ocupados.get((data, profissional))
+        return [
+            formatar_horario(inicio)
+            for inicio, limite in zip(inicios, limites)
+            if inicio + duracao <= limite and (intervalos is None or not intervalos.conflita(inicio, inicio + duracao))
+        ]
+
+    def proxima_vaga(self, data, profissional, duracao=DURACAO_PADRAO, depois_de="00:00"):
+        """Primeiro início da grade, a partir de `depois_de`, com `duracao` minutos livres; None se não houver."""
+        inicios, limites = self._grades.get(profissional, self._grade_padrao)
+        intervalos = self._ocupados.get((data, profissional))
+        posicao = bisect_left(inicios, minutos(depois_de))
+        while posicao < len(inicios):
+            inicio = inicios[posicao]
+            if inicio + duracao > limites[posicao]:
+                posicao += 1
+                continue
+            lacuna = inicio if intervalos is None else intervalos.proxima_lacuna(inicio, duracao)
+            if lacuna == inicio:
+                return formatar_horario(inicio)
+            # Pula de uma vez os inícios que caem dentro dos agendamentos que atrapalham
+            posicao = bisect_left(inicios, lacuna, posicao + 1)
+        return None
+
+    def livres_periodo(self, datas, profissionais, duracao=DURACAO_PADRAO):
+        """
+        Consulta de intervalo: retorna {(data, profissional): [horários livres]}
+        para todas as combinações de datas e profissionais.
+        """
+        return {
+            (data, profissional): self.livres(data, profissional, duracao)
+            for data in datas
+            for profissional in profissionais
+        }
@@ -0,0 +1,125 @@
+import json
+import os
+import tempfile
+import threading
+import uuid
+from datetime import datetime
+
+# ==============================
+# Histórico de conversas (JSON Lines, só acrescenta)
+# ==============================
+# Cada mensagem é uma linha do arquivo. Excluir uma mensagem acrescenta uma
+# marca {"excluido": id} em vez de reescrever o arquivo. Em memória fica só
+# um índice id -> posição no arquivo; o conteúdo é lido sob demanda.
+
+COMPACTAR_A_PARTIR_DE = 1000
+
+
+class HistoricoConversas:
+    """Histórico persistente com ids estáveis e exclusão em O(1)."""
+
+    def __init__(self, caminho):
+        self.caminho = str(caminho)
+        self._trava = threading.Lock()
+        self._ordem = []       # ids em ordem cronológica (inclui excluídos)
+        self._posicoes = {}    # id -> posição da linha no arquivo (só os ativos)
+        self._excluidos = 0
+        self._indexar()
+
+    def _indexar(self):
+        self._ordem, self._posicoes, self._excluidos = [], {}, 0
+        if not os.path.exists(self.caminho):
+            return
+        with open(self.caminho, "rb") as f:
+            posicao = f.tell()
+            for linha in iter(f.readline, b""):
+                try:
+                    registro = json.loads(linha)
+                except ValueError:
+                    # Linha incompleta (ex.: queda no meio de uma gravação)
+                    posicao = f.tell()
+                    continue
+                if "excluido" in registro:
+                    if self._posicoes.pop(registro["excluido"], None) is not None:
+                        self._excluidos += 1
+                else:
+                    self._ordem.append(registro["id"])
+                    self._posicoes[registro["id"]] = posicao
+                posicao = f.tell()
+
+    def _acrescentar(self, registro):
+        with open(self.caminho, "ab") as f:
+            posicao = f.tell()
+            f.write(json.dumps(registro, ensure_ascii=False).encode("utf-8") + b"\n")
+        return posicao
+
+    # ------------------------------
+    # Escrita
+    # ------------------------------
+    def adicionar(self, tipo, conteudo):
+        item = {
+            "id": uuid.uuid4().hex,
+            "tipo": tipo,
+            "conteudo": conteudo,
+            "data_hora": datetime.now().isoformat(),
+        }
+        with self._trava:
+            self._posicoes[item["id"]] = self._acrescentar(item)
+            self._ordem.append(item["id"])
+        return item
+
+    def excluir(self, id_item):
+        with self._trava:
+            if self._posicoes.pop(id_item, None) is None:
+                return False
+            self._acrescentar({"excluido": id_item})
+            self._excluidos += 1
+            if self._excluidos >= COMPACTAR_A_PARTIR_DE and self._excluidos > len(self._posicoes):
+                self._compactar()
+        return True
+
+    def _compactar(self):
+        """Reescreve o arquivo só com as mensagens ativas (grava em temporário e renomeia)."""
+        pasta = os.path.dirname(os.path.abspath(self.caminho))
+        fd, temporario = tempfile.mkstemp(prefix=".tmp_", suffix=".jsonl", dir=pasta)
+        with os.fdopen(fd, "wb") as destino, open(self.caminho, "rb") as origem:
+            for id_item in self._ordem:
+                posicao = self._posicoes.get(id_item)
+                if posicao is not None:
+                    origem.seek(posicao)
+                    destino.write(origem.readline())
+        os.replace(temporario, self.caminho)
+        self._indexar()
+
+    # ------------------------------
+    # Leitura
+    # ------------------------------
+    def contar(self):
+        return len(self._posicoes)
+
+    def recentes(self, limite, deslocamento=0):
+        """
+        Até `limite` mensagens, da mais recente para a mais antiga, pulando as
+        `deslocamento` mais recentes. Só essas linhas são lidas do arquivo.
+        """
+        with self._trava:
+            posicoes = []
+            pulados = 0
+            for id_item in reversed(self._ordem):
+                posicao = self._posicoes.get(id_item)
+                if posicao is None:
+                    continue
+                if pulados < deslocamento:
+                    pulados += 1
+                    continue
+                posicoes.append(posicao)
+                if len(posicoes) >= limite:
+                    break
+            if not posicoes:
+                return []
+            itens = []
+            with open(self.caminho, "rb") as f:
+                for posicao in posicoes:
+                    f.seek(posicao)
+                    itens.append(json.loads(f.readline()))
+            return itens
@@ -0,0 +1,499 @@
+"""
+Importação e exportação em massa (CSV e Parquet) e relatórios dos agendamentos.
+
+Uso:
+    python intercambio.py exportar agendamentos agendamentos.parquet
+    python intercambio.py exportar agendamentos bela_vista.csv --salao salao-bela-vista
+    python intercambio.py importar postagens postagens.csv
+    python intercambio.py exportar credenciais credenciais.csv
+    python intercambio.py relatorio ocupacao --inicio 2030-01-01 --fim 2030-01-31
+"""
+import argparse
+import csv
+import io
+import itertools
+import re
+import sys
+from dataclasses import dataclass, field
+from datetime import date
+
+from armazenamento import TAMANHO_LOTE, ArmazemAgendamentos, ArmazemPostagens, ArmazemSaloes
+from compartilhado import ArquivoJSONCompartilhado
+from metricas import METRICAS
+from modelos import AgendamentoPostagem, AgendamentoSalao, minutos
+from saloes import SALAO_PADRAO
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # sem pyarrow: só CSV, validado em Python
+    pa = None
+
+# ==============================
+# Intercâmbio de dados em massa
+# ==============================
+# Os arquivos são lidos e gravados em lotes: exportar pagina o banco pelo
+# rowid e importar valida um lote de cada vez, coluna por coluna (com
+# pyarrow, em operações vetorizadas do Arrow), e entrega as linhas válidas
+# a uma única gravação em massa (para agendamentos, inserir_sem_sobreposicao,
+# que também rejeita horários sobrepostos). A memória fica proporcional ao
+# lote, não ao arquivo, e uma importação com erro de estrutura não grava nada.
+
+FORMATOS = ("csv", "parquet")
+LINHAS_POR_LOTE = 10_000
+BLOCO_CSV = 1 << 20          # bytes por lote na leitura de CSV com pyarrow
+MAXIMO_EXEMPLOS_ERRO = 20
+
+DATA = r"^\d{4}-\d{2}-\d{2}$"
+DATA_HORA = r"^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}(:\d{2}(\.\d+)?)?)?$"
+HORARIO = r"^([01]\d|2[0-3]):[0-5]\d$"
+PREENCHIDO = r"\S"
+
+
+@dataclass(frozen=True, slots=True)
+class Conjunto:
+    """Colunas de um tipo de registro, como validá-las e como montar o registro."""
+
+    nome: str
+    colunas: tuple
+    formatos: dict               # coluna -> regex que o texto precisa casar
+    criar: object                # tupla na ordem de `colunas` -> registro
+    padroes: dict = field(default_factory=dict)  # colunas opcionais no arquivo
+    inteiros: tuple = ()
+    datas: tuple = ()            # colunas que também precisam ser datas de calendário
+
+    @property
+    def obrigatorias(self):
+        return [coluna for coluna in self.colunas if coluna not in self.padroes]
+
+
+AGENDAMENTOS = Conjunto(
+    nome="agendamentos",
+    colunas=("id", "data", "profissional", "horario", "status", "duracao", "servico"),
+    formatos={
+        "id": PREENCHIDO, "data": DATA, "profissional": PREENCHIDO, "horario": HORARIO,
+        "status": r"^(confirmado|cancelado|conflito)$", "duracao": r"^[1-9]\d{0,3}$",
+    },
+    criar=lambda linha: AgendamentoSalao(*linha),
+    padroes={"status": "confirmado", "duracao": "60", "servico": ""},
+    inteiros=("duracao",),
+    datas=("data",),
+)
+POSTAGENS = Conjunto(
+    nome="postagens",
+    colunas=("id", "data_criacao", "plataforma", "tipo_conteudo", "horarios"),
+    formatos={
+        "id": PREENCHIDO, "data_criacao": DATA_HORA, "plataforma": PREENCHIDO,
+        "horarios": r"^(([01]\d|2[0-3]):[0-5]\d(,([01]\d|2[0-3]):[0-5]\d)*)?$",
+    },
+    criar=lambda linha: AgendamentoPostagem(*linha[:4], tuple(linha[4].split(",")) if linha[4] else ()),
+    padroes={"tipo_conteudo": "", "horarios": ""},
+)
+# Só os metadados: uma coluna "senha" no arquivo é ignorada e nunca é exportada
+CREDENCIAIS = Conjunto(
+    nome="credenciais",
+    colunas=("id", "plataforma", "usuario", "salva_em"),
+    formatos={"id": PREENCHIDO, "plataforma": PREENCHIDO, "usuario": PREENCHIDO, "salva_em": DATA_HORA},
+    criar=lambda linha: dict(zip(CREDENCIAIS.colunas, linha)),
+)
+CONJUNTOS = {conjunto.nome: conjunto for conjunto in (AGENDAMENTOS, POSTAGENS, CREDENCIAIS)}
+
+
+@dataclass(slots=True)
+class ResultadoImportacao:
+    importados: int = 0
+    rejeitados: int = 0
+    erros: list = field(default_factory=list)  # (nº do registro, colunas inválidas ou motivo)
+
+
+def formato_do_arquivo(nome):
+    return "parquet" if nome.lower().endswith((".parquet", ".pq")) else "csv"
+
+
+def _exigir_pyarrow():
+    if pa is None:
+        raise RuntimeError("Parquet requer o pacote pyarrow (pip install pyarrow)")
+
+
+# ==============================
+# Exportação
+# ==============================
+def exportar(conjunto, lotes, destino, formato="csv"):
+    """
+    Grava os `lotes` (listas de tuplas na ordem de `conjunto.colunas`) em
+    `destino`, um caminho ou um arquivo aberto. Retorna o número de linhas.
+    """
+    with METRICAS.medir("intercambio", operacao="exportar", conjunto=conjunto.nome, formato=formato):
+        if formato == "parquet":
+            return _exportar_parquet(conjunto, lotes, destino)
+        if isinstance(destino, str):
+            with open(destino, "w", encoding="utf-8", newline="") as f:
+                return _exportar_csv(conjunto, lotes, f)
+        if not isinstance(destino, io.TextIOBase):
+            destino = io.TextIOWrapper(destino, encoding="utf-8", newline="", write_through=True)
+            try:
+                return _exportar_csv(conjunto, lotes, destino)
+            finally:
+                destino.detach()
+        return _exportar_csv(conjunto, lotes, destino)
+
+
+def _exportar_csv(conjunto, lotes, arquivo):
+    escritor = csv.writer(arquivo)
+    escritor.writerow(conjunto.colunas)
+    total = 0
+    for lote in lotes:
+        escritor.writerows(lote)
+        total += len(lote)
+    return total
+
+
+def _exportar_parquet(conjunto, lotes, destino):
+    _exigir_pyarrow()
+    esquema = pa.schema([
+        (coluna, pa.int64() if coluna in conjunto.inteiros else pa.string()) for coluna in conjunto.colunas
+    ])
+    total = 0
+    with pq.ParquetWriter(destino, esquema) as escritor:
+        for lote in lotes:
+            if not lote:
+                continue
+            colunas = [pa.array(valores, tipo.type) for valores, tipo in zip(zip(*lote), esquema)]
+            escritor.write_batch(pa.RecordBatch.from_arrays(colunas, schema=esquema))
+            total += len(lote)
+    return total
+
+
+def exportar_bytes(conjunto, lotes, formato="csv"):
+    """Conteúdo do arquivo em memória (para st.download_button)."""
+    destino = io.BytesIO()
+    exportar(conjunto, lotes, destino, formato)
+    return destino.getvalue()
+
+
+def lotes_credenciais(credenciais, tamanho=TAMANHO_LOTE):
+    """Credenciais (dicts) em lotes de tuplas, só com as colunas de metadados."""
+    linhas = (tuple(str(c.get(coluna, "")) for coluna in CREDENCIAIS.colunas) for c in credenciais)
+    return iter(lambda: list(itertools.islice(linhas, tamanho)), [])
+
+
+# ==============================
+# Importação
+# ==============================
+def importar(conjunto, arquivo, gravar, formato=None, linhas_por_lote=LINHAS_POR_LOTE, vetorizado=None):
+    """
+    Valida `arquivo` (caminho ou arquivo aberto) em lotes e chama
+    `gravar(registros, rejeitar)` com um gerador dos registros válidos (ex.:
+    armazem.inserir_sem_sobreposicao). `gravar` pode recusar o registro que
+    acabou de receber com rejeitar(motivo), e ele conta como rejeitado.
+    Linhas inválidas são contadas e descartadas; colunas obrigatórias
+    ausentes levantam ValueError antes de qualquer gravação. `vetorizado`
+    escolhe a validação com pyarrow (padrão: quando estiver instalado).
+    """
+    if formato is None:
+        formato = formato_do_arquivo(arquivo if isinstance(arquivo, str) else getattr(arquivo, "name", ""))
+    if vetorizado is None:
+        vetorizado = pa is not None
+    if formato == "parquet":
+        _exigir_pyarrow()
+        vetorizado = True
+    elif vetorizado and not isinstance(arquivo, str) and isinstance(arquivo.read(0), str):
+        vetorizado = False  # o leitor de CSV do Arrow só aceita binário
+    lotes = (_lotes_arrow if vetorizado else _lotes_python)(conjunto, arquivo, formato, linhas_por_lote)
+    resultado = ResultadoImportacao()
+    atual = [None]  # nº do último registro entregue a `gravar`
+
+    def registros():
+        for linhas, numeros, rejeitados, erros in lotes:
+            resultado.importados += len(linhas)
+            resultado.rejeitados += rejeitados
+            resultado.erros.extend(erros[:MAXIMO_EXEMPLOS_ERRO - len(resultado.erros)])
+            for numero, linha in zip(numeros, linhas):
+                atual[0] = numero
+                yield conjunto.criar(linha)
+
+    def rejeitar(motivo):
+        resultado.importados -= 1
+        resultado.rejeitados += 1
+        if len(resultado.erros) < MAXIMO_EXEMPLOS_ERRO:
+            resultado.erros.append((atual[0], [motivo]))
+
+    with METRICAS.medir("intercambio", operacao="importar", conjunto=conjunto.nome, formato=formato):
+        gravar(registros(), rejeitar)
+    return resultado
+
+
+def gravar_agendamentos(armazem):
+    """`gravar` de importar() para agendamentos: horários sobrepostos são rejeitados."""
+    return lambda registros, rejeitar: armazem.inserir_sem_sobreposicao(
+        registros, lambda agendamento: rejeitar("horario (conflito)")
+    )
+
+
+def _conferir_cabecalho(conjunto, nomes):
+    faltando = [coluna for coluna in conjunto.obrigatorias if coluna not in nomes]
+    if faltando:
+        raise ValueError(f"Colunas obrigatórias ausentes em {conjunto.nome}: {', '.join(faltando)}")
+
+
+def _exemplos_erro(mascaras, invalidas, deslocamento):
+    return [
+        (deslocamento + i + 1, [coluna for coluna, ok in mascaras.items() if not ok[i]])
+        for i in invalidas[:MAXIMO_EXEMPLOS_ERRO]
+    ]
+
+
+def _data_valida(texto):
+    try:
+        date.fromisoformat(texto)
+        return True
+    except ValueError:
+        return False
+
+
+def _lotes_python(conjunto, arquivo, formato, linhas_por_lote):
+    """CSV lido com o módulo csv; cada coluna do lote é validada de uma vez."""
+    if isinstance(arquivo, str):
+        with open(arquivo, "r", encoding="utf-8", newline="") as f:
+            yield from _lotes_python(conjunto, f, formato, linhas_por_lote)
+        return
+    if isinstance(arquivo.read(0), bytes):
+        arquivo = io.TextIOWrapper(arquivo, encoding="utf-8", newline="")
+    leitor = csv.reader(arquivo)
+    cabecalho = next(leitor, [])
+    _conferir_cabecalho(conjunto, cabecalho)
+    posicoes = {nome: i for i, nome in enumerate(cabecalho)}
+    padroes = {coluna: re.compile(padrao) for coluna, padrao in conjunto.formatos.items()}
+    deslocamento = 0
+    for lote in iter(lambda: list(itertools.islice(leitor, linhas_por_lote)), []):
+        transpostas = list(itertools.zip_longest(*lote, fillvalue=""))
+        colunas = {
+            coluna: transpostas[posicoes[coluna]] if coluna in posicoes and posicoes[coluna] < len(transpostas)
+            else (conjunto.padroes.get(coluna, ""),) * len(lote)
+            for coluna in conjunto.colunas
+        }
+        mascaras = {}
+        for coluna, padrao in padroes.items():
+            mascaras[coluna] = list(map(bool, map(padrao.search, colunas[coluna])))
+            if coluna in conjunto.datas:
+                mascaras[coluna] = [ok and _data_valida(v) for ok, v in zip(mascaras[coluna], colunas[coluna])]
+        for coluna in conjunto.inteiros:
+            colunas[coluna] = [int(v) if ok else 0 for v, ok in zip(colunas[coluna], mascaras[coluna])]
+        validas = list(map(all, zip(*mascaras.values())))
+        invalidas = [i for i, ok in enumerate(validas) if not ok]
+        linhas = list(itertools.compress(zip(*(colunas[c] for c in conjunto.colunas)), validas))
+        numeros = [deslocamento + i + 1 for i in itertools.compress(range(len(lote)), validas)]
+        yield linhas, numeros, len(invalidas), _exemplos_erro(mascaras, invalidas, deslocamento)
+        deslocamento += len(lote)
+
+
+def _lotes_arrow(conjunto, arquivo, formato, linhas_por_lote):
+    """CSV ou Parquet lido pelo Arrow; as máscaras de validação são operações vetorizadas."""
+    malformadas = []  # linhas do CSV com colunas a mais ou a menos, descartadas pelo leitor
+    if formato == "parquet":
+        parquet = pq.ParquetFile(arquivo)
+        nomes = parquet.schema_arrow.names
+        _conferir_cabecalho(conjunto, nomes)
+        lotes = parquet.iter_batches(linhas_por_lote, columns=[c for c in conjunto.colunas if c in nomes])
+    else:
+        def pular(linha):
+            malformadas.append(linha.number)
+            return "skip"
+
+        lotes = pa_csv.open_csv(
+            arquivo,
+            read_options=pa_csv.ReadOptions(block_size=BLOCO_CSV),
+            parse_options=pa_csv.ParseOptions(invalid_row_handler=pular),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={coluna: pa.string() for coluna in conjunto.colunas}, strings_can_be_null=False,
+            ),
+        )
+        _conferir_cabecalho(conjunto, lotes.schema.names)
+    deslocamento = 0
+    for lote in lotes:
+        colunas = {}
+        for coluna in conjunto.colunas:
+            if coluna in lote.schema.names:
+                colunas[coluna] = pc.cast(lote.column(coluna), pa.string())
+            else:
+                colunas[coluna] = pa.array([conjunto.padroes.get(coluna, "")] * lote.num_rows, pa.string())
+        mascaras = {}
+        for coluna, padrao in conjunto.formatos.items():
+            mascara = pc.fill_null(pc.match_substring_regex(colunas[coluna], padrao), False)
+            if coluna in conjunto.datas:
+                # Ida e volta: datas como 2030-02-30 não voltam iguais
+                convertidas = pc.strptime(colunas[coluna], format="%Y-%m-%d", unit="s", error_is_null=True)
+                iguais = pc.equal(pc.strftime(convertidas, format="%Y-%m-%d"), colunas[coluna])
+                mascara = pc.and_(mascara, pc.fill_null(iguais, False))
+            mascaras[coluna] = mascara
+        validas = _e_todas(mascaras.values())
+        tabela = pa.table(colunas).filter(validas)
+        for coluna in conjunto.inteiros:
+            tabela = tabela.set_column(
+                tabela.schema.get_field_index(coluna), coluna, pc.cast(tabela.column(coluna), pa.int64())
+            )
+        invalidas = pc.indices_nonzero(pc.invert(validas)).to_pylist()
+        erros = _exemplos_erro(
+            {coluna: mascara.to_pylist() for coluna, mascara in mascaras.items()} if invalidas else {},
+            invalidas, deslocamento,
+        )
+        # Linhas malformadas: o nº da linha no arquivo conta o cabeçalho
+        erros += [(numero - 1 if numero else None, ["linha malformada"]) for numero in malformadas]
+        linhas = list(zip(*(tabela.column(c).to_pylist() for c in conjunto.colunas)))
+        numeros = pc.add(pc.indices_nonzero(validas), deslocamento + 1).to_pylist()
+        yield linhas, numeros, len(invalidas) + len(malformadas), erros
+        malformadas.clear()
+        deslocamento += lote.num_rows
+
+
+def _e_todas(mascaras):
+    resultado = None
+    for mascara in mascaras:
+        resultado = mascara if resultado is None else pc.and_(resultado, mascara)
+    return resultado
+
+
+def gravar_credenciais(arquivo, credenciais):
+    """Acrescenta as credenciais ao arquivo JSON, substituindo as de mesmo id."""
+    novas = {c["id"]: c for c in credenciais}
+    arquivo.atualizar(lambda existentes: [c for c in existentes if c.get("id") not in novas] + list(novas.values()))
+    return len(novas)
+
+
+# ==============================
+# Relatórios
+# ==============================
+DIAS_SEMANA = ("domingo", "segunda", "terça", "quarta", "quinta", "sexta", "sábado")
+
+
+def relatorio_profissionais_dia(armazem, data_inicio=None, data_fim=None):
+    """Agendamentos confirmados e minutos reservados por profissional e dia."""
+    return [
+        {"data": data, "profissional": profissional, "agendamentos": quantidade, "minutos": minutos_reservados}
+        for data, profissional, quantidade, minutos_reservados in armazem.por_profissional_dia(data_inicio, data_fim)
+    ]
+
+
+def relatorio_ocupacao(armazem, salao, data_inicio=None, data_fim=None):
+    """
+    Minutos reservados sobre minutos de expediente de cada profissional no
+    período (todos os dias do período contam; sem período, vai da primeira
+    à última data com agendamento).
+    """
+    primeira, ultima = armazem.periodo()
+    data_inicio, data_fim = data_inicio or primeira, data_fim or ultima
+    if data_inicio is None or data_fim is None:
+        return []
+    dias = (date.fromisoformat(str(data_fim)) - date.fromisoformat(str(data_inicio))).days + 1
+    reservados = armazem.minutos_por_profissional(data_inicio, data_fim)
+    linhas = []
+    for profissional in salao.profissionais:
+        expediente = dias * sum(minutos(fim) - minutos(inicio) for inicio, fim in profissional.expediente)
+        reservado = reservados.get(profissional.nome, 0)
+        linhas.append({
+            "profissional": profissional.nome,
+            "minutos_reservados": reservado,
+            "minutos_expediente": expediente,
+            "ocupacao": round(reservado / expediente, 4) if expediente else 0.0,
+        })
+    return linhas
+
+
+def relatorio_horarios_populares(armazem, limite=10, data_inicio=None, data_fim=None):
+    """Dias da semana e horários com mais agendamentos confirmados."""
+    return [
+        {"dia_semana": DIAS_SEMANA[dia], "horario": horario, "agendamentos": quantidade}
+        for dia, horario, quantidade in armazem.horarios_populares(limite, data_inicio, data_fim)
+    ]
+
+
+# ==============================
+# Linha de comando
+# ==============================
+BANCOS_PADRAO = {
+    "agendamentos": "agendamentos_salao.db",
+    "postagens": "agendamentos_postagens.db",
+    "credenciais": "credenciais.json",
+}
+
+
+def _salao_e_armazem(args):
+    if args.salao:
+        cadastro = ArmazemSaloes(args.saloes)
+        salao, banco = cadastro.carregar()[args.salao]
+        return salao, ArmazemAgendamentos(banco)
+    return SALAO_PADRAO, ArmazemAgendamentos(args.banco or BANCOS_PADRAO["agendamentos"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("acao", choices=("exportar", "importar", "relatorio"))
+    parser.add_argument("alvo", help="agendamentos, postagens ou credenciais; no relatório: profissionais, ocupacao ou horarios")
+    parser.add_argument("arquivo", nargs="?", help="arquivo .csv ou .parquet (relatório: CSV de saída, padrão stdout)")
+    parser.add_argument("--formato", choices=FORMATOS, help="padrão: pela extensão do arquivo")
+    parser.add_argument("--banco", help="banco (ou credenciais.json) a usar; padrão: o do app")
+    parser.add_argument("--salao", help="id do salão cadastrado (usa o banco dele)")
+    parser.add_argument("--saloes", default="saloes.db", help="cadastro de salões, com --salao")
+    parser.add_argument("--inicio", help="primeira data do relatório (AAAA-MM-DD)")
+    parser.add_argument("--fim", help="última data do relatório (AAAA-MM-DD)")
+    parser.add_argument("--limite", type=int, default=10, help="horários no relatório de horários populares")
+    args = parser.parse_args()
+
+    if args.acao == "relatorio":
+        salao, armazem = _salao_e_armazem(args)
+        relatorios = {
+            "profissionais": lambda: relatorio_profissionais_dia(armazem, args.inicio, args.fim),
+            "ocupacao": lambda: relatorio_ocupacao(armazem, salao, args.inicio, args.fim),
+            "horarios": lambda: relatorio_horarios_populares(armazem, args.limite, args.inicio, args.fim),
+        }
+        if args.alvo not in relatorios:
+            parser.error(f"relatório inválido: {args.alvo}")
+        linhas = relatorios[args.alvo]()
+        saida = open(args.arquivo, "w", encoding="utf-8", newline="") if args.arquivo else sys.stdout
+        try:
+            if linhas:
+                escritor = csv.DictWriter(saida, fieldnames=list(linhas[0]))
+                escritor.writeheader()
+                escritor.writerows(linhas)
+        finally:
+            if args.arquivo:
+                saida.close()
+        return
+
+    if args.alvo not in CONJUNTOS:
+        parser.error(f"conjunto inválido: {args.alvo}")
+    if not args.arquivo:
+        parser.error("informe o arquivo")
+    conjunto = CONJUNTOS[args.alvo]
+    formato = args.formato or formato_do_arquivo(args.arquivo)
+    if conjunto is AGENDAMENTOS:
+        armazem = _salao_e_armazem(args)[1]
+    elif conjunto is POSTAGENS:
+        armazem = ArmazemPostagens(args.banco or BANCOS_PADRAO["postagens"])
+    else:
+        credenciais = ArquivoJSONCompartilhado(args.banco or BANCOS_PADRAO["credenciais"])
+
+    if args.acao == "exportar":
+        lotes = lotes_credenciais(credenciais.obter()) if conjunto is CREDENCIAIS else armazem.lotes()
+        total = exportar(conjunto, lotes, args.arquivo, formato)
+        print(f"{total} registros de {conjunto.nome} exportados para {args.arquivo}.")
+        return
+
+    if conjunto is AGENDAMENTOS:
+        gravar = gravar_agendamentos(armazem)
+    else:
+        gravar = (lambda registros, rejeitar: gravar_credenciais(credenciais, registros)) if conjunto is CREDENCIAIS \
+            else (lambda registros, rejeitar: armazem.inserir_em_massa(registros))
+    try:
+        resultado = importar(conjunto, args.arquivo, gravar, formato)
+    except (ValueError, RuntimeError) as erro:
+        parser.exit(1, f"Importação cancelada, nada foi gravado: {erro}\n")
+    print(f"{resultado.importados} registros de {conjunto.nome} importados, {resultado.rejeitados} rejeitados.")
+    for numero, colunas in resultado.erros:
+        print(f"  registro {numero}: {', '.join(colunas)} inválido(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+import contextvars
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ==============================
+# Métricas de desempenho
+# ==============================
+# Cada série (nome + rótulos) guarda as últimas CAPACIDADE_SERIE medições
+# num buffer circular: registrar é O(1) e a memória não cresce. Percentis
+# são calculados só quando alguém consulta (página Configurações ou
+# exportação no formato texto do Prometheus).
+
+CAPACIDADE_SERIE = 1024
+PERCENTIS = (50, 95, 99)
+PREFIXO = "mssp_"
+
+# Página em execução na thread/sessão atual (usada por secao())
+_pagina_atual = contextvars.ContextVar("pagina_atual", default="")
+
+
+class BufferCircular:
+    """Últimos `capacidade` valores, sobrescrevendo os mais antigos."""
+
+    __slots__ = ("capacidade", "_valores", "_proximo", "total", "soma")
+
+    def __init__(self, capacidade=CAPACIDADE_SERIE):
+        self.capacidade = capacidade
+        self._valores = []
+        self._proximo = 0
+        self.total = 0   # medições desde o início (não só as do buffer)
+        self.soma = 0.0
+
+    def adicionar(self, valor):
+        if len(self._valores) < self.capacidade:
+            self._valores.append(valor)
+        else:
+            self._valores[self._proximo] = valor
+            self._proximo = (self._proximo + 1) % self.capacidade
+        self.total += 1
+        self.soma += valor
+
+    def valores(self):
+        return list(self._valores)
+
+
+def calcular_percentis(valores, percentis=PERCENTIS):
+    """Percentis pelo método do valor mais próximo; 0.0 se não houver valores."""
+    ordenados = sorted(valores)
+    if not ordenados:
+        return {p: 0.0 for p in percentis}
+    ultimo = len(ordenados) - 1
+    return {p: ordenados[round(p / 100 * ultimo)] for p in percentis}
+
+
+def _chave(nome, rotulos):
+    return nome, tuple(sorted((k, str(v)) for k, v in rotulos.items()))
+
+
+class RegistroMetricas:
+    """
+    Durações (em segundos) em séries com buffer circular, mais medidas
+    pontuais (gauges) fornecidas por coletores chamados na hora da consulta.
+    """
+
+    def __init__(self, capacidade=CAPACIDADE_SERIE):
+        self.capacidade = capacidade
+        self._series = {}
+        self._coletores = []
+        self._trava = threading.Lock()
+
+    def registrar(self, nome, valor, **rotulos):
+        chave = _chave(nome, rotulos)
+        with self._trava:
+            serie = self._series.get(chave)
+            if serie is None:
+                serie = self._series[chave] = BufferCircular(self.capacidade)
+            serie.adicionar(valor)
+
+    @contextmanager
+    def medir(self, nome, **rotulos):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.registrar(nome, time.perf_counter() - inicio, **rotulos)
+
+    def cronometrado(self, nome, **rotulos):
+        """Decorador: registra a duração de cada chamada."""
+        def decorar(funcao):
+            @functools.wraps(funcao)
+            def envolver(*args, **kwargs):
+                with self.medir(nome, **rotulos):
+                    return funcao(*args, **kwargs)
+            return envolver
+        return decorar
+
+    def medir_fluxo(self, gerador, nome, **rotulos):
+        """
+        Repassa os itens de `gerador` registrando o tempo até o primeiro item
+        (`<nome>_primeiro_trecho`) e o tempo total (`<nome>`).
+        """
+        inicio = time.perf_counter()
+        primeiro = True
+        try:
+            for item in gerador:
+                if primeiro:
+                    self.registrar(f"{nome}_primeiro_trecho", time.perf_counter() - inicio, **rotulos)
+                    primeiro = False
+                yield item
+        finally:
+            self.registrar(nome, time.perf_counter() - inicio, **rotulos)
+
+    def adicionar_coletor(self, coletor):
+        """`coletor()` devolve tuplas (nome, rótulos, valor) com medidas do momento."""
+        with self._trava:
+            self._coletores.append(coletor)
+
+    def coletar(self):
+        medidas = []
+        for coletor in list(self._coletores):
+            try:
+                medidas.extend(coletor())
+            except Exception:
+                # Uma fonte indisponível não derruba o painel nem a exportação
+                continue
+        return medidas
+
+    def resumo(self):
+        """Lista de dicts (nome, rótulos, n, total, soma, p50, p95, p99), em segundos."""
+        with self._trava:
+            series = [(chave, serie.valores(), serie.total, serie.soma) for chave, serie in self._series.items()]
+        linhas = []
+        for (nome, rotulos), valores, total, soma in sorted(series):
+            linha = {"nome": nome, "rotulos": dict(rotulos), "n": len(valores), "total": total, "soma": soma}
+            linha.update({f"p{p}": v for p, v in calcular_percentis(valores).items()})
+            linhas.append(linha)
+        return linhas
+
+    def limpar(self):
+        with self._trava:
+            self._series.clear()
+
+    # ------------------------------
+    # Prometheus
+    # ------------------------------
+    def para_prometheus(self):
+        """Texto no formato de exposição do Prometheus (summary para durações, gauge para medidas)."""
+        linhas = []
+        por_nome = {}
+        for linha in self.resumo():
+            por_nome.setdefault(linha["nome"], []).append(linha)
+        for nome, series in por_nome.items():
+            metrica = f"{PREFIXO}{nome}_segundos"
+            linhas.append(f"# TYPE {metrica} summary")
+            for serie in series:
+                for p in PERCENTIS:
+                    rotulos = _formatar_rotulos({**serie["rotulos"], "quantile": p / 100})
+                    linhas.append(f"{metrica}{rotulos} {serie[f'p{p}']:.6f}")
+                rotulos = _formatar_rotulos(serie["rotulos"])
+                linhas.append(f"{metrica}_sum{rotulos} {serie['soma']:.6f}")
+                linhas.append(f"{metrica}_count{rotulos} {serie['total']}")
+        medidas = {}
+        for nome, rotulos, valor in self.coletar():
+            medidas.setdefault(nome, []).append((rotulos, valor))
+        for nome, valores in medidas.items():
+            metrica = f"{PREFIXO}{nome}"
+            linhas.append(f"# TYPE {metrica} gauge")
+            for rotulos, valor in valores:
+                linhas.append(f"{metrica}{_formatar_rotulos(rotulos)} {valor}")
+        return "\n".join(linhas) + "\n"
+
+    def exportar_prometheus(self, caminho):
+        # Importado aqui: expor métricas não deve carregar a camada de armazenamento
+        from armazenamento import gravar_texto_atomico
+        gravar_texto_atomico(caminho, self.para_prometheus())
+
+
+def _formatar_rotulos(rotulos):
+    if not rotulos:
+        return ""
+    pares = []
+    for chave, valor in sorted(rotulos.items()):
+        valor = str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pares.append(f'{chave}="{valor}"')
+    return "{" + ",".join(pares) + "}"
+
+
+# Registro do processo, compartilhado por todas as sessões
+METRICAS = RegistroMetricas()
+
+
+# ==============================
+# Páginas, seções e coletores
+# ==============================
+@contextmanager
+def pagina(nome, registro=METRICAS):
+    """Mede o rerun de uma página e a torna a página atual para secao()."""
+    marca = _pagina_atual.set(nome)
+    try:
+        with registro.medir("rerun", pagina=nome):
+            yield
+    finally:
+        _pagina_atual.reset(marca)
+
+
+def secao(nome, registro=METRICAS):
+    """Mede um trecho da página atual (ex.: "busca", "lista")."""
+    return registro.medir("secao", pagina=_pagina_atual.get(), secao=nome)
+
+
+def contagem(armazem, contar):
+    """Coletor do número de registros de um armazém (`contar()` devolve um int)."""
+    def coletar():
+        yield "registros", {"armazem": armazem}, contar()
+    return coletar
+
+
+def tamanho_arquivos(caminhos):
+    """
+    Coletor de tamanho em bytes dos arquivos (e dos -wal de bancos SQLite) que
+    existirem. `caminhos` pode ser uma função, chamada a cada coleta (ex.: os
+    bancos dos salões cadastrados).
+    """
+    def coletar():
+        for caminho in caminhos() if callable(caminhos) else caminhos:
+            for arquivo in (caminho, caminho + "-wal"):
+                if os.path.exists(arquivo):
+                    yield "arquivo_bytes", {"arquivo": arquivo}, os.path.getsize(arquivo)
+    return coletar
+
+
+# ==============================
+# Endpoint HTTP para o Prometheus
+# ==============================
+def servir_prometheus(porta, registro=METRICAS, endereco="127.0.0.1"):
+    """Serve GET /metrics numa thread daemon e devolve o servidor."""
+
+    class Tratador(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip("/") != "/metrics":
+                self.send_error(404)
+                return
+            corpo = registro.para_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def log_message(self, *args):
+            pass
+
+    servidor = ThreadingHTTPServer((endereco, porta), Tratador)
+    threading.Thread(target=servidor.serve_forever, name="metricas", daemon=True).start()
+    return servidor
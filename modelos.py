@@ -0,0 +1,176 @@
+from dataclasses import asdict, dataclass
+
+# ==============================
+# Tipos de registro
+# ==============================
+# Cada página tem o seu próprio tipo e o seu próprio armazenamento:
+# agendamentos do salão ("Criador de Apps") e agendamentos de postagens
+# ("Agendador de Postagens"). Salões e profissionais descrevem quem atende
+# e em que horários.
+
+
+EXPEDIENTE_PADRAO = (("09:00", "13:00"), ("14:00", "20:00"))
+DURACAO_PADRAO = 60  # minutos
+
+
+def minutos(horario):
+    """"HH:MM" -> minutos desde a meia-noite."""
+    hora, minuto = map(int, horario.split(":"))
+    return hora * 60 + minuto
+
+
+def formatar_horario(total):
+    """Minutos desde a meia-noite -> "HH:MM"."""
+    return f"{total // 60:02d}:{total % 60:02d}"
+
+
+@dataclass(slots=True)
+class AgendamentoSalao:
+    id: str
+    data: str
+    profissional: str
+    horario: str  # início, "HH:MM"
+    status: str = "confirmado"
+    duracao: int = DURACAO_PADRAO  # minutos
+    servico: str = ""
+
+    @property
+    def fim(self):
+        return formatar_horario(minutos(self.horario) + self.duracao)
+
+    @classmethod
+    def de_dict(cls, d):
+        return cls(
+            id=d["id"],
+            data=d["data"],
+            profissional=d["profissional"],
+            horario=d["horario"],
+            status=d.get("status", "confirmado"),
+            duracao=int(d.get("duracao", DURACAO_PADRAO)),
+            servico=d.get("servico", ""),
+        )
+
+    def para_dict(self):
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class AgendamentoPostagem:
+    id: str
+    data_criacao: str
+    plataforma: str
+    tipo_conteudo: str
+    horarios: tuple
+
+    @classmethod
+    def de_dict(cls, d):
+        return cls(
+            id=d["id"],
+            data_criacao=d["data_criacao"],
+            plataforma=d["plataforma"],
+            tipo_conteudo=d.get("tipo_conteudo", ""),
+            horarios=tuple(d.get("horarios", ())),
+        )
+
+    def para_dict(self):
+        d = asdict(self)
+        d["horarios"] = list(self.horarios)
+        return d
+
+
+# ==============================
+# Salões e profissionais
+# ==============================
+@dataclass(slots=True)
+class Profissional:
+    nome: str
+    expediente: tuple = EXPEDIENTE_PADRAO  # pares (início, fim) de "HH:MM"
+    duracao: int = DURACAO_PADRAO          # minutos por horário
+
+    def grade(self):
+        """
+        Pares (início, fim do período) em minutos: os inícios caem a cada
+        `duracao` minutos e o fim do período limita serviços mais longos.
+        """
+        pares = []
+        for inicio, fim in self.expediente:
+            atual, limite = minutos(inicio), minutos(fim)
+            while atual + self.duracao <= limite:
+                pares.append((atual, limite))
+                atual += self.duracao
+        return tuple(pares)
+
+    def horarios(self):
+        """Horários de início que cabem inteiros em cada período do expediente, em ordem."""
+        return tuple(formatar_horario(inicio) for inicio, _ in self.grade())
+
+    def atende(self, horario, duracao):
+        """`horario` está na grade e um serviço de `duracao` minutos termina dentro do mesmo período."""
+        inicio = minutos(horario)
+        return any(inicio == atual and inicio + duracao <= limite for atual, limite in self.grade())
+
+    @classmethod
+    def de_dict(cls, d):
+        return cls(
+            nome=d["nome"],
+            expediente=tuple(tuple(periodo) for periodo in d.get("expediente", EXPEDIENTE_PADRAO)),
+            duracao=int(d.get("duracao", DURACAO_PADRAO)),
+        )
+
+    def para_dict(self):
+        return {"nome": self.nome, "expediente": [list(p) for p in self.expediente], "duracao": self.duracao}
+
+
+@dataclass(slots=True)
+class Servico:
+    nome: str
+    duracao: int  # minutos
+
+
+SERVICOS_PADRAO = (
+    Servico("Corte", 45),
+    Servico("Escova", 30),
+    Servico("Corte e escova", 75),
+    Servico("Hidratação", 60),
+    Servico("Coloração", 150),
+    Servico("Mechas", 180),
+)
+
+
+@dataclass(slots=True)
+class Salao:
+    id: str
+    nome: str
+    profissionais: tuple = ()
+
+    def profissional(self, nome):
+        for profissional in self.profissionais:
+            if profissional.nome == nome:
+                return profissional
+        return None
+
+    @classmethod
+    def de_dict(cls, d):
+        return cls(
+            id=d["id"],
+            nome=d["nome"],
+            profissionais=tuple(Profissional.de_dict(p) for p in d.get("profissionais", ())),
+        )
+
+    def para_dict(self):
+        return {"id": self.id, "nome": self.nome, "profissionais": [p.para_dict() for p in self.profissionais]}
+
+
+def classificar_registro(d):
+    """
+    Converte um registro do antigo arquivo misto no tipo correspondente.
+    Retorna None para registros que não se encaixam em nenhum dos dois.
+    """
+    try:
+        if "horario" in d and "profissional" in d:
+            return AgendamentoSalao.de_dict(d)
+        if "data_criacao" in d and "plataforma" in d:
+            return AgendamentoPostagem.de_dict(d)
+    except (KeyError, TypeError):
+        pass
+    return None
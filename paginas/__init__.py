@@ -0,0 +1,26 @@
+import importlib
+
+# ==============================
+# Páginas do app
+# ==============================
+# Cada página é um módulo com uma função renderizar(). O módulo (e o que ele
+# importa: bancos, provedores, assistente) só é carregado quando a página é
+# aberta pela primeira vez no processo; depois fica em sys.modules e o rerun
+# não paga importação nenhuma.
+
+PAGINAS = {
+    "Início": "paginas.inicio",
+    "Criador de Apps": "paginas.criador_apps",
+    "Chat da MSSP": "paginas.chat",
+    "Agendador de Postagens": "paginas.agendador_postagens",
+    "Credenciais": "paginas.credenciais",
+    "Produtos Afiliados (Europa)": "paginas.produtos_afiliados",
+    "Histórico de Conversas": "paginas.historico_conversas",
+    "Histórico de Imagens": "paginas.historico_imagens",
+    "Importar e Exportar": "paginas.dados",
+    "Configurações": "paginas.configuracoes",
+}
+
+
+def renderizar(pagina):
+    importlib.import_module(PAGINAS[pagina]).renderizar()
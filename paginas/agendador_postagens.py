@@ -0,0 +1,110 @@
+from datetime import datetime
+
+import streamlit as st
+
+from metricas import secao
+from modelos import AgendamentoPostagem
+from paginas.agendamentos import adicionar_postagem, obter_armazem_execucoes, obter_armazem_postagens
+from paginas.comum import ITENS_POR_PAGINA, controles_paginacao, filtro_periodo
+
+# ==============================
+# Agendador de Postagens
+# ==============================
+def renderizar():
+    st.title("📅 Agendador de Postagens")
+    st.caption("Simule o agendamento de postagens em redes sociais e blog.")
+
+    st.subheader("Novo Agendamento")
+
+    plataforma = st.selectbox(
+        "Plataforma:",
+        ["Instagram", "TikTok", "Facebook", "Shopify Blog"]
+    )
+
+    tipo_conteudo = st.text_input(
+        "Tipo de conteúdo:",
+        placeholder="Ex: produto, oferta, dica, vídeo curto"
+    )
+
+    horarios_padrao = ["09:00", "15:00", "21:00"]
+    horarios_escolhidos = st.multiselect(
+        "Horários de postagem (selecione até 3):",
+        options=["06:00", "07:00", "08:00", "09:00", "10:00", "11:00", "12:00",
+                 "13:00", "14:00", "15:00", "16:00", "17:00", "18:00", "19:00",
+                 "20:00", "21:00", "22:00", "23:00"],
+        default=horarios_padrao
+    )
+
+    if st.button("💾 Salvar Agendamento"):
+        if not tipo_conteudo.strip():
+            st.warning("⚠️ Por favor, preencha o tipo de conteúdo.")
+        elif len(horarios_escolhidos) == 0:
+            st.warning("⚠️ Selecione pelo menos um horário.")
+        else:
+            novo_agendamento = AgendamentoPostagem(
+                id=datetime.now().strftime("%Y%m%d_%H%M%S_%f"),
+                data_criacao=datetime.now().isoformat(),
+                plataforma=plataforma,
+                tipo_conteudo=tipo_conteudo.strip(),
+                horarios=tuple(sorted(horarios_escolhidos))
+            )
+            adicionar_postagem(novo_agendamento)
+            st.success("✅ Agendamento salvo com sucesso!")
+            st.rerun()
+
+    st.markdown("---")
+    st.subheader("Agendamentos Salvos")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        data_inicio, data_fim = filtro_periodo("postagens")
+    with col2:
+        filtro_plataforma = st.selectbox(
+            "Filtrar por plataforma:", ["Todas", "Instagram", "TikTok", "Facebook", "Shopify Blog"]
+        )
+    filtros = {
+        "data_inicio": data_inicio,
+        "data_fim": data_fim,
+        "plataforma": None if filtro_plataforma == "Todas" else filtro_plataforma,
+    }
+
+    armazem = obter_armazem_postagens()
+    with secao("contagem"):
+        total = armazem.contar(**filtros)
+    deslocamento = controles_paginacao("postagens", total)
+    # Só a página visível é lida do banco, já do mais recente para o mais antigo
+    with secao("lista"):
+        agendamentos = armazem.listar(ITENS_POR_PAGINA, deslocamento, **filtros)
+
+    if agendamentos:
+        for ag in agendamentos:
+            data_fmt = datetime.fromisoformat(ag.data_criacao).strftime("%d/%m/%Y %H:%M")
+            st.markdown(
+                f"**{ag.plataforma}** • {data_fmt}  \n"
+                f"**Conteúdo:** {ag.tipo_conteudo}  \n"
+                f"**Horários:** {', '.join(ag.horarios)}\n\n---"
+            )
+    else:
+        st.info("Nenhum agendamento salvo ainda.")
+
+    st.markdown("---")
+    st.subheader("Execuções")
+
+    execucoes = obter_armazem_execucoes()
+    with secao("execucoes"):
+        por_status = execucoes.contar_por_status()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Publicadas", por_status.get("publicado", 0))
+    col2.metric("Aguardando nova tentativa", por_status.get("pendente", 0))
+    col3.metric("Falharam", por_status.get("falhou", 0))
+    for execucao in execucoes.recentes(ITENS_POR_PAGINA):
+        st.markdown(
+            f"**{execucao['status']}** • {execucao['disparo'].replace('T', ' ')} • "
+            f"tentativas: {execucao['tentativas']}  \n`{execucao['agendamento_id']}` {execucao['resultado']}"
+        )
+
+    st.info(
+        "ℹ️ As postagens são executadas pelo processo `python agendador.py`, separado do app, "
+        "que precisa ficar ativo 24/7. No Streamlit Cloud gratuito o app dorme após inatividade; "
+        "rode o agendador num servidor próprio."
+    )
@@ -0,0 +1,127 @@
+import os
+
+import streamlit as st
+
+from armazenamento import (
+    ArmazemAgendamentos, ArmazemExecucoes, ArmazemPostagens, ArmazemSaloes, migrar_dados_mistos
+)
+from metricas import METRICAS, contagem, tamanho_arquivos
+from modelos import DURACAO_PADRAO
+from paginas.comum import (
+    AGENDAMENTOS_ARQUIVO, AGENDAMENTOS_BANCO, ARQUIVOS_DADOS, POSTAGENS_BANCO, SALOES_BANCO, SALOES_PASTA
+)
+from saloes import SALAO_PADRAO, AgendaSaloes
+
+# ==============================
+# Bancos de agendamentos (compartilhados entre sessões)
+# ==============================
+# Usados pelas páginas "Criador de Apps" e "Agendador de Postagens".
+@st.cache_resource
+def obter_armazens():
+    salao = ArmazemAgendamentos(AGENDAMENTOS_BANCO)
+    postagens = ArmazemPostagens(POSTAGENS_BANCO)
+    # Migração única do arquivo JSON antigo (salão e postagens misturados)
+    migrar_dados_mistos(AGENDAMENTOS_ARQUIVO, salao, postagens)
+    # Os agendamentos do salão são contados por salão (ver obter_agenda_saloes)
+    METRICAS.adicionar_coletor(contagem("agendamentos_postagens", postagens.contar))
+    return salao, postagens
+
+def obter_armazem_postagens():
+    return obter_armazens()[1]
+
+@st.cache_resource
+def obter_armazem_execucoes():
+    # Mesmo banco das postagens; quem grava é o processo agendador.py
+    execucoes = ArmazemExecucoes(POSTAGENS_BANCO)
+    METRICAS.adicionar_coletor(contagem("execucoes_postagem", lambda: sum(execucoes.contar_por_status().values())))
+    return execucoes
+
+# ==============================
+# Salões (cadastro compartilhado, um banco de agendamentos por salão)
+# ==============================
+def contagem_saloes(agenda):
+    """Coletor dos agendamentos de cada salão, banco a banco (só dos bancos que já existem)."""
+    def coletar():
+        for salao_id, banco in agenda.bancos().items():
+            if os.path.exists(banco):
+                yield "registros", {"armazem": "agendamentos_salao", "salao": salao_id}, agenda.armazem(salao_id).contar()
+    return coletar
+
+@st.cache_resource
+def obter_agenda_saloes():
+    obter_armazens()  # migra o JSON antigo para o banco do salão padrão antes de abri-lo
+    cadastro = ArmazemSaloes(SALOES_BANCO)
+    agenda = AgendaSaloes(cadastro, SALOES_PASTA)
+    if cadastro.contar() == 0:
+        # O salão que já existia continua no banco de sempre
+        agenda.registrar(SALAO_PADRAO, banco=AGENDAMENTOS_BANCO)
+    METRICAS.adicionar_coletor(contagem("saloes", cadastro.contar))
+    METRICAS.adicionar_coletor(contagem_saloes(agenda))
+    # O banco do salão padrão já está em ARQUIVOS_DADOS
+    METRICAS.adicionar_coletor(tamanho_arquivos(
+        lambda: [banco for banco in agenda.bancos().values() if banco not in ARQUIVOS_DADOS]
+    ))
+    return agenda
+
+def obter_armazem_agendamentos(salao_id=SALAO_PADRAO.id):
+    return obter_agenda_saloes().armazem(salao_id)
+
+# ==============================
+# Função para carregar agendamentos
+# ==============================
+@METRICAS.cronometrado("armazenamento", operacao="carregar_agendamentos")
+def carregar_agendamentos(salao_id=SALAO_PADRAO.id):
+    return obter_armazem_agendamentos(salao_id).carregar()
+
+# ==============================
+# Função para salvar agendamentos
+# ==============================
+@METRICAS.cronometrado("armazenamento", operacao="salvar_agendamentos")
+def salvar_agendamentos(agendamentos, salao_id=SALAO_PADRAO.id):
+    obter_armazem_agendamentos(salao_id).salvar(agendamentos)
+
+# ==============================
+# Função para reservar um horário (atômica)
+# ==============================
+@METRICAS.cronometrado("armazenamento", operacao="reservar_agendamento")
+def reservar_agendamento(salao_id, agendamento):
+    # O índice de disponibilidade do salão (compartilhado pelas sessões) é
+    # atualizado junto com a gravação; só gravações de fora o fazem ser remontado.
+    return obter_agenda_saloes().reservar(salao_id, agendamento)
+
+# ==============================
+# Função para cancelar um agendamento
+# ==============================
+@METRICAS.cronometrado("armazenamento", operacao="cancelar_agendamento")
+def cancelar_agendamento(salao_id, id_agendamento):
+    return obter_agenda_saloes().cancelar(salao_id, id_agendamento)
+
+# ==============================
+# Funções para agendamentos de postagens
+# ==============================
+@METRICAS.cronometrado("armazenamento", operacao="carregar_postagens")
+def carregar_postagens():
+    return obter_armazem_postagens().carregar()
+
+@METRICAS.cronometrado("armazenamento", operacao="adicionar_postagem")
+def adicionar_postagem(agendamento):
+    obter_armazem_postagens().adicionar(agendamento)
+
+# ==============================
+# Índice de disponibilidade (um por salão, compartilhado entre sessões)
+# ==============================
+def obter_indice_disponibilidade(salao_id=SALAO_PADRAO.id):
+    # Reservas e cancelamentos desta instância o atualizam na hora; gravações de fora
+    # (outra instância do app, importação) ou mudanças no cadastro fazem remontá-lo
+    return obter_agenda_saloes().indice(salao_id)
+
+def recarregar_indice_disponibilidade(salao_id=SALAO_PADRAO.id):
+    # Depois de uma reserva recusada: a página mostrava horários que o banco não aceita mais
+    obter_agenda_saloes().recarregar_indice(salao_id)
+
+# ==============================
+# Função para obter horários disponíveis
+# ==============================
+def obter_horarios_disponiveis(data_selecionada, profissional_selecionado, indice, duracao=DURACAO_PADRAO):
+    # Inícios em que o serviço inteiro cabe no expediente sem sobrepor outra reserva
+    return indice.livres(data_selecionada, profissional_selecionado, duracao)
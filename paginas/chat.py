@@ -0,0 +1,71 @@
+from datetime import datetime
+
+import streamlit as st
+
+from assistente import janela_historico
+from metricas import METRICAS
+from paginas.conversas import (
+    adicionar_ao_historico, excluir_do_historico, iniciar_historico_sessao, obter_pipeline_respostas
+)
+
+# ==============================
+# Chat da MSSP
+# ==============================
+def renderizar():
+    iniciar_historico_sessao()
+
+    st.title("💬 Chat da MSSP")
+    st.caption("Sua consultora técnica em Shopify, dropshipping e automações.")
+
+    st.markdown('<div class="fixed-input-container">', unsafe_allow_html=True)
+    col1, col2 = st.columns([9, 1])
+    with col1:
+        mensagem_usuario = st.text_input(
+            label="Sua mensagem:",
+            placeholder="Ex: Como integrar ClickBank ao meu funil?",
+            label_visibility="collapsed",
+            key="input_fixo"
+        )
+    with col2:
+        btn_enviar = st.button("📤 Enviar", use_container_width=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    st.markdown(
+        '[💬 Falar comigo no WhatsApp](https://wa.me/351927245410?text=Olá!%20Vim%20do%20app%20MSSP)',
+        unsafe_allow_html=True
+    )
+
+    if btn_enviar and mensagem_usuario.strip():
+        # Janela limitada por orçamento de tokens, montada antes da nova mensagem entrar
+        historico_recente = janela_historico(list(st.session_state.historico.values()))
+        adicionar_ao_historico("usuario_texto", mensagem_usuario)
+        # A resposta aparece conforme é gerada; ao terminar, passa para o histórico abaixo
+        espaco_resposta = st.empty()
+        with espaco_resposta.container():
+            st.markdown("**🤖 MSSP**")
+            # Latência do backend: tempo até o primeiro trecho e até o fim da resposta
+            resposta = st.write_stream(METRICAS.medir_fluxo(
+                obter_pipeline_respostas().transmitir(mensagem_usuario, historico_recente), "chat_resposta"
+            ))
+        adicionar_ao_historico("ia_resposta", resposta)
+        espaco_resposta.empty()
+
+    if st.session_state.historico:
+        # A sessão guarda o histórico em ordem cronológica: basta invertê-lo
+        for item in reversed(list(st.session_state.historico.values())):
+            data_fmt = datetime.fromisoformat(item["data_hora"]).strftime("%d/%m %H:%M")
+            if item["tipo"] == "usuario_texto":
+                titulo = item["conteudo"][:50] + "..." if len(item["conteudo"]) > 50 else item["conteudo"]
+                col1, col2 = st.columns([9, 1])
+                with col1:
+                    st.markdown(f"**👤 {titulo}** • {data_fmt}")
+                with col2:
+                    if st.button("🗑️", key=f"del_{item['id']}"):
+                        excluir_do_historico(item["id"])
+                        st.rerun()
+            elif item["tipo"] == "ia_resposta":
+                st.markdown(f"**🤖 MSSP** • {data_fmt}")
+                st.info(item["conteudo"])
+            st.markdown("---")
+    else:
+        st.info("Nenhuma conversa ainda. Envie uma mensagem para começar!")
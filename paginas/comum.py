@@ -0,0 +1,50 @@
+import math
+
+import streamlit as st
+
+# ==============================
+# Diretórios e arquivos
+# ==============================
+AGENDAMENTOS_ARQUIVO = "agendamentos_salao.json"
+AGENDAMENTOS_BANCO = "agendamentos_salao.db"
+POSTAGENS_BANCO = "agendamentos_postagens.db"
+CREDENCIAIS_ARQUIVO = "credenciais.json"
+HISTORICO_ARQUIVO = "historico_conversas.jsonl"
+CACHE_RESPOSTAS_ARQUIVO = "cache_respostas.json"
+CATALOGO_BANCO = "catalogo_produtos.db"
+SALOES_BANCO = "saloes.db"
+SALOES_PASTA = "saloes"  # um banco de agendamentos por salão
+METRICAS_ARQUIVO = "metricas.prom"
+SEGREDOS_ARQUIVO = "segredos.enc"  # senhas criptografadas (opcional, ver segredos.py)
+
+# Arquivos cujo tamanho aparece nas métricas (bancos contam também o -wal)
+ARQUIVOS_DADOS = (
+    AGENDAMENTOS_BANCO, SALOES_BANCO, POSTAGENS_BANCO, CREDENCIAIS_ARQUIVO,
+    HISTORICO_ARQUIVO, CACHE_RESPOSTAS_ARQUIVO, CATALOGO_BANCO,
+)
+
+# ==============================
+# Paginação e filtros de listas
+# ==============================
+ITENS_POR_PAGINA = 20
+
+def controles_paginacao(chave, total, por_pagina=ITENS_POR_PAGINA):
+    """Mostra o seletor de página e retorna o deslocamento do primeiro item visível."""
+    paginas = max(1, math.ceil(total / por_pagina))
+    if paginas == 1:
+        return 0
+    pagina_atual = st.number_input(
+        f"Página (de {paginas}):", min_value=1, max_value=paginas, value=1, step=1, key=f"pagina_{chave}"
+    )
+    deslocamento = (pagina_atual - 1) * por_pagina
+    st.caption(f"Mostrando {deslocamento + 1}–{min(deslocamento + por_pagina, total)} de {total}")
+    return deslocamento
+
+def filtro_periodo(chave):
+    """Seletor de intervalo de datas; retorna (data_inicio, data_fim), ambos opcionais."""
+    periodo = st.date_input("Período:", value=(), key=f"periodo_{chave}")
+    if isinstance(periodo, (tuple, list)):
+        data_inicio = periodo[0] if len(periodo) >= 1 else None
+        data_fim = periodo[1] if len(periodo) == 2 else None
+        return data_inicio, data_fim
+    return periodo, periodo
@@ -0,0 +1,94 @@
+import streamlit as st
+
+from metricas import CAPACIDADE_SERIE, METRICAS, PERCENTIS
+from paginas.comum import CACHE_RESPOSTAS_ARQUIVO, METRICAS_ARQUIVO
+from paginas.conversas import CACHE_RESPOSTAS_VALIDADE, obter_cache_respostas
+
+# ==============================
+# Configurações
+# ==============================
+def renderizar():
+    st.title("⚙️ Configurações")
+
+    st.subheader("🧠 Cache de respostas do Chat")
+    cache_respostas = obter_cache_respostas()
+    estatisticas = cache_respostas.estatisticas()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Acertos", estatisticas["acertos"])
+    col2.metric("Falhas", estatisticas["falhas"])
+    col3.metric("Taxa de acerto", f"{estatisticas['taxa_acerto']:.0%}")
+    col4.metric("Itens", f"{estatisticas['itens']}/{estatisticas['capacidade']}")
+    st.caption(
+        f"Expirados: {estatisticas['expirados']} • validade de "
+        f"{CACHE_RESPOSTAS_VALIDADE // 86400} dias • salvo em `{CACHE_RESPOSTAS_ARQUIVO}`"
+    )
+    if st.button("🧹 Limpar cache de respostas"):
+        cache_respostas.limpar()
+        st.rerun()
+
+    st.markdown("---")
+    st.subheader("⏱️ Desempenho")
+    st.caption(
+        f"Últimas {CAPACIDADE_SERIE} medições de cada série, somando todas as sessões deste processo. "
+        "Tempos em milissegundos."
+    )
+    resumo = METRICAS.resumo()
+    if resumo:
+        st.dataframe(
+            [
+                {
+                    "métrica": linha["nome"],
+                    "rótulos": ", ".join(f"{k}={v}" for k, v in linha["rotulos"].items()),
+                    "medições": linha["total"],
+                    **{f"p{p} (ms)": round(linha[f"p{p}"] * 1000, 2) for p in PERCENTIS},
+                }
+                for linha in resumo
+            ],
+            use_container_width=True,
+            hide_index=True,
+        )
+    else:
+        st.info("Nenhuma medição ainda. Navegue pelas páginas para coletar tempos.")
+
+    medidas = METRICAS.coletar()
+    registros = [
+        (rotulos["armazem"] + (f" ({rotulos['salao']})" if "salao" in rotulos else ""), valor)
+        for nome, rotulos, valor in medidas if nome == "registros"
+    ]
+    arquivos = [(rotulos["arquivo"], valor) for nome, rotulos, valor in medidas if nome == "arquivo_bytes"]
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Registros por armazém**")
+        for armazem, valor in sorted(registros):
+            st.markdown(f"- `{armazem}`: {valor}")
+    with col2:
+        st.markdown("**Tamanho dos arquivos**")
+        for arquivo, valor in sorted(arquivos):
+            st.markdown(f"- `{arquivo}`: {valor / 1024:.1f} KiB")
+
+    st.markdown("**🔬 Perfil de um rerun**")
+    if st.button("Perfilar o próximo rerun"):
+        st.session_state.perfilar_proximo = True
+        st.info("O próximo rerun (ex.: ao abrir outra página) será executado sob o cProfile.")
+    if "ultimo_perfil" in st.session_state:
+        perfil = st.session_state.ultimo_perfil
+        with st.expander(f"Último perfil — {perfil['pagina']}"):
+            st.code(perfil["texto"], language="text")
+
+    st.markdown("**📤 Exportar (Prometheus)**")
+    texto_prometheus = METRICAS.para_prometheus()
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button(f"💾 Gravar `{METRICAS_ARQUIVO}`"):
+            METRICAS.exportar_prometheus(METRICAS_ARQUIVO)
+            st.success(f"Métricas gravadas em `{METRICAS_ARQUIVO}`.")
+    with col2:
+        st.download_button("⬇️ Baixar métricas", texto_prometheus, file_name=METRICAS_ARQUIVO, mime="text/plain")
+    with col3:
+        if st.button("🧹 Zerar medições"):
+            METRICAS.limpar()
+            st.rerun()
+    st.caption(
+        "Para o Prometheus coletar direto do app, defina `MSSP_METRICAS_PORTA` "
+        "(ex.: 9108) e aponte o scrape para `http://127.0.0.1:<porta>/metrics`."
+    )
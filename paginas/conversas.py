@@ -0,0 +1,58 @@
+import streamlit as st
+
+from assistente import BackendLocal, PipelineRespostas
+from cache import CacheLRU
+from historico import HistoricoConversas
+from metricas import METRICAS, contagem
+from paginas.comum import CACHE_RESPOSTAS_ARQUIVO, HISTORICO_ARQUIVO
+
+# ==============================
+# Histórico de conversas
+# ==============================
+HISTORICO_EM_SESSAO = 100
+
+@st.cache_resource
+def obter_historico():
+    historico = HistoricoConversas(HISTORICO_ARQUIVO)
+    METRICAS.adicionar_coletor(contagem("historico_conversas", historico.contar))
+    return historico
+
+CACHE_RESPOSTAS_CAPACIDADE = 500
+CACHE_RESPOSTAS_VALIDADE = 7 * 24 * 3600  # segundos
+
+@st.cache_resource
+def obter_cache_respostas():
+    cache = CacheLRU(
+        capacidade=CACHE_RESPOSTAS_CAPACIDADE,
+        ttl=CACHE_RESPOSTAS_VALIDADE,
+        caminho=CACHE_RESPOSTAS_ARQUIVO
+    )
+    METRICAS.adicionar_coletor(contagem("cache_respostas", cache.__len__))
+    return cache
+
+@st.cache_resource
+def obter_pipeline_respostas():
+    # Compartilhado entre sessões: o pool de threads limita as respostas simultâneas
+    return PipelineRespostas(BackendLocal(), cache=obter_cache_respostas())
+
+@METRICAS.cronometrado("armazenamento", operacao="carregar_historico_recente")
+def carregar_historico_recente():
+    """Só as últimas mensagens vão para a sessão, como dict id -> item em ordem cronológica."""
+    return {item["id"]: item for item in reversed(obter_historico().recentes(HISTORICO_EM_SESSAO))}
+
+def iniciar_historico_sessao():
+    if "historico" not in st.session_state:
+        st.session_state.historico = carregar_historico_recente()
+
+@METRICAS.cronometrado("armazenamento", operacao="adicionar_ao_historico")
+def adicionar_ao_historico(tipo, conteudo):
+    item = obter_historico().adicionar(tipo, conteudo)
+    st.session_state.historico[item["id"]] = item
+    if len(st.session_state.historico) > HISTORICO_EM_SESSAO:
+        st.session_state.historico.pop(next(iter(st.session_state.historico)))
+    return item
+
+@METRICAS.cronometrado("armazenamento", operacao="excluir_do_historico")
+def excluir_do_historico(id_item):
+    obter_historico().excluir(id_item)
+    st.session_state.historico.pop(id_item, None)
@@ -0,0 +1,146 @@
+from datetime import datetime
+
+import streamlit as st
+
+from compartilhado import ArquivoJSONCompartilhado
+from metricas import METRICAS, contagem
+from paginas.comum import CREDENCIAIS_ARQUIVO, SEGREDOS_ARQUIVO
+from segredos import VALIDADE_PADRAO, ResolvedorCredenciais, nome_segredo, provedores_padrao
+
+# ==============================
+# Credenciais (sem senhas), lidas do disco só quando o arquivo muda
+# ==============================
+@st.cache_resource
+def obter_arquivo_credenciais():
+    arquivo = ArquivoJSONCompartilhado(CREDENCIAIS_ARQUIVO)
+    METRICAS.adicionar_coletor(contagem("credenciais", lambda: len(arquivo.obter())))
+    return arquivo
+
+@METRICAS.cronometrado("armazenamento", operacao="carregar_credenciais")
+def carregar_credenciais():
+    """Visão somente leitura, a mesma para todas as sessões."""
+    return obter_arquivo_credenciais().obter()
+
+@METRICAS.cronometrado("armazenamento", operacao="adicionar_credencial")
+def adicionar_credencial(credencial):
+    # Nunca salvar a senha
+    credencial_sem_senha = {k: v for k, v in credencial.items() if k != "senha"}
+    obter_arquivo_credenciais().atualizar(lambda credenciais: credenciais + [credencial_sem_senha])
+    # A senha pode ter sido configurada agora: a próxima consulta vai aos provedores
+    obter_resolvedor().invalidar(credencial["plataforma"])
+
+# ==============================
+# Senhas: provedores de segredos com cache em memória
+# ==============================
+@st.cache_resource
+def obter_resolvedor():
+    resolvedor = ResolvedorCredenciais(provedores_padrao(SEGREDOS_ARQUIVO))
+    METRICAS.adicionar_coletor(lambda: [
+        ("credenciais_cache", {"medida": medida}, valor) for medida, valor in resolvedor.estatisticas().items()
+    ])
+    return resolvedor
+
+# ==============================
+# 🔒 FUNÇÃO PARA USAR CREDENCIAL (simulada)
+# ==============================
+def usar_credencial(plataforma):
+    """
+    Simula o uso de uma credencial.
+    Na versão futura, isso poderá acionar automações reais.
+    Por enquanto, apenas confirma que a senha está configurada em algum provedor.
+    """
+    credencial = obter_resolvedor().obter(plataforma)
+    if credencial:
+        return f"✅ Credencial para **{plataforma}** está pronta para uso (senha em: {credencial.origem}; aprovada manualmente)."
+    else:
+        return f"⚠️ Credencial para **{plataforma}** não configurada (variáveis de ambiente, secrets ou arquivo de segredos)."
+
+# ==============================
+# Página: Credenciais
+# ==============================
+def renderizar():
+    st.title("🔐 Credenciais")
+    st.caption("Gerencie suas credenciais com segurança — sem armazenar senhas no código.")
+
+    st.info(
+        "ℹ️ **Como funciona a segurança?**\n\n"
+        "- As senhas **nunca são salvas** no arquivo `credenciais.json`\n"
+        "- As senhas devem ser armazenadas como **variáveis de ambiente** no Streamlit Cloud\n"
+        "- Apenas o nome da plataforma e o usuário são salvos\n"
+        "- A MSSP **nunca mostra a senha**"
+    )
+
+    # Carregar credenciais existentes (sem senhas)
+    credenciais = carregar_credenciais()
+
+    # Formulário de cadastro
+    st.subheader("➕ Nova Credencial")
+
+    plataforma = st.selectbox(
+        "Plataforma:",
+        ["Instagram", "TikTok", "Facebook", "Email", "Afiliados"]
+    )
+
+    usuario = st.text_input("Usuário/Login:")
+
+    senha = st.text_input("Senha:", type="password")
+
+    if st.button("💾 Salvar com segurança"):
+        if not usuario.strip():
+            st.warning("⚠️ Por favor, preencha o usuário.")
+        elif not senha.strip():
+            st.warning("⚠️ Por favor, preencha a senha.")
+        else:
+            # Adicionar credencial à lista (sem salvar a senha)
+            nova_credencial = {
+                "id": datetime.now().strftime("%Y%m%d_%H%M%S_%f"),
+                "plataforma": plataforma,
+                "usuario": usuario.strip(),
+                "salva_em": datetime.now().isoformat()
+            }
+            adicionar_credencial(nova_credencial)
+            credenciais = carregar_credenciais()
+            
+            # Instruções para o usuário
+            st.success("✅ Credencial salva com segurança!")
+            st.markdown(
+                f"🔑 **Próximo passo obrigatório:**\n\n"
+                f"1. Vá para **Settings > Secrets** no seu repositório do Streamlit Cloud\n"
+                f"2. Adicione uma nova secret com:\n"
+                f"   - **Name**: `{nome_segredo(plataforma)}`\n"
+                f"   - **Value**: sua senha real\n\n"
+                f"Exemplo para Instagram: `SENHA_INSTAGRAM` = `minha_senha_secreta`"
+            )
+
+    # Mostrar credenciais salvas
+    st.markdown("---")
+    st.subheader("📋 Credenciais Salvas")
+    st.caption(
+        f"As senhas consultadas ficam em memória por até {VALIDADE_PADRAO // 60} minutos. "
+        "Alterou uma senha nos secrets ou no arquivo de segredos? Recarregue."
+    )
+    if st.button("🔄 Recarregar senhas"):
+        obter_resolvedor().invalidar()
+
+    if credenciais:
+        for cred in credenciais:
+            data_fmt = datetime.fromisoformat(cred["salva_em"]).strftime("%d/%m/%Y %H:%M")
+            st.markdown(f"**{cred['plataforma']}** • {cred['usuario']} • {data_fmt}")
+            
+            # Botão para testar uso da credencial
+            if st.button(f"🔍 Usar credencial ({cred['plataforma']})", key=f"use_{cred['id']}"):
+                resultado = usar_credencial(cred["plataforma"])
+                st.info(resultado)
+            
+            st.markdown("---")
+    else:
+        st.info("Nenhuma credencial salva ainda.")
+
+    # Aviso final
+    st.warning(
+        "⚠️ **Importante:**\n\n"
+        "- Este sistema **não faz login real** nas plataformas\n"
+        "- É uma **estrutura preparatória** para automação futura\n"
+        "- A aprovação manual será necessária antes de qualquer ação automatizada\n"
+        "- Nunca compartilhe suas variáveis de ambiente"
+    )
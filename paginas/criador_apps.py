@@ -0,0 +1,188 @@
+from datetime import datetime, timedelta
+
+import streamlit as st
+
+from metricas import secao
+from modelos import SERVICOS_PADRAO, AgendamentoSalao, Salao
+from paginas.agendamentos import (
+    cancelar_agendamento, obter_agenda_saloes, obter_armazem_agendamentos, obter_horarios_disponiveis,
+    obter_indice_disponibilidade, recarregar_indice_disponibilidade, reservar_agendamento
+)
+from paginas.comum import ITENS_POR_PAGINA, controles_paginacao, filtro_periodo
+from saloes import formatar_profissionais, identificador_salao, ler_profissionais
+
+def formatar_duracao(duracao):
+    horas, minutos = divmod(duracao, 60)
+    return f"{horas}h{minutos:02d}" if horas and minutos else f"{horas}h" if horas else f"{minutos} min"
+
+# ==============================
+# Cadastro de salões e profissionais
+# ==============================
+def configurar_saloes(agenda, saloes):
+    with st.expander("🏢 Salões e profissionais"):
+        opcoes = ["➕ Novo salão"] + [salao.nome for salao in saloes]
+        escolha = st.selectbox("Salão a editar:", opcoes, key="salao_editado")
+        existente = saloes[opcoes.index(escolha) - 1] if escolha != opcoes[0] else None
+        nome = st.text_input("Nome do salão:", value=existente.nome if existente else "", key=f"nome_{escolha}")
+        texto = st.text_area(
+            "Profissionais (um por linha: `Nome | expediente | minutos por horário`):",
+            value=formatar_profissionais(existente.profissionais) if existente else "Ana | 09:00-13:00 14:00-19:00 | 30",
+            key=f"profissionais_{escolha}",
+        )
+        if st.button("💾 Salvar salão"):
+            try:
+                profissionais = ler_profissionais(texto)
+                salao_id = existente.id if existente else identificador_salao(nome)
+                if not profissionais:
+                    raise ValueError("Cadastre pelo menos um profissional.")
+                if existente is None and any(salao.id == salao_id for salao in saloes):
+                    raise ValueError(f"Já existe um salão com o id `{salao_id}`.")
+            except ValueError as erro:
+                st.error(f"❌ {erro}")
+            else:
+                agenda.registrar(Salao(salao_id, nome.strip() or salao_id, profissionais))
+                st.success("✅ Salão salvo!")
+                st.rerun()
+
+# ==============================
+# Criador de Apps — Página do Salão de Cabelo
+# ==============================
+def renderizar():
+    st.title("✂️ App de Agendamento para Salão de Cabelo")
+    st.caption("Crie seu app de agendamento em minutos — sem programação.")
+
+    agenda = obter_agenda_saloes()
+    saloes = agenda.saloes()
+    configurar_saloes(agenda, saloes)
+
+    st.subheader("📅 Marque sua consulta")
+
+    if len(saloes) > 1:
+        salao = st.selectbox("Salão:", saloes, format_func=lambda s: s.nome)
+    else:
+        salao = saloes[0]
+    profissionais = [p.nome for p in salao.profissionais]
+
+    data_atual = datetime.now().date()
+    datas_disponiveis = [data_atual + timedelta(days=i) for i in range(8)]
+    data_selecionada = st.date_input("Data:", value=data_atual, min_value=data_atual)
+
+    profissional_selecionado = st.selectbox("Cabeleireiro(a):", profissionais)
+    servico = st.selectbox(
+        "Serviço:", SERVICOS_PADRAO, format_func=lambda s: f"{s.nome} ({formatar_duracao(s.duracao)})"
+    )
+
+    with secao("disponibilidade"):
+        # Só o banco deste salão é consultado
+        indice = obter_indice_disponibilidade(salao.id)
+        horarios_disponiveis = obter_horarios_disponiveis(
+            str(data_selecionada), profissional_selecionado, indice, servico.duracao
+        )
+
+    with st.expander(f"🗓️ Visão da semana (horários livres para {servico.nome.lower()})"):
+        livres_semana = indice.livres_periodo([str(d) for d in datas_disponiveis], profissionais, servico.duracao)
+        st.dataframe(
+            {
+                "Data": [d.strftime("%d/%m") for d in datas_disponiveis],
+                **{
+                    prof: [len(livres_semana[(str(d), prof)]) for d in datas_disponiveis]
+                    for prof in profissionais
+                },
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+
+    if len(horarios_disponiveis) == 0:
+        st.warning("⚠️ Não há horários disponíveis para este serviço com este profissional nesta data.")
+        proxima = next(
+            (
+                (data, vaga)
+                for data in (data_selecionada + timedelta(days=i) for i in range(1, 8))
+                if (vaga := indice.proxima_vaga(str(data), profissional_selecionado, servico.duracao))
+            ),
+            None,
+        )
+        if proxima:
+            st.info(f"💡 Próxima vaga com {profissional_selecionado}: {proxima[0].strftime('%d/%m')} às {proxima[1]}")
+    else:
+        horario_selecionado = st.selectbox("Horário:", horarios_disponiveis)
+
+    if "erro_reserva" in st.session_state:
+        st.error(st.session_state.pop("erro_reserva"))
+
+    if st.button("✅ Confirmar Agendamento", disabled=len(horarios_disponiveis) == 0):
+        novo_agendamento = AgendamentoSalao(
+            id=datetime.now().strftime("%Y%m%d_%H%M%S_%f"),
+            data=str(data_selecionada),
+            profissional=profissional_selecionado,
+            horario=horario_selecionado,
+            status="confirmado",
+            duracao=servico.duracao,
+            servico=servico.nome,
+        )
+        try:
+            reservado = reservar_agendamento(salao.id, novo_agendamento)
+            erro = "❌ Este horário acabou de ser reservado por outra pessoa. Escolha outro horário."
+        except ValueError as motivo:
+            # O expediente ou os profissionais mudaram em outra sessão depois que a página foi montada
+            reservado = False
+            erro = f"❌ {motivo}. Escolha outro horário."
+        if reservado:
+            st.success("✅ Agendamento confirmado!")
+            st.info(
+                "ℹ️ Para pagar antecipadamente, entre em contato com o salão via WhatsApp.\n"
+                "O app não processa pagamentos — use o botão abaixo para falar com eles."
+            )
+        else:
+            # A mensagem aparece no rerun, já com os horários livres remontados
+            recarregar_indice_disponibilidade(salao.id)
+            st.session_state.erro_reserva = erro
+            st.rerun()
+
+    st.markdown("---")
+    st.markdown('[💬 Falar com o salão no WhatsApp](https://wa.me/351927245410?text=Olá!%20Vim%20do%20app%20de%20agendamento)', unsafe_allow_html=True)
+
+    st.markdown("---")
+    st.subheader("📋 Agendamentos Salvos")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        data_inicio, data_fim = filtro_periodo("salao")
+    with col2:
+        filtro_profissional = st.selectbox("Profissional:", ["Todos"] + profissionais, key="filtro_profissional")
+    filtros = {
+        "data_inicio": data_inicio,
+        "data_fim": data_fim,
+        "profissional": None if filtro_profissional == "Todos" else filtro_profissional,
+    }
+
+    armazem = obter_armazem_agendamentos(salao.id)
+    with secao("contagem"):
+        total = armazem.contar(**filtros)
+    deslocamento = controles_paginacao("salao", total)
+    # Só a página visível é lida do banco, já ordenada por (data, horario)
+    with secao("lista"):
+        agendamentos = armazem.listar(ITENS_POR_PAGINA, deslocamento, **filtros)
+
+    if agendamentos:
+        for ag in agendamentos:
+            if ag.status != "confirmado":
+                st.markdown(f"~~**{ag.profissional}** • {ag.data} das {ag.horario} às {ag.fim}~~ ({ag.status})")
+            else:
+                col1, col2 = st.columns([9, 1])
+                with col1:
+                    rotulo_servico = f" • {ag.servico}" if ag.servico else ""
+                    st.markdown(f"**{ag.profissional}**{rotulo_servico} • {ag.data} das {ag.horario} às {ag.fim}")
+                with col2:
+                    if st.button("❌", key=f"cancelar_{ag.id}", help="Cancelar agendamento"):
+                        cancelar_agendamento(salao.id, ag.id)
+                        st.rerun()
+    else:
+        st.info("Nenhum agendamento salvo ainda.")
+
+    st.info(
+        "⚠️ Este app é um simulador de agendamento. "
+        "Para pagamento antecipado (cartão, transferência, MBWay), o cliente deve entrar em contato via WhatsApp. "
+        "No Streamlit Cloud gratuito, não é possível processar pagamentos ou manter banco de dados permanente."
+    )
@@ -0,0 +1,104 @@
+import streamlit as st
+
+from intercambio import (
+    AGENDAMENTOS, CONJUNTOS, CREDENCIAIS, FORMATOS, exportar_bytes, formato_do_arquivo, gravar_agendamentos,
+    gravar_credenciais, importar, lotes_credenciais, pa, relatorio_horarios_populares, relatorio_ocupacao,
+    relatorio_profissionais_dia
+)
+from metricas import secao
+from paginas.agendamentos import obter_agenda_saloes, obter_armazem_postagens
+from paginas.comum import filtro_periodo
+from paginas.credenciais import obter_arquivo_credenciais
+
+ROTULOS_CONJUNTOS = {
+    "agendamentos": "Agendamentos do salão",
+    "postagens": "Agendamentos de postagens",
+    "credenciais": "Credenciais (sem senhas)",
+}
+
+def _origem(conjunto, agenda, salao_id):
+    """(lotes para exportar, `gravar` de importar()) de cada conjunto."""
+    if conjunto is AGENDAMENTOS:
+        armazem = agenda.armazem(salao_id)
+        return armazem.lotes, gravar_agendamentos(armazem)
+    if conjunto is CREDENCIAIS:
+        arquivo = obter_arquivo_credenciais()
+        return (lambda: lotes_credenciais(arquivo.obter())), (
+            lambda registros, rejeitar: gravar_credenciais(arquivo, registros)
+        )
+    armazem = obter_armazem_postagens()
+    return armazem.lotes, lambda registros, rejeitar: armazem.inserir_em_massa(registros)
+
+# ==============================
+# Importar e Exportar
+# ==============================
+def renderizar():
+    st.title("📦 Importar e Exportar")
+    st.caption("Agendamentos, postagens e credenciais em CSV ou Parquet, mais relatórios do salão.")
+
+    agenda = obter_agenda_saloes()
+    saloes = agenda.saloes()
+    salao = saloes[0]
+    if len(saloes) > 1:
+        nomes = [s.nome for s in saloes]
+        salao = saloes[nomes.index(st.selectbox("Salão:", nomes, key="salao_dados"))]
+
+    formatos = FORMATOS if pa is not None else ("csv",)
+    if pa is None:
+        st.caption("Parquet indisponível: instale o pacote `pyarrow`.")
+    nome_conjunto = st.selectbox(
+        "Dados:", list(CONJUNTOS), format_func=ROTULOS_CONJUNTOS.get, key="conjunto_dados"
+    )
+    conjunto = CONJUNTOS[nome_conjunto]
+    lotes, gravar = _origem(conjunto, agenda, salao.id)
+
+    st.subheader("⬇️ Exportar")
+    formato = st.radio("Formato:", formatos, horizontal=True, key="formato_exportacao")
+    sufixo = f"_{salao.id}" if conjunto is AGENDAMENTOS else ""
+    # O arquivo só é gerado quando o botão é clicado, não a cada rerun
+    st.download_button(
+        f"⬇️ Baixar {ROTULOS_CONJUNTOS[nome_conjunto].lower()}",
+        data=lambda: exportar_bytes(conjunto, lotes(), formato),
+        file_name=f"{nome_conjunto}{sufixo}.{formato}",
+        mime="text/csv" if formato == "csv" else "application/octet-stream",
+    )
+
+    st.subheader("⬆️ Importar")
+    st.caption(
+        "Registros com o mesmo id são substituídos. Linhas inválidas (e agendamentos que se sobrepõem a outro "
+        "do mesmo profissional) são descartadas e listadas abaixo."
+        + (" Colunas de senha são ignoradas." if conjunto is CREDENCIAIS else "")
+    )
+    enviado = st.file_uploader("Arquivo:", type=list(formatos), key=f"arquivo_{nome_conjunto}")
+    if enviado is not None and st.button("⬆️ Importar arquivo"):
+        try:
+            with secao("importacao"):
+                resultado = importar(conjunto, enviado, gravar, formato_do_arquivo(enviado.name))
+        except (ValueError, RuntimeError) as erro:
+            st.error(f"❌ Nada foi importado: {erro}")
+        else:
+            st.success(f"✅ {resultado.importados} registros importados, {resultado.rejeitados} rejeitados.")
+            for numero, colunas in resultado.erros:
+                st.markdown(f"- Registro {numero}: {', '.join(colunas)}")
+
+    st.markdown("---")
+    st.subheader(f"📊 Relatórios — {salao.nome}")
+    data_inicio, data_fim = filtro_periodo("relatorios")
+    armazem = agenda.armazem(salao.id)
+    with secao("relatorios"):
+        ocupacao = relatorio_ocupacao(armazem, salao, data_inicio, data_fim)
+        por_dia = relatorio_profissionais_dia(armazem, data_inicio, data_fim)
+        populares = relatorio_horarios_populares(armazem, 10, data_inicio, data_fim)
+    if not ocupacao:
+        st.info("Nenhum agendamento confirmado no período.")
+        return
+
+    reservados = sum(linha["minutos_reservados"] for linha in ocupacao)
+    expediente = sum(linha["minutos_expediente"] for linha in ocupacao)
+    st.metric("Taxa de ocupação do salão", f"{reservados / expediente:.1%}" if expediente else "—")
+    st.markdown("**Ocupação por profissional**")
+    st.dataframe(ocupacao, use_container_width=True, hide_index=True)
+    st.markdown("**Agendamentos por profissional e dia**")
+    st.dataframe(por_dia, use_container_width=True, hide_index=True)
+    st.markdown("**Horários mais procurados**")
+    st.dataframe(populares, use_container_width=True, hide_index=True)
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+import streamlit as st
+
+from paginas.comum import ITENS_POR_PAGINA, controles_paginacao
+from paginas.conversas import obter_historico
+
+# ==============================
+# Histórico de Conversas
+# ==============================
+def renderizar():
+    st.title("📜 Histórico de Conversas")
+    historico = obter_historico()
+    total = historico.contar()
+    if total:
+        deslocamento = controles_paginacao("historico", total)
+        # Só a página visível é lida do arquivo, da mais recente para a mais antiga
+        for item in historico.recentes(ITENS_POR_PAGINA, deslocamento):
+            data = datetime.fromisoformat(item["data_hora"]).strftime("%d/%m %H:%M")
+            if item["tipo"] == "usuario_texto":
+                st.markdown(f"**👤 Você** • {data}")
+                st.code(item["conteudo"], language=None)
+            elif item["tipo"] == "ia_resposta":
+                st.markdown(f"**🤖 MSSP** • {data}")
+                st.info(item["conteudo"])
+            st.markdown("---")
+    else:
+        st.info("Nenhuma conversa ainda.")
@@ -0,0 +1,8 @@
+import streamlit as st
+
+# ==============================
+# Histórico de Imagens
+# ==============================
+def renderizar():
+    st.title("🖼️ Histórico de Imagens")
+    st.info("Nenhuma imagem enviada ainda. Envie uma no Chat da MSSP para começar!")
@@ -0,0 +1,8 @@
+import streamlit as st
+
+# ==============================
+# Início
+# ==============================
+def renderizar():
+    st.title("Marie Sophie Souza Pires")
+    st.write("Bem-vindo ao projeto MSSP.")
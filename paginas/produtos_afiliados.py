@@ -0,0 +1,148 @@
+import streamlit as st
+
+from afiliados import PAISES, PLATAFORMAS, BuscadorProdutos, criar_provedores, formatar_euros
+from anuncios import IDIOMAS, GeradorAnuncios, exportar_csv, exportar_jsonl
+from catalogo import CatalogoProdutos
+from metricas import METRICAS, contagem, secao
+from paginas.comum import CATALOGO_BANCO, ITENS_POR_PAGINA, controles_paginacao
+
+# ==============================
+# Buscador de produtos afiliados (compartilhado entre sessões)
+# ==============================
+@st.cache_resource
+def obter_buscador_produtos():
+    return BuscadorProdutos(criar_provedores())
+
+@st.cache_resource
+def obter_catalogo_produtos():
+    catalogo = CatalogoProdutos(CATALOGO_BANCO)
+    METRICAS.adicionar_coletor(contagem("catalogo_produtos", catalogo.contar))
+    return catalogo
+
+@st.cache_resource
+def obter_gerador_anuncios():
+    return GeradorAnuncios()
+
+# ==============================
+# Página: Produtos Afiliados (Europa)
+# ==============================
+def renderizar():
+    st.title("🛒 Produtos Afiliados (Europa)")
+    st.caption("Encontre produtos para promover na Europa — com dados simulados e anúncios prontos.")
+
+    # Anúncios gerados, por (id do produto, idioma) — continuam válidos após uma nova busca
+    if "anuncios_gerados" not in st.session_state:
+        st.session_state.anuncios_gerados = {}
+
+    # Importação de feeds para o catálogo local
+    catalogo = obter_catalogo_produtos()
+    with st.expander(f"📥 Catálogo local ({catalogo.contar()} produtos)"):
+        feed = st.file_uploader("Feed de produtos (CSV ou JSON Lines):", type=["csv", "jsonl"])
+        col_pais, col_plataforma = st.columns(2)
+        with col_pais:
+            pais_feed = st.selectbox("País padrão do feed:", PAISES)
+        with col_plataforma:
+            plataforma_feed = st.selectbox("Plataforma padrão do feed:", PLATAFORMAS)
+        if feed is not None and st.button("📥 Importar feed"):
+            with st.spinner("Importando produtos..."):
+                formato = "csv" if feed.name.lower().endswith(".csv") else "jsonl"
+                importados = catalogo.ingerir_arquivo(
+                    feed, formato, pais_padrao=pais_feed, plataforma_padrao=plataforma_feed
+                )
+            st.success(f"✅ {importados} produtos importados para o catálogo.")
+
+    # Formulário de busca
+    st.subheader("🔍 Buscar Produtos")
+
+    fonte = st.radio("Fonte:", ["Provedores (ao vivo)", "Catálogo local"], horizontal=True)
+
+    palavra_chave = st.text_input("Palavra-chave do produto:", placeholder="Ex: fone bluetooth, relógio smart")
+
+    paises = st.multiselect("Países:", PAISES, default=["Portugal"])
+
+    plataformas = st.multiselect("Plataformas:", PLATAFORMAS, default=["Amazon EU"])
+
+    if st.button("🔍 Buscar produtos"):
+        if not palavra_chave.strip():
+            st.warning("⚠️ Por favor, digite uma palavra-chave.")
+        elif not paises or not plataformas:
+            st.warning("⚠️ Selecione pelo menos um país e uma plataforma.")
+        else:
+            if fonte == "Catálogo local":
+                with secao("busca_catalogo"):
+                    produtos = catalogo.buscar(palavra_chave, paises, plataformas, limite=200)
+            else:
+                # Todas as combinações país × plataforma são consultadas em paralelo (com cache)
+                with secao("busca_provedores"):
+                    produtos, erros = obter_buscador_produtos().buscar(palavra_chave.strip(), paises, plataformas)
+                for pais_erro, plataforma_erro, mensagem in erros:
+                    st.error(f"❌ {plataforma_erro} ({pais_erro}): {mensagem}")
+
+            st.session_state.produtos_encontrados = produtos
+            st.session_state.ultima_busca = {
+                "palavra_chave": palavra_chave,
+                "paises": paises,
+                "plataformas": plataformas
+            }
+
+    # Mostrar resultados da busca
+    if "produtos_encontrados" in st.session_state:
+        st.markdown("---")
+        st.subheader("📦 Produtos Encontrados")
+
+        produtos = st.session_state.produtos_encontrados
+        gerador = obter_gerador_anuncios()
+
+        # Anúncios de todos os produtos encontrados, em lote
+        with st.expander("✍️ Gerar anúncios de todos os produtos"):
+            idiomas = st.multiselect(
+                "Idiomas:", list(IDIOMAS), default=list(IDIOMAS), format_func=IDIOMAS.get
+            )
+            if st.button("✍️ Gerar anúncios em lote") and idiomas:
+                anuncios = list(gerador.gerar_lote(produtos, idiomas))
+                for anuncio in anuncios:
+                    st.session_state.anuncios_gerados[(anuncio.produto_id, anuncio.idioma)] = anuncio.texto
+                # Exportações geradas uma vez, e não a cada rerun da página
+                st.session_state.anuncios_exportados = (exportar_csv(anuncios), exportar_jsonl(anuncios))
+                st.success(f"✅ {len(anuncios)} anúncios gerados.")
+            if "anuncios_exportados" in st.session_state:
+                csv_anuncios, jsonl_anuncios = st.session_state.anuncios_exportados
+                col_csv, col_jsonl = st.columns(2)
+                with col_csv:
+                    st.download_button(
+                        "⬇️ Exportar CSV", csv_anuncios, file_name="anuncios.csv", mime="text/csv"
+                    )
+                with col_jsonl:
+                    st.download_button(
+                        "⬇️ Exportar JSON Lines", jsonl_anuncios, file_name="anuncios.jsonl", mime="application/jsonl"
+                    )
+
+        deslocamento = controles_paginacao("produtos", len(produtos))
+        for prod in produtos[deslocamento:deslocamento + ITENS_POR_PAGINA]:
+            with st.container():
+                st.markdown(f"**{prod.nome}**")
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.write(f"💰 {formatar_euros(prod.preco)}")
+                with col2:
+                    st.write(f"💶 {formatar_euros(prod.comissao)}")
+                with col3:
+                    st.write(f"🌍 {prod.pais}")
+                with col4:
+                    st.write(f"🔗 {prod.plataforma}")
+
+                # Anúncio no idioma do país do produto
+                chave = (prod.id, gerador.idioma_do_produto(prod))
+                if st.button("✍️ Gerar anúncio", key=f"gerar_{prod.id}"):
+                    st.session_state.anuncios_gerados[chave] = gerador.gerar(prod).texto
+
+                # Mostrar anúncio se já foi gerado
+                if chave in st.session_state.anuncios_gerados:
+                    st.text_area(
+                        "Seu anúncio pronto:",
+                        value=st.session_state.anuncios_gerados[chave],
+                        height=180,
+                        key=f"anuncio_{prod.id}"
+                    )
+
+                st.markdown("---")
@@ -0,0 +1,212 @@
+import os
+import re
+import threading
+import unicodedata
+from datetime import date
+
+from armazenamento import ArmazemAgendamentos
+from compartilhado import RecursoCompartilhado, VersaoBanco
+from disponibilidade import IndiceDisponibilidade
+from modelos import DURACAO_PADRAO, EXPEDIENTE_PADRAO, Profissional, Salao
+
+# ==============================
+# Vários salões, um banco por salão
+# ==============================
+# O cadastro (salões, profissionais, expedientes) fica num banco próprio e é
+# lido uma vez por processo, até mudar. As reservas de cada salão ficam num
+# banco SQLite separado (shard): as gravações de um salão movimentado não
+# disputam a trava de escrita dos outros, e a disponibilidade de um salão é
+# montada só a partir do banco dele. Reservas e cancelamentos feitos por
+# aqui atualizam o índice na hora; ele só é remontado quando o banco muda
+# por fora (outro processo, importação) ou quando o cadastro muda.
+
+SALAO_PADRAO = Salao(
+    id="principal",
+    nome="MSSP — Salão de Cabelo",
+    profissionais=tuple(Profissional(nome) for nome in ("Ana", "Bruna", "Carla", "Diego", "Eduardo")),
+)
+
+_FORMATO_ID = re.compile(r"^[a-z0-9][a-z0-9_-]{0,63}$")
+
+
+def identificador_salao(nome):
+    """Id seguro para nome de arquivo a partir do nome do salão ("Salão Bela Vista" -> "salao-bela-vista")."""
+    sem_acentos = unicodedata.normalize("NFKD", nome).encode("ascii", "ignore").decode("ascii")
+    identificador = re.sub(r"[^a-z0-9]+", "-", sem_acentos.lower()).strip("-")[:64]
+    if not identificador:
+        raise ValueError(f"Nome de salão inválido: {nome!r}")
+    return identificador
+
+
+def ler_profissionais(texto):
+    """
+    Uma linha por profissional: `Nome | 09:00-13:00 14:00-19:00 | 30`
+    (expediente e duração em minutos são opcionais).
+    """
+    profissionais = []
+    for numero, linha in enumerate(texto.splitlines(), start=1):
+        partes = [parte.strip() for parte in linha.split("|")]
+        if not partes[0]:
+            continue
+        try:
+            expediente = tuple(
+                tuple(periodo.split("-")) for periodo in partes[1].split()
+            ) if len(partes) > 1 and partes[1] else EXPEDIENTE_PADRAO
+            duracao = int(partes[2]) if len(partes) > 2 and partes[2] else DURACAO_PADRAO
+            profissional = Profissional(partes[0], expediente, duracao)
+            if duracao <= 0 or not profissional.horarios():
+                raise ValueError
+        except (ValueError, TypeError):
+            raise ValueError(f"Linha {numero}: use `Nome | 09:00-13:00 14:00-19:00 | 30`") from None
+        profissionais.append(profissional)
+    return tuple(profissionais)
+
+
+def formatar_profissionais(profissionais):
+    """Inverso de ler_profissionais, para edição."""
+    return "\n".join(
+        f"{p.nome} | {' '.join(f'{inicio}-{fim}' for inicio, fim in p.expediente)} | {p.duracao}"
+        for p in profissionais
+    )
+
+
+class AgendaSaloes:
+    """
+    Acesso aos agendamentos por salão. Os bancos dos salões são abertos sob
+    demanda e cada salão tem o seu índice de disponibilidade, compartilhado
+    entre as sessões.
+    """
+
+    def __init__(self, cadastro, pasta):
+        self.cadastro = cadastro
+        self.pasta = str(pasta)
+        self._versao_cadastro = VersaoBanco(cadastro.caminho)
+        self._saloes = RecursoCompartilhado(cadastro.carregar, self._versao_cadastro)
+        self._armazens = {}
+        self._indices = {}
+        self._trava = threading.Lock()
+
+    def caminho_padrao(self, salao_id):
+        return os.path.join(self.pasta, f"salao_{salao_id}.db")
+
+    # ------------------------------
+    # Cadastro
+    # ------------------------------
+    def registrar(self, salao, banco=None):
+        if not _FORMATO_ID.match(salao.id):
+            raise ValueError(f"Id de salão inválido: {salao.id!r}")
+        self.cadastro.salvar(salao, banco or self.caminho_padrao(salao.id))
+
+    def saloes(self):
+        """Salões cadastrados, em ordem de nome."""
+        return [salao for salao, _ in self._saloes.obter().values()]
+
+    def salao(self, salao_id):
+        """Levanta KeyError se o salão não estiver cadastrado."""
+        return self._saloes.obter()[salao_id][0]
+
+    def bancos(self):
+        """{id do salão: caminho do banco de agendamentos dele}."""
+        return {salao_id: banco for salao_id, (_, banco) in self._saloes.obter().items()}
+
+    # ------------------------------
+    # Bancos e índices por salão
+    # ------------------------------
+    def armazem(self, salao_id):
+        armazem = self._armazens.get(salao_id)
+        if armazem is None:
+            banco = self._saloes.obter()[salao_id][1]
+            with self._trava:
+                armazem = self._armazens.get(salao_id)
+                if armazem is None:
+                    os.makedirs(os.path.dirname(os.path.abspath(banco)), exist_ok=True)
+                    armazem = self._armazens[salao_id] = ArmazemAgendamentos(banco)
+        return armazem
+
+    def _recurso_indice(self, salao_id):
+        """(índice compartilhado, versão do banco do salão); a conexão da versão é a das gravações locais."""
+        par = self._indices.get(salao_id)
+        if par is None:
+            armazem = self.armazem(salao_id)
+            with self._trava:
+                par = self._indices.get(salao_id)
+                if par is None:
+                    versao_banco = VersaoBanco(armazem.caminho)
+                    versao_cadastro = self._versao_cadastro
+                    recurso = RecursoCompartilhado(
+                        lambda: self._construir_indice(salao_id, armazem),
+                        # Remontado se o banco do salão mudar por fora ou se o expediente for editado
+                        lambda: (versao_banco(), versao_cadastro()),
+                    )
+                    par = self._indices[salao_id] = (recurso, versao_banco)
+        return par
+
+    def _construir_indice(self, salao_id, armazem):
+        salao = self.salao(salao_id)
+        return IndiceDisponibilidade.construir(
+            # Datas passadas não recebem reservas: não entram no índice
+            armazem.ocupacoes(desde=date.today()),
+            grades={p.nome: p.grade() for p in salao.profissionais},
+            grade_padrao=(),
+        )
+
+    def indice(self, salao_id):
+        return self._recurso_indice(salao_id)[0].obter()
+
+    def recarregar_indice(self, salao_id):
+        """Descarta o índice montado do salão: a próxima leitura o remonta do banco e do cadastro."""
+        par = self._indices.get(salao_id)
+        if par is not None:
+            par[0].invalidar()
+
+    def _gravar(self, salao_id, gravar, atualizar):
+        """
+        Grava pela conexão da versão do banco do salão (não conta como mudança)
+        e aplica `atualizar(índice, resultado)` ao índice montado, com a trava
+        de montagem: o índice acompanha a gravação sem ser remontado.
+        """
+        recurso, versao_banco = self._recurso_indice(salao_id)
+        recurso.obter()  # remonta antes, se houver mudança de fora, e não durante a gravação
+
+        def gravar_e_atualizar(indice):
+            resultado = versao_banco.gravar(gravar)
+            if indice is not None:
+                atualizar(indice, resultado)
+            return resultado
+
+        return recurso.alterar(gravar_e_atualizar)
+
+    def livres(self, salao_id, data, profissional, duracao=DURACAO_PADRAO):
+        return self.indice(salao_id).livres(data, profissional, duracao)
+
+    # ------------------------------
+    # Reservas
+    # ------------------------------
+    def reservar(self, salao_id, agendamento):
+        """
+        Reserva no banco do salão. Levanta ValueError se o profissional não
+        atende nesse salão, nesse horário ou por todo o serviço; retorna False
+        se o intervalo conflitar com outra reserva.
+        """
+        profissional = self.salao(salao_id).profissional(agendamento.profissional)
+        if profissional is None or not profissional.atende(agendamento.horario, agendamento.duracao):
+            raise ValueError(
+                f"{agendamento.profissional} não atende das {agendamento.horario} às {agendamento.fim} neste salão"
+            )
+        armazem = self.armazem(salao_id)
+
+        def marcar(indice, reservado):
+            if reservado:
+                indice.marcar(agendamento.data, agendamento.profissional, agendamento.horario, agendamento.duracao)
+
+        return self._gravar(salao_id, lambda conn: armazem.reservar(agendamento, conn), marcar)
+
+    def cancelar(self, salao_id, id_agendamento):
+        """Cancela e devolve o agendamento como estava antes (ou None)."""
+        armazem = self.armazem(salao_id)
+
+        def desmarcar(indice, anterior):
+            if anterior is not None and anterior.status == "confirmado":
+                indice.desmarcar(anterior.data, anterior.profissional, anterior.horario, anterior.duracao)
+
+        return self._gravar(salao_id, lambda conn: armazem.cancelar(id_agendamento, conn), desmarcar)
@@ -0,0 +1,238 @@
+"""
+Provedores de segredos (senhas das plataformas) e cache das credenciais resolvidas.
+
+Uso:
+    python segredos.py chave                      # gera uma chave para MSSP_CHAVE_SEGREDOS
+    python segredos.py gravar Instagram           # pede a senha e grava no arquivo criptografado
+    python segredos.py remover Instagram
+"""
+import argparse
+import getpass
+import json
+import os
+import time
+from dataclasses import dataclass, field
+
+from armazenamento import gravar_texto_atomico
+from compartilhado import RecursoCompartilhado, VersaoArquivo
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # sem cryptography: o arquivo criptografado fica indisponível
+    Fernet = None
+
+# ==============================
+# Segredos das credenciais
+# ==============================
+# As senhas nunca ficam em credenciais.json: vêm de provedores consultados
+# em ordem (variáveis de ambiente, st.secrets, arquivo local criptografado).
+# O ResolvedorCredenciais guarda a credencial resolvida — ou a ausência
+# dela — por um tempo de validade, só em memória: dentro da validade, quem
+# publica em laço (agendador, APIs de afiliados) obtém a credencial com uma
+# consulta a um dicionário, sem ler ambiente, disco ou rede.
+
+PREFIXO_SEGREDO = "SENHA_"
+VALIDADE_PADRAO = 5 * 60    # segundos
+VARIAVEL_CHAVE = "MSSP_CHAVE_SEGREDOS"
+SEGREDOS_ARQUIVO = "segredos.enc"
+
+
+def nome_segredo(plataforma):
+    """Nome do segredo de uma plataforma ("Shopify Blog" -> "SENHA_SHOPIFY_BLOG")."""
+    return f"{PREFIXO_SEGREDO}{plataforma.upper().replace(' ', '_')}"
+
+
+@dataclass(frozen=True, slots=True)
+class CredencialResolvida:
+    plataforma: str
+    origem: str                       # nome do provedor que forneceu a senha
+    senha: str = field(repr=False)    # nunca aparece em logs nem em mensagens de erro
+
+
+# ==============================
+# Provedores
+# ==============================
+class ProvedorSegredos:
+    """Interface dos provedores: obter() devolve o valor do segredo ou None."""
+
+    nome = ""
+
+    def obter(self, nome):
+        raise NotImplementedError
+
+
+class ProvedorAmbiente(ProvedorSegredos):
+    """Variáveis de ambiente (ex.: SENHA_INSTAGRAM)."""
+
+    nome = "ambiente"
+
+    def __init__(self, ambiente=None):
+        self.ambiente = os.environ if ambiente is None else ambiente
+
+    def obter(self, nome):
+        return self.ambiente.get(nome) or None
+
+
+class ProvedorStreamlit(ProvedorSegredos):
+    """st.secrets (Settings > Secrets no Streamlit Cloud, ou .streamlit/secrets.toml)."""
+
+    nome = "streamlit"
+
+    def obter(self, nome):
+        import streamlit as st
+        try:
+            valor = st.secrets.get(nome)
+        except Exception:
+            # Sem secrets.toml o Streamlit levanta erro no primeiro acesso
+            return None
+        return str(valor) if valor else None
+
+
+class ProvedorArquivoCriptografado(ProvedorSegredos):
+    """
+    Arquivo local com um JSON {nome: valor} criptografado (Fernet). O arquivo
+    é decifrado uma vez e de novo só quando muda. Requer o pacote cryptography.
+    """
+
+    nome = "arquivo"
+
+    def __init__(self, caminho=SEGREDOS_ARQUIVO, chave=None):
+        if Fernet is None:
+            raise RuntimeError("O arquivo de segredos requer o pacote cryptography (pip install cryptography)")
+        chave = chave or os.environ.get(VARIAVEL_CHAVE)
+        if not chave:
+            raise RuntimeError(f"Defina {VARIAVEL_CHAVE} com a chave do arquivo de segredos")
+        self.caminho = str(caminho)
+        self._fernet = Fernet(chave)
+        self._segredos = RecursoCompartilhado(self._ler, VersaoArquivo(self.caminho))
+
+    def _ler(self):
+        if not os.path.exists(self.caminho):
+            return {}
+        with open(self.caminho, "rb") as f:
+            try:
+                return json.loads(self._fernet.decrypt(f.read()))
+            except InvalidToken:
+                raise RuntimeError(f"{self.caminho}: chave incorreta ou arquivo corrompido") from None
+
+    def obter(self, nome):
+        return self._segredos.obter().get(nome) or None
+
+    def gravar(self, nome, valor):
+        """Grava (ou remove, com valor None) um segredo."""
+        segredos = dict(self._ler())
+        if valor is None:
+            segredos.pop(nome, None)
+        else:
+            segredos[nome] = valor
+        conteudo = self._fernet.encrypt(json.dumps(segredos).encode("utf-8")).decode("ascii")
+        gravar_texto_atomico(self.caminho, conteudo)
+        self._segredos.invalidar()
+
+
+class ProvedorMemoria(ProvedorSegredos):
+    """Provedor local, em memória, para testes e benchmarks. Conta as consultas recebidas."""
+
+    nome = "memoria"
+
+    def __init__(self, segredos=None):
+        self.segredos = dict(segredos or {})
+        self.consultas = 0
+
+    def obter(self, nome):
+        self.consultas += 1
+        return self.segredos.get(nome) or None
+
+
+def provedores_padrao(arquivo=SEGREDOS_ARQUIVO):
+    """Ambiente, st.secrets e, se houver chave e cryptography, o arquivo criptografado."""
+    provedores = [ProvedorAmbiente(), ProvedorStreamlit()]
+    if Fernet is not None and os.environ.get(VARIAVEL_CHAVE):
+        try:
+            provedores.append(ProvedorArquivoCriptografado(arquivo))
+        except ValueError:
+            pass  # chave em formato inválido: segue com os outros provedores
+    return provedores
+
+
+# ==============================
+# Resolução com cache
+# ==============================
+class ResolvedorCredenciais:
+    """
+    Consulta os provedores em ordem e guarda o resultado por `validade`
+    segundos, inclusive "não configurada" (para um laço não consultar os
+    provedores a cada volta). invalidar() descarta uma plataforma ou todas.
+    """
+
+    def __init__(self, provedores, validade=VALIDADE_PADRAO, relogio=time.monotonic):
+        self.provedores = list(provedores)
+        self.validade = validade
+        self._relogio = relogio
+        # plataforma -> (expira em, credencial ou None); só em memória, nunca vai para o disco.
+        # Poucas plataformas: um dict sem trava basta (get e atribuição são atômicos no CPython)
+        self._resolvidas = {}
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, plataforma):
+        """CredencialResolvida, ou None se nenhum provedor tiver a senha."""
+        entrada = self._resolvidas.get(plataforma)
+        if entrada is not None and entrada[0] > self._relogio():
+            self.acertos += 1
+            return entrada[1]
+        self.falhas += 1
+        credencial = self._resolver(plataforma)
+        self._resolvidas[plataforma] = (self._relogio() + self.validade, credencial)
+        return credencial
+
+    def _resolver(self, plataforma):
+        nome = nome_segredo(plataforma)
+        for provedor in self.provedores:
+            try:
+                senha = provedor.obter(nome)
+            except Exception:
+                # Um provedor indisponível não impede os seguintes
+                continue
+            if senha:
+                return CredencialResolvida(plataforma, provedor.nome, senha)
+        return None
+
+    def invalidar(self, plataforma=None):
+        if plataforma is None:
+            self._resolvidas.clear()
+        else:
+            self._resolvidas.pop(plataforma, None)
+
+    def estatisticas(self):
+        return {"acertos": self.acertos, "falhas": self.falhas, "itens": len(self._resolvidas)}
+
+
+# ==============================
+# Linha de comando (arquivo criptografado)
+# ==============================
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("acao", choices=("chave", "gravar", "remover"))
+    parser.add_argument("plataforma", nargs="?")
+    parser.add_argument("--arquivo", default=SEGREDOS_ARQUIVO)
+    args = parser.parse_args()
+
+    if Fernet is None:
+        parser.exit(1, "Instale o pacote cryptography (pip install cryptography).\n")
+    if args.acao == "chave":
+        print(Fernet.generate_key().decode("ascii"))
+        return
+    if not args.plataforma:
+        parser.error("informe a plataforma")
+    try:
+        provedor = ProvedorArquivoCriptografado(args.arquivo)
+        valor = getpass.getpass(f"Senha de {args.plataforma}: ") if args.acao == "gravar" else None
+        provedor.gravar(nome_segredo(args.plataforma), valor)
+    except RuntimeError as erro:
+        parser.exit(1, f"{erro}\n")
+    print(f"{nome_segredo(args.plataforma)} {'gravado em' if valor else 'removido de'} {args.arquivo}.")
+
+
+if __name__ == "__main__":
+    main()
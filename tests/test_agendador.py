@@ -0,0 +1,146 @@
+from datetime import datetime
+
+import pytest
+
+import agendador
+from agendador import AgendadorPostagens, PublicadorLocal, chave_disparo
+from armazenamento import ArmazemExecucoes, ArmazemPostagens
+from modelos import AgendamentoPostagem
+
+CRIADO_EM = "2030-01-01T08:00:00"
+DISPARO = datetime(2030, 1, 7, 10, 0).timestamp()
+
+
+class Relogio:
+    def __init__(self, agora):
+        self.agora = agora
+
+    def __call__(self):
+        return self.agora
+
+
+class PublicadorInstavel(PublicadorLocal):
+    """Falha nas `falhas` primeiras chamadas e depois publica."""
+
+    def __init__(self, falhas):
+        super().__init__("Instagram")
+        self.falhas = falhas
+        self.chamadas = 0
+
+    def publicar(self, agendamento, momento, chave_idempotencia):
+        self.chamadas += 1
+        if self.chamadas <= self.falhas:
+            raise ConnectionError("fora do ar")
+        return super().publicar(agendamento, momento, chave_idempotencia)
+
+
+@pytest.fixture
+def armazens(tmp_path):
+    caminho = tmp_path / "postagens.db"
+    return ArmazemPostagens(caminho), ArmazemExecucoes(caminho)
+
+
+def postagem(id_, *horarios):
+    return AgendamentoPostagem(id_, CRIADO_EM, "Instagram", "oferta", horarios or ("10:00",))
+
+
+def novo_agendador(armazens, publicador, agora):
+    armazem, execucoes = armazens
+    return AgendadorPostagens(armazem, execucoes, {"Instagram": publicador}, max_trabalhadores=1,
+                              relogio=Relogio(agora))
+
+
+def disparos(atual):
+    return sorted((momento, chave, horario) for momento, _, chave, _, horario in atual._fila)
+
+
+def rodar_vencidos(atual):
+    for momento, chave, agendamento_id in atual._retirar_vencidos(atual._relogio()):
+        atual._disparar(momento, chave, agendamento_id)
+
+
+def test_falha_vira_pendente_com_backoff_e_depois_falhou(armazens, monkeypatch):
+    monkeypatch.setattr(agendador.random, "uniform", lambda a, b: 1.0)
+    armazens[0].adicionar(postagem("a"))
+    atual = novo_agendador(armazens, PublicadorInstavel(falhas=99), DISPARO)
+    atual.sincronizar()
+    chave = chave_disparo("a", DISPARO)
+
+    esperas = []
+    for _ in range(agendador.MAXIMO_TENTATIVAS):
+        rodar_vencidos(atual)
+        retentativas = [momento for momento, c, horario in disparos(atual) if c == chave and horario is None]
+        if retentativas:
+            esperas.append(retentativas[0] - atual._relogio.agora)
+            atual._relogio.agora = retentativas[0]
+
+    assert esperas == [30, 60, 120, 240]
+    assert armazens[1].estado(chave) == ("falhou", agendador.MAXIMO_TENTATIVAS)
+    assert armazens[1].pendentes() == []
+    assert atual.falhas == 1 and atual.publicados == 0
+
+
+def test_disparo_publica_uma_vez_e_nova_tentativa_mantem_o_rotulo(armazens):
+    armazens[0].adicionar(postagem("a"))
+    publicador = PublicadorInstavel(falhas=1)
+    atual = novo_agendador(armazens, publicador, DISPARO)
+    atual.sincronizar()
+    chave = chave_disparo("a", DISPARO)
+
+    rodar_vencidos(atual)
+    atual._relogio.agora += 3600
+    rodar_vencidos(atual)
+    # Disparo repetido (ex.: a chave voltou ao heap) não publica de novo
+    atual._disparar(DISPARO, chave, "a")
+
+    assert armazens[1].estado(chave) == ("publicado", 2)
+    [execucao] = armazens[1].recentes(10)
+    assert execucao["disparo"] == "2030-01-07T10:00"
+    assert publicador.chamadas == 2 and atual.publicados == 1
+
+
+def test_reinicio_com_tentativa_pendente_nao_dispara_duas_vezes(armazens):
+    armazem, execucoes = armazens
+    armazem.adicionar(postagem("a"))
+    agora = DISPARO + 170
+    chave = chave_disparo("a", DISPARO)
+    execucoes.registrar(chave, "a", "2030-01-07T10:00", "pendente", 1, agora + 33, "fora do ar")
+
+    atual = novo_agendador(armazens, PublicadorInstavel(falhas=0), agora)
+    atual.retomar()
+    atual.sincronizar()
+
+    amanha = datetime(2030, 1, 8, 10, 0).timestamp()
+    assert disparos(atual) == [(agora + 33, chave, None), (amanha, chave_disparo("a", amanha), "10:00")]
+
+
+def test_sincronizar_le_so_o_novo_e_percebe_regravacoes_e_exclusoes(armazens):
+    armazem, _ = armazens
+    armazem.adicionar(postagem("a"))
+    armazem.adicionar(postagem("b"))
+    atual = novo_agendador(armazens, PublicadorInstavel(falhas=0), DISPARO - 3600)
+    assert atual.sincronizar() == 2
+    assert atual.sincronizar() == 0
+
+    # Horário acrescentado num agendamento regravado
+    armazem.adicionar(postagem("a", "10:00", "11:00"))
+    assert atual.sincronizar() == 0
+    assert len(atual) == 3
+
+    # salvar() regrava tudo e os rowids recomeçam
+    armazem.salvar([postagem("c")])
+    assert atual.sincronizar() == 1
+    assert set(atual._agendamentos) == {"c"}
+
+    # Linha da marca apagada e outra gravada no mesmo rowid
+    armazem._conexao().execute("DELETE FROM agendamentos_postagem WHERE id = 'c'")
+    armazem.adicionar(postagem("d"))
+    assert atual.sincronizar() == 1
+    assert set(atual._agendamentos) == {"d"}
+
+    # Linha abaixo da marca apagada
+    armazem.adicionar(postagem("e"))
+    atual.sincronizar()
+    armazem._conexao().execute("DELETE FROM agendamentos_postagem WHERE id = 'd'")
+    atual.sincronizar()
+    assert set(atual._agendamentos) == {"e"}
@@ -0,0 +1,87 @@
+import sqlite3
+
+import pytest
+
+from armazenamento import ArmazemAgendamentos, ArmazemPostagens
+from modelos import AgendamentoPostagem, AgendamentoSalao
+
+DIA = "2030-01-07"
+
+
+@pytest.fixture
+def armazem(tmp_path):
+    return ArmazemAgendamentos(tmp_path / "salao.db")
+
+
+def test_reservar_recusa_sobreposicao_e_aceita_intervalos_vizinhos(armazem):
+    assert armazem.reservar(AgendamentoSalao("a", DIA, "Ana", "10:00", duracao=90))
+
+    assert not armazem.reservar(AgendamentoSalao("b", DIA, "Ana", "11:00", duracao=30))   # dentro de a
+    assert not armazem.reservar(AgendamentoSalao("c", DIA, "Ana", "09:30", duracao=60))   # termina dentro de a
+    assert not armazem.reservar(AgendamentoSalao("d", DIA, "Ana", "09:00", duracao=180))  # cobre a inteiro
+    assert armazem.reservar(AgendamentoSalao("e", DIA, "Ana", "09:00", duracao=60))       # termina quando a começa
+    assert armazem.reservar(AgendamentoSalao("f", DIA, "Ana", "11:30", duracao=30))       # começa quando a termina
+    assert armazem.reservar(AgendamentoSalao("g", DIA, "Bruna", "10:00", duracao=90))     # outro profissional
+    assert armazem.reservar(AgendamentoSalao("h", "2030-01-08", "Ana", "10:00", duracao=90))
+
+    assert {ag.id for ag in armazem.carregar()} == {"a", "e", "f", "g", "h"}
+
+
+def test_cancelar_libera_o_intervalo_e_devolve_o_registro_anterior(armazem):
+    assert armazem.reservar(AgendamentoSalao("a", DIA, "Ana", "10:00", duracao=60))
+
+    anterior = armazem.cancelar("a")
+
+    assert anterior.status == "confirmado" and anterior.duracao == 60
+    assert armazem.reservar(AgendamentoSalao("b", DIA, "Ana", "10:00", duracao=60))
+    assert armazem.cancelar("inexistente") is None
+
+
+def test_indice_parcial_vale_so_para_confirmados(armazem):
+    armazem.adicionar(AgendamentoSalao("a", DIA, "Ana", "10:00"))
+    armazem.adicionar(AgendamentoSalao("b", DIA, "Ana", "10:00", status="cancelado"))
+
+    with pytest.raises(sqlite3.IntegrityError):
+        armazem.adicionar(AgendamentoSalao("c", DIA, "Ana", "10:00"))
+
+
+def test_carga_em_massa_marca_duplicados_e_recria_o_indice(tmp_path, armazem):
+    armazem.inserir_em_massa([
+        AgendamentoSalao("a", DIA, "Ana", "10:00"),
+        AgendamentoSalao("b", DIA, "Ana", "10:00"),
+        AgendamentoSalao("c", DIA, "Bruna", "10:00"),
+    ])
+
+    assert {ag.id: ag.status for ag in armazem.carregar()} == {"a": "confirmado", "b": "conflito", "c": "confirmado"}
+    with pytest.raises(sqlite3.IntegrityError):
+        armazem.adicionar(AgendamentoSalao("d", DIA, "Ana", "10:00"))
+    # Reabrir não roda a varredura de novo nem perde o índice
+    reaberto = ArmazemAgendamentos(tmp_path / "salao.db")
+    with pytest.raises(sqlite3.IntegrityError):
+        reaberto.adicionar(AgendamentoSalao("d", DIA, "Ana", "10:00"))
+
+
+def test_ocupacoes_filtra_confirmados_a_partir_da_data(armazem):
+    armazem.inserir_em_massa([
+        AgendamentoSalao("passado", "2030-01-06", "Ana", "10:00"),
+        AgendamentoSalao("hoje", DIA, "Ana", "10:00", duracao=30),
+        AgendamentoSalao("cancelado", DIA, "Ana", "11:00", status="cancelado"),
+    ])
+
+    assert list(armazem.ocupacoes(desde=DIA)) == [(DIA, "Ana", "10:00", 30)]
+
+
+def test_postagens_salvar_conta_regravacoes_e_regravar_muda_o_rowid(tmp_path):
+    armazem = ArmazemPostagens(tmp_path / "postagens.db")
+    postagem = AgendamentoPostagem("p1", "2030-01-01T08:00:00", "Instagram", "oferta", ("09:00",))
+    armazem.adicionar(postagem)
+    assert armazem.regravacoes() == 0
+    [(rowid, _)] = armazem.gravados_desde()
+
+    armazem.adicionar(postagem)
+    assert [r for r, _ in armazem.gravados_desde(rowid)] == [rowid + 1]
+
+    armazem.salvar([postagem])
+    armazem.salvar([postagem])
+    assert armazem.regravacoes() == 2
+    assert [ag for _, ag in armazem.gravados_desde()] == [postagem]
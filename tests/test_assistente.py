@@ -0,0 +1,77 @@
+import pytest
+
+from assistente import BackendLocal, PipelineRespostas, chave_resposta, janela_historico
+from cache import CacheLRU
+
+
+class BackendContador(BackendLocal):
+    def __init__(self):
+        super().__init__()
+        self.chamadas = 0
+
+    def gerar(self, mensagem_usuario, historico_recente):
+        self.chamadas += 1
+        yield from super().gerar(mensagem_usuario, historico_recente)
+
+
+@pytest.fixture
+def pipeline():
+    atual = PipelineRespostas(BackendContador(), cache=CacheLRU())
+    yield atual
+    atual.encerrar()
+
+
+def mensagem(conteudo, tipo="usuario_texto"):
+    return {"tipo": tipo, "conteudo": conteudo}
+
+
+def test_pergunta_de_continuacao_nao_reaproveita_resposta_de_outra_conversa(pipeline):
+    sobre_shopify = [mensagem("Como montar a loja na Shopify?")]
+    sobre_clickbank = [mensagem("Quero vender no ClickBank")]
+
+    primeira = pipeline.responder("e depois?", sobre_shopify)
+    segunda = pipeline.responder("e depois?", sobre_clickbank)
+
+    assert "Shopify" in primeira and "ClickBank" not in primeira
+    assert "ClickBank" in segunda and "Shopify" not in segunda
+    assert pipeline.backend.chamadas == 2
+    # A mesma conversa repetida continua vindo do cache
+    assert pipeline.responder("e depois?", sobre_shopify) == primeira
+    assert pipeline.backend.chamadas == 2
+
+
+def test_pergunta_com_tema_usa_o_cache_independente_do_historico(pipeline):
+    primeira = pipeline.responder("Como integrar o ClickBank?", [mensagem("oi")])
+    segunda = pipeline.responder("como integrar clickbank", [mensagem("Shopify")])
+
+    assert primeira == segunda
+    assert pipeline.backend.chamadas == 1
+
+
+def test_cache_usa_historico_forca_o_historico_na_chave():
+    atual = PipelineRespostas(BackendContador(), cache=CacheLRU(), cache_usa_historico=True)
+    try:
+        atual.responder("Como integrar o ClickBank?", [mensagem("oi")])
+        atual.responder("Como integrar o ClickBank?", [mensagem("tchau")])
+    finally:
+        atual.encerrar()
+
+    assert atual.backend.chamadas == 2
+
+
+def test_chave_resposta_normaliza_e_separa_historicos():
+    assert chave_resposta("Como integrar o ClickBank?") == chave_resposta("como integrar clickbank")
+    assert chave_resposta("Ação") == "acao"
+    assert chave_resposta("e depois?", [mensagem("Shopify")]) != chave_resposta("e depois?", [mensagem("ClickBank")])
+    assert chave_resposta("e depois?", []) == chave_resposta("e depois?")
+
+
+def test_janela_historico_respeita_orcamento_e_ordem():
+    historico = [mensagem("x" * 40) for _ in range(10)]  # 11 tokens cada
+    historico[-1] = mensagem("ultima")
+
+    janela = janela_historico(historico, orcamento_tokens=30)
+    assert janela == [historico[-3], historico[-2], historico[-1]]
+    assert janela_historico(historico, maximo_mensagens=2) == historico[-2:]
+    # A mensagem mais recente entra mesmo sozinha passando do orçamento
+    assert janela_historico([mensagem("x" * 400)], orcamento_tokens=10) == [mensagem("x" * 400)]
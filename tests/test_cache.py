@@ -0,0 +1,82 @@
+import pytest
+
+from cache import CacheLRU
+
+
+class Relogio:
+    def __init__(self, agora=1000.0):
+        self.agora = agora
+
+    def __call__(self):
+        return self.agora
+
+
+@pytest.fixture
+def relogio():
+    return Relogio()
+
+
+def test_descarta_o_menos_usado_ao_passar_da_capacidade():
+    cache = CacheLRU(capacidade=2)
+    cache.guardar("a", 1)
+    cache.guardar("b", 2)
+    assert cache.obter("a") == 1  # "a" passa a ser o mais recente
+
+    cache.guardar("c", 3)
+
+    assert cache.obter("b") is None
+    assert (cache.obter("a"), cache.obter("c")) == (1, 3)
+    assert len(cache) == 2
+
+
+def test_ttl_expira_e_conta_separado(relogio):
+    cache = CacheLRU(ttl=60, relogio=relogio)
+    cache.guardar("a", 1)
+
+    relogio.agora += 60
+    assert cache.obter("a") == 1
+    relogio.agora += 1
+    assert cache.obter("a", "padrao") == "padrao"
+    assert cache.obter("a") is None
+
+    estatisticas = cache.estatisticas()
+    assert (estatisticas["acertos"], estatisticas["falhas"], estatisticas["expirados"]) == (1, 2, 1)
+    assert estatisticas["itens"] == 0
+    assert estatisticas["taxa_acerto"] == pytest.approx(1 / 3)
+
+
+def test_guardar_de_novo_renova_o_prazo(relogio):
+    cache = CacheLRU(ttl=60, relogio=relogio)
+    cache.guardar("a", 1)
+    relogio.agora += 50
+    cache.guardar("a", 2)
+    relogio.agora += 50
+
+    assert cache.obter("a") == 2
+
+
+def test_persistencia_recarrega_validos_e_descarta_expirados(tmp_path, relogio):
+    caminho = tmp_path / "cache.json"
+    cache = CacheLRU(capacidade=10, ttl=60, caminho=caminho, salvar_a_cada=100, relogio=relogio)
+    cache.guardar("velho", 1)
+    relogio.agora += 30
+    cache.guardar("novo", 2)
+    cache.salvar()
+
+    relogio.agora += 40
+    recarregado = CacheLRU(capacidade=10, ttl=60, caminho=caminho, relogio=relogio)
+
+    assert recarregado.obter("velho") is None
+    assert recarregado.obter("novo") == 2
+    assert len(recarregado) == 1
+
+
+def test_salva_sozinho_a_cada_n_alteracoes(tmp_path):
+    caminho = tmp_path / "cache.json"
+    cache = CacheLRU(caminho=caminho, salvar_a_cada=2)
+    cache.guardar("a", 1)
+    assert not caminho.exists()
+
+    cache.guardar("b", 2)
+
+    assert CacheLRU(caminho=caminho).obter("b") == 2
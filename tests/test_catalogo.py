@@ -0,0 +1,42 @@
+import pytest
+
+from catalogo import CANDIDATOS_POR_BUSCA, CatalogoProdutos
+
+
+@pytest.fixture
+def catalogo(tmp_path):
+    return CatalogoProdutos(tmp_path / "catalogo.db")
+
+
+def test_nome_vem_antes_da_descricao_mesmo_com_comissao_alta(catalogo):
+    catalogo.ingerir([
+        {"id": "nome", "nome": "Relógio inteligente", "preco": 250, "comissao": 5},
+        {"id": "descricao", "nome": "Capa barata", "descricao": "combina com o relógio", "preco": 1, "comissao": 90},
+        {"id": "curto", "nome": "Relógio", "preco": 250, "comissao": 5},
+    ], pais_padrao="Portugal", plataforma_padrao="Awin")
+
+    # Nome mais curto tem bm25 maior; a descrição fica no nível de baixo
+    assert [p.id for p in catalogo.buscar("relogio")] == ["curto", "nome", "descricao"]
+    assert [p.id for p in catalogo.buscar("relogio", paises=["Portugal"])] == ["curto", "nome", "descricao"]
+    assert catalogo.buscar("relogio", paises=["Espanha"]) == []
+
+
+def test_comissao_e_preco_desempatam_dentro_do_nivel(catalogo):
+    catalogo.ingerir([
+        {"id": "caro", "nome": "Fone bluetooth", "preco": 200, "comissao": 10},
+        {"id": "barato", "nome": "Fone bluetooth", "preco": 20, "comissao": 10},
+        {"id": "comissao", "nome": "Fone bluetooth", "preco": 200, "comissao": 40},
+    ])
+
+    assert [p.id for p in catalogo.buscar("fone blue")] == ["comissao", "barato", "caro"]
+
+
+def test_nivel_da_descricao_so_e_lido_se_o_nome_nao_preencher_o_limite(catalogo):
+    catalogo.ingerir(
+        [{"id": f"d{i}", "nome": "Capa", "descricao": "para mochila", "preco": 1, "comissao": 90} for i in range(3)]
+        + [{"id": f"n{i}", "nome": "Mochila", "preco": 50, "comissao": 1} for i in range(CANDIDATOS_POR_BUSCA + 5)]
+    )
+
+    resultados = catalogo.buscar("mochila", limite=10)
+    assert len(resultados) == 10
+    assert all(p.id.startswith("n") for p in resultados)
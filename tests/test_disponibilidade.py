@@ -0,0 +1,63 @@
+from disponibilidade import IndiceDisponibilidade
+from modelos import Profissional
+
+DIA = "2030-01-07"
+# Ana: 09:00-12:00 de 30 em 30 minutos
+GRADES = {"Ana": Profissional("Ana", (("09:00", "12:00"),), 30).grade()}
+
+
+def indice(*ocupacoes):
+    return IndiceDisponibilidade.construir(ocupacoes, grades=GRADES, grade_padrao=())
+
+
+def test_livres_respeita_reservas_e_o_fim_do_expediente():
+    ocupado = indice((DIA, "Ana", "10:00", 60))
+
+    assert ocupado.livres(DIA, "Ana", 30) == ["09:00", "09:30", "11:00", "11:30"]
+    assert ocupado.livres(DIA, "Ana", 60) == ["09:00", "11:00"]
+    assert ocupado.livres(DIA, "Ana", 120) == []
+    assert ocupado.livres("2030-01-08", "Ana", 180) == ["09:00"]
+    assert ocupado.livres(DIA, "Bruna", 30) == []  # sem grade
+
+
+def test_esta_livre_confere_grade_expediente_e_conflitos():
+    ocupado = indice((DIA, "Ana", "10:00", 60))
+
+    assert ocupado.esta_livre(DIA, "Ana", "09:00", 60)
+    assert not ocupado.esta_livre(DIA, "Ana", "09:30", 60)   # termina dentro da reserva
+    assert not ocupado.esta_livre(DIA, "Ana", "09:15", 30)   # fora da grade
+    assert not ocupado.esta_livre(DIA, "Ana", "11:30", 60)   # passa do expediente
+
+
+def test_proxima_vaga_pula_as_reservas_que_atrapalham():
+    ocupado = indice((DIA, "Ana", "09:00", 60), (DIA, "Ana", "10:30", 30))
+
+    assert ocupado.proxima_vaga(DIA, "Ana", 30) == "10:00"
+    assert ocupado.proxima_vaga(DIA, "Ana", 60) == "11:00"
+    assert ocupado.proxima_vaga(DIA, "Ana", 90) is None
+    assert ocupado.proxima_vaga(DIA, "Ana", 30, depois_de="10:15") == "11:00"
+
+
+def test_marcar_e_desmarcar_atualizam_o_indice():
+    atual = indice()
+
+    atual.marcar(DIA, "Ana", "09:30", 60)
+    assert atual.livres(DIA, "Ana", 30) == ["09:00", "10:30", "11:00", "11:30"]
+    atual.desmarcar(DIA, "Ana", "09:30", 60)
+    assert len(atual.livres(DIA, "Ana", 30)) == 6
+
+
+def test_sobreposicoes_carregadas_nao_liberam_horarios_cobertos():
+    # Um agendamento longo que cobre um curto (ex.: carregado por salvar())
+    sobreposto = indice((DIA, "Ana", "09:00", 150), (DIA, "Ana", "09:30", 30))
+
+    assert sobreposto.livres(DIA, "Ana", 30) == ["11:30"]
+    assert not sobreposto.esta_livre(DIA, "Ana", "10:30", 30)
+    assert sobreposto.proxima_vaga(DIA, "Ana", 30) == "11:30"
+
+    # Cancelar o curto não libera nada; cancelar o longo libera o resto
+    sobreposto.desmarcar(DIA, "Ana", "09:30", 30)
+    assert sobreposto.livres(DIA, "Ana", 30) == ["11:30"]
+    sobreposto.marcar(DIA, "Ana", "09:00", 30)
+    sobreposto.desmarcar(DIA, "Ana", "09:00", 150)
+    assert sobreposto.livres(DIA, "Ana", 30) == ["09:30", "10:00", "10:30", "11:00", "11:30"]
@@ -0,0 +1,59 @@
+import historico
+from historico import HistoricoConversas
+
+
+def test_recentes_pagina_da_mais_nova_para_a_mais_antiga(tmp_path):
+    conversa = HistoricoConversas(tmp_path / "historico.jsonl")
+    for i in range(5):
+        conversa.adicionar("usuario", f"m{i}")
+
+    assert [m["conteudo"] for m in conversa.recentes(2)] == ["m4", "m3"]
+    assert [m["conteudo"] for m in conversa.recentes(2, deslocamento=2)] == ["m2", "m1"]
+    assert [m["conteudo"] for m in conversa.recentes(10, deslocamento=4)] == ["m0"]
+    assert conversa.recentes(2, deslocamento=5) == []
+
+
+def test_excluir_vale_depois_de_reabrir(tmp_path):
+    caminho = tmp_path / "historico.jsonl"
+    conversa = HistoricoConversas(caminho)
+    primeira = conversa.adicionar("usuario", "oi")
+    conversa.adicionar("assistente", "olá")
+
+    assert conversa.excluir(primeira["id"])
+    assert not conversa.excluir(primeira["id"])
+    assert not conversa.excluir("inexistente")
+
+    reaberta = HistoricoConversas(caminho)
+    assert reaberta.contar() == 1
+    assert [m["conteudo"] for m in reaberta.recentes(10)] == ["olá"]
+
+
+def test_linha_incompleta_no_fim_e_ignorada(tmp_path):
+    caminho = tmp_path / "historico.jsonl"
+    conversa = HistoricoConversas(caminho)
+    conversa.adicionar("usuario", "oi")
+    with open(caminho, "ab") as f:
+        f.write(b'{"id": "cortado", "tipo": "usu')
+
+    reaberta = HistoricoConversas(caminho)
+
+    assert reaberta.contar() == 1
+    assert [m["conteudo"] for m in reaberta.recentes(10)] == ["oi"]
+
+
+def test_compacta_quando_os_excluidos_passam_dos_ativos(tmp_path, monkeypatch):
+    monkeypatch.setattr(historico, "COMPACTAR_A_PARTIR_DE", 3)
+    caminho = tmp_path / "historico.jsonl"
+    conversa = HistoricoConversas(caminho)
+    itens = [conversa.adicionar("usuario", f"m{i}") for i in range(5)]
+
+    for item in itens[:2]:
+        conversa.excluir(item["id"])
+    assert len(caminho.read_bytes().splitlines()) == 7
+
+    # 3 excluídos contra 2 ativos: reescreve só com as linhas ativas
+    conversa.excluir(itens[2]["id"])
+    assert len(caminho.read_bytes().splitlines()) == 2
+    assert [m["conteudo"] for m in conversa.recentes(10)] == ["m4", "m3"]
+    assert conversa.excluir(itens[3]["id"])
+    assert [m["conteudo"] for m in HistoricoConversas(caminho).recentes(10)] == ["m4"]
@@ -0,0 +1,58 @@
+import io
+
+import pytest
+
+import intercambio
+from armazenamento import ArmazemAgendamentos
+from modelos import AgendamentoSalao, minutos
+
+CABECALHO = "id,data,profissional,horario,status,duracao,servico\n"
+VALIDACOES = [False] + ([True] if intercambio.pa is not None else [])
+
+
+def sobreposicoes(armazem):
+    """Pares de agendamentos confirmados do mesmo profissional e dia que se sobrepõem."""
+    por_profissional = {}
+    for ag in armazem.carregar():
+        if ag.status == "confirmado":
+            por_profissional.setdefault((ag.data, ag.profissional), []).append(ag)
+    pares = []
+    for agendamentos in por_profissional.values():
+        agendamentos.sort(key=lambda ag: minutos(ag.horario))
+        pares += [
+            (anterior.id, seguinte.id)
+            for anterior, seguinte in zip(agendamentos, agendamentos[1:])
+            if minutos(seguinte.horario) < minutos(anterior.horario) + anterior.duracao
+        ]
+    return pares
+
+
+@pytest.mark.parametrize("vetorizado", VALIDACOES)
+def test_importacao_rejeita_sobreposicao_com_agendamentos_existentes(tmp_path, vetorizado):
+    armazem = ArmazemAgendamentos(tmp_path / "salao.db")
+    assert armazem.reservar(AgendamentoSalao("x1", "2030-01-07", "Ana", "09:00", duracao=180))
+    assert armazem.reservar(AgendamentoSalao("y1", "2030-01-07", "Bruna", "15:00", duracao=60))
+    arquivo = io.BytesIO((
+        CABECALHO
+        + "x2,2030-01-07,Ana,10:00,confirmado,30,\n"     # 1: dentro de x1 (banco)
+        + "x3,2030-01-07,Ana,12:00,confirmado,60,\n"     # 2: livre
+        + "x4,2030-01-07,Ana,12:30,confirmado,30,\n"     # 3: dentro de x3 (mesmo arquivo)
+        + "x5,2030-01-07,Ana,10:00,cancelado,30,\n"      # 4: cancelado não ocupa
+        + "y1,2030-01-07,Bruna,09:00,confirmado,60,\n"   # 5: substitui y1 e libera 15:00
+        + "y2,2030-01-07,Bruna,15:00,confirmado,60,\n"   # 6: livre depois da substituição
+        + "z1,2030-01-07,Carla,10:00,confirmado,30,\n"   # 7: outro profissional
+    ).encode("utf-8"))
+
+    resultado = intercambio.importar(
+        intercambio.AGENDAMENTOS, arquivo, intercambio.gravar_agendamentos(armazem), "csv", vetorizado=vetorizado
+    )
+
+    assert (resultado.importados, resultado.rejeitados) == (5, 2)
+    assert resultado.erros == [(1, ["horario (conflito)"]), (3, ["horario (conflito)"])]
+    gravados = {ag.id: ag for ag in armazem.carregar()}
+    assert "x2" not in gravados and "x4" not in gravados
+    assert gravados["y1"].horario == "09:00"
+    assert sobreposicoes(armazem) == []
+    # A reserva normal continua enxergando o mesmo estado que a importação deixou
+    assert not armazem.reservar(AgendamentoSalao("n1", "2030-01-07", "Ana", "11:00", duracao=30))
+    assert armazem.reservar(AgendamentoSalao("n2", "2030-01-07", "Bruna", "10:00", duracao=30))